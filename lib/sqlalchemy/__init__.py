@@ -33,6 +33,7 @@ from .engine import make_url as make_url
 from .engine import MappingResult as MappingResult
 from .engine import MergedResult as MergedResult
 from .engine import NestedTransaction as NestedTransaction
+from .engine import PreparedExecution as PreparedExecution
 from .engine import Result as Result
 from .engine import result_tuple as result_tuple
 from .engine import ResultProxy as ResultProxy
@@ -4,9 +4,22 @@ from datetime import time as time_cls
 from datetime import date as date_cls
 import re
 
+from cpython.conversion cimport PyOS_double_to_string
+from cpython.datetime cimport date_new, datetime_new, import_datetime, time_new
+from cpython.float cimport PyFloat_AS_DOUBLE, PyFloat_CheckExact
+from cpython.mem cimport PyMem_Free
 from cpython.object cimport PyObject_Str
 from cpython.unicode cimport PyUnicode_AsASCIIString, PyUnicode_Check, PyUnicode_Decode
+from cpython.unicode cimport PyUnicode_CheckExact
 from libc.stdio cimport sscanf
+from libc.string cimport memset
+
+cdef extern from "Python.h":
+    bint PyUnicode_IS_ASCII(object o)
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t* size) except NULL
+    object PyUnicode_FromString(const char* u)
+
+import_datetime()
 
 
 def int_to_boolean(value):
@@ -29,34 +42,135 @@ cdef inline bytes to_bytes(object value, str type_name):
             "- value is not a string."
         ) from e
 
+# Fast paths for the ISO formats written by the SQLite DATE, DATETIME
+# and TIME types, as well as the common variants thereof.  Anything not
+# matched here is passed to fromisoformat(), so that the accepted formats
+# and the errors raised are the same as those of the pure Python version.
+
+cdef inline int _parse_digits(const char* s, int n):
+    cdef int i, result = 0
+    for i in range(n):
+        if s[i] < 48 or s[i] > 57:  # '0' .. '9'
+            return -1
+        result = result * 10 + (s[i] - 48)
+    return result
+
+cdef inline bint _parse_date(const char* s, int* parts):
+    if s[4] != 45 or s[7] != 45:  # '-'
+        return False
+    parts[0] = _parse_digits(s, 4)
+    parts[1] = _parse_digits(s + 5, 2)
+    parts[2] = _parse_digits(s + 8, 2)
+    return parts[0] >= 0 and parts[1] >= 0 and parts[2] >= 0
+
+cdef inline bint _parse_time(const char* s, Py_ssize_t size, int* parts):
+    if s[2] != 58 or s[5] != 58:  # ':'
+        return False
+    parts[0] = _parse_digits(s, 2)
+    parts[1] = _parse_digits(s + 3, 2)
+    parts[2] = _parse_digits(s + 6, 2)
+    if size == 8:
+        parts[3] = 0
+    elif s[8] != 46:  # '.'
+        return False
+    elif size == 12:
+        parts[3] = _parse_digits(s + 9, 3)
+        if parts[3] >= 0:
+            parts[3] *= 1000
+    elif size == 15:
+        parts[3] = _parse_digits(s + 9, 6)
+    else:
+        return False
+    return (
+        parts[0] >= 0 and parts[1] >= 0 and parts[2] >= 0 and parts[3] >= 0
+    )
+
 def str_to_datetime(value):
-    if value is not None:
-        value = datetime_cls.fromisoformat(value)
-    return value
+    cdef const char* s
+    cdef Py_ssize_t size
+    cdef int parts[7]
+    if value is None:
+        return None
+    memset(parts, 0, sizeof(parts))
+    if PyUnicode_CheckExact(value) and PyUnicode_IS_ASCII(value):
+        s = PyUnicode_AsUTF8AndSize(value, &size)
+        if (
+            (size == 19 or size == 23 or size == 26)
+            and (s[10] == 32 or s[10] == 84)  # ' ' or 'T'
+            and _parse_date(s, parts)
+            and _parse_time(s + 11, size - 11, parts + 3)
+        ):
+            try:
+                return datetime_new(
+                    parts[0], parts[1], parts[2],
+                    parts[3], parts[4], parts[5], parts[6], None
+                )
+            except ValueError:
+                pass
+    return datetime_cls.fromisoformat(value)
 
 def str_to_time(value):
-    if value is not None:
-        value = time_cls.fromisoformat(value)
-    return value
+    cdef const char* s
+    cdef Py_ssize_t size
+    cdef int parts[4]
+    if value is None:
+        return None
+    memset(parts, 0, sizeof(parts))
+    if PyUnicode_CheckExact(value) and PyUnicode_IS_ASCII(value):
+        s = PyUnicode_AsUTF8AndSize(value, &size)
+        if (size == 8 or size == 12 or size == 15) and _parse_time(
+            s, size, parts
+        ):
+            try:
+                return time_new(parts[0], parts[1], parts[2], parts[3], None)
+            except ValueError:
+                pass
+    return time_cls.fromisoformat(value)
 
 
 def str_to_date(value):
-    if value is not None:
-        value = date_cls.fromisoformat(value)
-    return value
+    cdef const char* s
+    cdef Py_ssize_t size
+    cdef int parts[3]
+    if value is None:
+        return None
+    memset(parts, 0, sizeof(parts))
+    if PyUnicode_CheckExact(value) and PyUnicode_IS_ASCII(value):
+        s = PyUnicode_AsUTF8AndSize(value, &size)
+        if size == 10 and _parse_date(s, parts):
+            try:
+                return date_new(parts[0], parts[1], parts[2])
+            except ValueError:
+                pass
+    return date_cls.fromisoformat(value)
 
 
 
 cdef class DecimalResultProcessor:
     cdef object type_
     cdef str format_
+    cdef int scale
 
-    def __cinit__(self, type_, format_):
+    def __cinit__(self, type_, format_, int scale=-1):
         self.type_ = type_
         self.format_ = format_
+        # when given, scale must be the precision used in format_; it
+        # allows floats to be formatted without going through str % float
+        self.scale = scale
 
     def process(self, object value):
+        cdef char* buf
+        cdef object formatted
         if value is None:
             return None
+        elif self.scale >= 0 and PyFloat_CheckExact(value):
+            buf = PyOS_double_to_string(
+                PyFloat_AS_DOUBLE(value), b'f', self.scale, 0, NULL
+            )
+            try:
+                formatted = PyUnicode_FromString(buf)
+            finally:
+                PyMem_Free(buf)
+            return self.type_(formatted)
         else:
             return self.type_(self.format_ % value)
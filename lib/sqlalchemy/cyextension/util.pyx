@@ -1,3 +1,4 @@
+cimport cython
 from collections.abc import Mapping
 
 from sqlalchemy import exc
@@ -83,3 +84,131 @@ cdef class cache_anon_map(dict):
         self._index += 1
         return val
 
+
+cdef object _NO_CACHE
+cdef object _STATIC_CACHE_KEY
+cdef object _ANON_NAME
+cdef object _CALL_GEN_CACHE_KEY
+cdef object _CACHE_IN_PLACE
+cdef object _PROPAGATE_ATTRS
+cdef object _dp_annotations_key
+cdef object _dp_clauseelement_list
+cdef object _dp_clauseelement_tuple
+cdef object _dp_memoized_select_entities
+cdef object _anonymous_label
+cdef object _cache_key_traversal_visitor
+cdef bint _cache_key_symbols_loaded = 0
+
+
+cdef _load_cache_key_symbols():
+    # cache_key.py and elements.py import this module by way of
+    # visitors.py, so their symbols are only available once those modules
+    # are fully imported
+    global _NO_CACHE, _STATIC_CACHE_KEY, _ANON_NAME, _CALL_GEN_CACHE_KEY
+    global _CACHE_IN_PLACE, _PROPAGATE_ATTRS, _dp_annotations_key
+    global _dp_clauseelement_list, _dp_clauseelement_tuple
+    global _dp_memoized_select_entities, _anonymous_label
+    global _cache_key_traversal_visitor, _cache_key_symbols_loaded
+
+    from sqlalchemy.sql import cache_key
+    from sqlalchemy.sql import elements
+    from sqlalchemy.sql.visitors import InternalTraversal
+
+    _NO_CACHE = cache_key.NO_CACHE
+    _STATIC_CACHE_KEY = cache_key.STATIC_CACHE_KEY
+    _ANON_NAME = cache_key.ANON_NAME
+    _CALL_GEN_CACHE_KEY = cache_key.CALL_GEN_CACHE_KEY
+    _CACHE_IN_PLACE = cache_key.CACHE_IN_PLACE
+    _PROPAGATE_ATTRS = cache_key.PROPAGATE_ATTRS
+    _dp_annotations_key = InternalTraversal.dp_annotations_key
+    _dp_clauseelement_list = InternalTraversal.dp_clauseelement_list
+    _dp_clauseelement_tuple = InternalTraversal.dp_clauseelement_tuple
+    _dp_memoized_select_entities = (
+        InternalTraversal.dp_memoized_select_entities
+    )
+    _anonymous_label = elements._anonymous_label
+    _cache_key_traversal_visitor = cache_key._cache_key_traversal_visitor
+    _cache_key_symbols_loaded = 1
+
+
+@cython.binding(True)
+def _gen_cache_key(self, anon_map, list bindparams):
+    cdef object cls = type(self)
+    cdef object dispatcher, attrname, obj, meth, sck, id_, found
+    cdef list result
+
+    if not _cache_key_symbols_loaded:
+        _load_cache_key_symbols()
+
+    id_, found = anon_map.get_anon(self)
+    if found:
+        return (id_, cls)
+
+    try:
+        dispatcher = cls.__dict__["_generated_cache_key_traversal"]
+    except KeyError:
+        dispatcher = cls._generate_cache_attrs()
+
+    if dispatcher is _NO_CACHE:
+        anon_map[_NO_CACHE] = True
+        return None
+
+    result = [id_, cls]
+
+    # see HasCacheKey._gen_cache_key() in sql/cache_key.py
+    for attrname, obj, meth in dispatcher(
+        self, _cache_key_traversal_visitor
+    ):
+        if obj is None:
+            continue
+
+        if meth is _STATIC_CACHE_KEY:
+            sck = obj._static_cache_key
+            if sck is _NO_CACHE:
+                anon_map[_NO_CACHE] = True
+                return None
+            result.append(attrname)
+            result.append(sck)
+        elif meth is _ANON_NAME:
+            if isinstance(obj, _anonymous_label):
+                obj = obj.apply_map(anon_map)
+            result.append(attrname)
+            result.append(obj)
+        elif meth is _CALL_GEN_CACHE_KEY:
+            result.append(attrname)
+            result.append(obj._gen_cache_key(anon_map, bindparams))
+        elif not obj:
+            continue
+        elif meth is _CACHE_IN_PLACE:
+            result.append(attrname)
+            result.append(obj)
+        elif meth is _PROPAGATE_ATTRS:
+            result.append(attrname)
+            result.append(obj["compile_state_plugin"])
+            result.append(
+                obj["plugin_subject"]._gen_cache_key(anon_map, bindparams)
+                if obj["plugin_subject"]
+                else None
+            )
+        elif meth is _dp_annotations_key:
+            if self._gen_static_annotations_cache_key:
+                result.extend(self._annotations_cache_key)
+            else:
+                result.extend(self._gen_annotations_cache_key(anon_map))
+        elif (
+            meth is _dp_clauseelement_list
+            or meth is _dp_clauseelement_tuple
+            or meth is _dp_memoized_select_entities
+        ):
+            result.append(attrname)
+            result.append(
+                tuple(
+                    [
+                        elem._gen_cache_key(anon_map, bindparams)
+                        for elem in obj
+                    ]
+                )
+            )
+        else:
+            result.extend(meth(attrname, obj, self, anon_map, bindparams))
+    return tuple(result)
@@ -461,6 +461,8 @@ class PGExecutionContext_asyncpg(PGExecutionContext):
             self.dialect._invalidate_schema_cache()
 
     def pre_exec(self):
+        super().pre_exec()
+
         if self.isddl:
             self.dialect._invalidate_schema_cache()
 
@@ -590,6 +592,38 @@ class AsyncAdapt_asyncpg_cursor:
             self._executemany(operation, seq_of_parameters)
         )
 
+    async def _copy_records(self, table_name, schema_name, columns, records):
+        adapt_connection = self._adapt_connection
+
+        async with adapt_connection._execute_mutex:
+            await adapt_connection._check_type_cache_invalidation(
+                self._invalidate_schema_cache_asof
+            )
+
+            if not adapt_connection._started:
+                await adapt_connection._start_transaction()
+
+            try:
+                status = await self._connection.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name,
+                )
+            except Exception as error:
+                self._handle_exception(error)
+            else:
+                reg = re.match(r"COPY (\d+)", status)
+                if reg:
+                    self.rowcount = int(reg.group(1))
+                else:
+                    self.rowcount = -1
+
+    def copy_records(self, table_name, schema_name, columns, records):
+        self._adapt_connection.await_(
+            self._copy_records(table_name, schema_name, columns, records)
+        )
+
     def setinputsizes(self, *inputsizes):
         raise NotImplementedError()
 
@@ -996,6 +1030,9 @@ class PGDialect_asyncpg(PGDialect):
     statement_compiler = PGCompiler_asyncpg
     preparer = PGIdentifierPreparer_asyncpg
 
+    # asyncpg always uses the binary format for COPY
+    _copy_insert_formats = ("binary",)
+
     colspecs = util.update_copy(
         PGDialect.colspecs,
         {
@@ -1106,6 +1143,15 @@ class PGDialect_asyncpg(PGDialect):
         util.coerce_kw_type(opts, "prepared_statement_cache_size", int)
         return ([], opts)
 
+    def _do_copy_insert(self, cursor, statement, parameters, context):
+        table = context.compiled.compile_state.statement.table
+        cursor.copy_records(
+            table.name,
+            context.root_connection.schema_for_object(table),
+            [col.name for col, _, _ in context._copy_insert_columns],
+            context._copy_insert_rows(parameters),
+        )
+
     def do_ping(self, dbapi_connection):
         dbapi_connection.ping()
         return True
@@ -50,6 +50,61 @@ The asyncio version of the dialect may also be specified explicitly using the
     dialect shares most of its behavior with the ``psycopg2`` dialect.
     Further documentation is available there.
 
+.. _postgresql_psycopg_pipeline:
+
+Pipeline Mode
+-------------
+
+The sync version of the ``psycopg`` dialect supports psycopg's `pipeline
+mode <https://www.psycopg.org/psycopg3/docs/advanced/pipeline.html>`_,
+which requires psycopg 3.1 or greater built against libpq 14 or greater.
+Within the block established by the :meth:`_engine.Connection.pipeline`
+method, INSERT, UPDATE and DELETE statements that don't use RETURNING are
+sent to the server without waiting for their results, which are received
+when the results of a later statement are needed, or when the block
+ends::
+
+    with engine.begin() as conn:
+        with conn.pipeline():
+            conn.execute(table_a.insert(), {"id": 1, "data": "a"})
+            conn.execute(table_b.insert(), {"id": 1, "a_id": 1})
+
+Statements that return rows, as well as UPDATE and DELETE statements
+whose row count is delivered on the returned :class:`_engine.CursorResult`,
+synchronize the pipeline when executed.  The ORM :class:`_orm.Session` may
+make use of pipeline mode for its flush process using the
+:paramref:`_orm.Session.pipeline_flush` parameter, which will pipeline the
+INSERT statements emitted for objects whose primary key values are known
+ahead of time.
+
+The :ref:`postgresql_copy_insert` feature can't be used inside of a
+pipeline.
+
+.. versionadded:: 2.0.19
+
+.. _postgresql_psycopg_prepare:
+
+Prepared Statements
+-------------------
+
+psycopg prepares a statement on the server once it has been executed a
+number of times on the same connection, which by default is five.
+Statements executed using a :class:`.PreparedExecution` object, as returned
+by the :meth:`_engine.Connection.prepare` method, are instead prepared on
+the server upon their first execution::
+
+    with engine.connect() as conn:
+        stmt = select(table).where(table.c.id == bindparam("id"))
+        prepared = conn.prepare(stmt)
+        for id_ in ids:
+            prepared.execute({"id": id_})
+
+.. versionadded:: 2.0.19
+
+.. seealso::
+
+    :ref:`engine_prepared_execution`
+
 """  # noqa
 from __future__ import annotations
 
@@ -61,10 +116,13 @@ from typing import TYPE_CHECKING
 from . import ranges
 from ._psycopg_common import _PGDialect_common_psycopg
 from ._psycopg_common import _PGExecutionContext_common_psycopg
+from .base import BYTEA
 from .base import INTERVAL
 from .base import PGCompiler
 from .base import PGIdentifierPreparer
 from .base import REGCONFIG
+from .base import TIME
+from .base import TIMESTAMP
 from .json import JSON
 from .json import JSONB
 from .json import JSONPathType
@@ -234,7 +292,22 @@ class _PsycopgMultiRange(ranges.AbstractMultiRangeImpl):
 
 
 class PGExecutionContext_psycopg(_PGExecutionContext_common_psycopg):
-    pass
+    def post_exec(self):
+        pipeline = self.root_connection._pipeline
+        if pipeline is not None and (
+            not self.is_crud or self.compiled.effective_returning
+        ):
+            # result rows are needed right away; receive the results of
+            # this and all previously pipelined statements.  DML without
+            # RETURNING is synchronized only if its rowcount is requested.
+            pipeline.sync()
+
+    @util.non_memoized_property
+    def rowcount(self):
+        pipeline = self.root_connection._pipeline
+        if pipeline is not None:
+            pipeline.sync()
+        return self.cursor.rowcount
 
 
 class PGCompiler_psycopg(PGCompiler):
@@ -249,6 +322,79 @@ def _log_notices(diagnostic):
     logger.info("%s: %s", diagnostic.severity, diagnostic.message_primary)
 
 
+# PostgreSQL type names which psycopg uses to write values in COPY binary
+# format, for column types whose Python values the corresponding psycopg
+# binary dumpers accept.  Classes are matched exactly, so that subclasses
+# with a different database type, such as CITEXT or ENUM, aren't mistaken
+# for their base type.
+_copy_binary_types = {
+    sqltypes.SmallInteger: "int2",
+    sqltypes.SMALLINT: "int2",
+    sqltypes.Integer: "int4",
+    sqltypes.INTEGER: "int4",
+    sqltypes.BigInteger: "int8",
+    sqltypes.BIGINT: "int8",
+    sqltypes.REAL: "float4",
+    sqltypes.Double: "float8",
+    sqltypes.DOUBLE: "float8",
+    sqltypes.DOUBLE_PRECISION: "float8",
+    sqltypes.String: "varchar",
+    sqltypes.VARCHAR: "varchar",
+    sqltypes.Unicode: "varchar",
+    sqltypes.Text: "text",
+    sqltypes.TEXT: "text",
+    sqltypes.UnicodeText: "text",
+    sqltypes.Boolean: "bool",
+    sqltypes.BOOLEAN: "bool",
+    sqltypes.Date: "date",
+    sqltypes.DATE: "date",
+    sqltypes.LargeBinary: "bytea",
+    BYTEA: "bytea",
+    sqltypes.Interval: "interval",
+    INTERVAL: "interval",
+    # psycopg Json / Jsonb wrappers, from the bind processors of _PGJSON
+    # and _PGJSONB
+    sqltypes.JSON: "json",
+    JSON: "json",
+    JSONB: "jsonb",
+}
+
+
+def _copy_binary_type(type_, dialect):
+    """Return the name of the type used to write values of the given
+    :class:`.TypeEngine` in COPY binary format, or None."""
+
+    while True:
+        if dialect.name in type_._variant_mapping:
+            type_ = type_._variant_mapping[dialect.name]
+
+        cls = type_.__class__
+        if cls in _copy_binary_types:
+            return _copy_binary_types[cls]
+        elif cls in (sqltypes.Float, sqltypes.FLOAT):
+            # FLOAT(p) is a real for a precision of 1 to 24
+            if type_.precision is not None and type_.precision <= 24:
+                return "float4"
+            return "float8"
+        elif cls in (
+            sqltypes.DateTime,
+            sqltypes.DATETIME,
+            sqltypes.TIMESTAMP,
+            TIMESTAMP,
+        ):
+            return "timestamptz" if type_.timezone else "timestamp"
+        elif cls in (sqltypes.Time, sqltypes.TIME, TIME):
+            return "timetz" if type_.timezone else "time"
+        elif isinstance(type_, sqltypes.TypeDecorator):
+            # TypeDecorator values are processed into values of the
+            # underlying type before they're written
+            type_ = type_.load_dialect_impl(dialect)
+        else:
+            # ENUM, ARRAY, DOMAIN, user-defined types etc.; also Numeric,
+            # as the binary numeric dumper accepts only Decimal values
+            return None
+
+
 class PGDialect_psycopg(_PGDialect_common_psycopg):
     driver = "psycopg"
 
@@ -264,6 +410,7 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
 
     _has_native_hstore = True
     _psycopg_adapters_map = None
+    _copy_insert_formats = ("text", "binary")
 
     colspecs = util.update_copy(
         _PGDialect_common_psycopg.colspecs,
@@ -304,6 +451,11 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
                     "psycopg version 3.0.2 or higher is required."
                 )
 
+            # pipeline mode requires psycopg 3.1 as well as libpq 14;
+            # it's not yet supported for asyncio
+            if self.psycopg_version >= (3, 1) and not self.is_async:
+                self.supports_pipeline = self.dbapi.Pipeline.is_supported()
+
             from psycopg.adapt import AdaptersMap
 
             self._psycopg_adapters_map = adapters_map = AdaptersMap(
@@ -335,6 +487,21 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
 
         return TypeInfo.fetch(connection.connection.driver_connection, name)
 
+    def do_pipeline(self, dbapi_connection):
+        return dbapi_connection.pipeline()
+
+    def do_execute(self, cursor, statement, parameters, context=None):
+        if (
+            context is not None
+            and not context._is_server_side
+            and context.execution_options.get("_sa_prepared_execution", False)
+        ):
+            # statements run via Connection.prepare() are prepared on the
+            # server right away, rather than after prepare_threshold
+            cursor.execute(statement, parameters, prepare=True)
+        else:
+            cursor.execute(statement, parameters)
+
     def initialize(self, connection):
         super().initialize(connection)
 
@@ -460,6 +627,21 @@ class PGDialect_psycopg(_PGDialect_common_psycopg):
 
         return on_connect
 
+    def _copy_insert_binary_types(self, columns):
+        # psycopg needs the type of each column in order to write rows
+        # in binary format
+        types = [_copy_binary_type(col.type, self) for col in columns]
+        if None in types:
+            return None
+        return types
+
+    def _do_copy_insert(self, cursor, statement, parameters, context):
+        with cursor.copy(statement) as copy:
+            if context._copy_insert_types is not None:
+                copy.set_types(context._copy_insert_types)
+            for row in context._copy_insert_rows(parameters):
+                copy.write_row(row)
+
     def is_disconnect(self, e, connection, cursor):
         if isinstance(e, self.dbapi.Error) and connection is not None:
             if connection.closed or connection.broken:
@@ -554,6 +736,16 @@ class AsyncAdapt_psycopg_cursor:
     def executemany(self, query, params_seq):
         return self.await_(self._cursor.executemany(query, params_seq))
 
+    async def _copy_rows(self, statement, rows, types):
+        async with self._cursor.copy(statement) as copy:
+            if types is not None:
+                copy.set_types(types)
+            for row in rows:
+                await copy.write_row(row)
+
+    def copy_rows(self, statement, rows, types=None):
+        self.await_(self._copy_rows(statement, rows, types))
+
     def __iter__(self):
         # TODO: try to avoid pop(0) on a list
         while self._rows:
@@ -720,6 +912,13 @@ class PGDialectAsync_psycopg(PGDialect_psycopg):
     def _do_autocommit(self, connection, value):
         connection.set_autocommit(value)
 
+    def _do_copy_insert(self, cursor, statement, parameters, context):
+        cursor.copy_rows(
+            statement,
+            context._copy_insert_rows(parameters),
+            context._copy_insert_types,
+        )
+
     def set_readonly(self, connection, value):
         connection.set_read_only(value)
 
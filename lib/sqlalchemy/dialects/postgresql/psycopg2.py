@@ -219,6 +219,13 @@ in addition to those not specific to DBAPIs:
   .. versionchanged:: 1.4  The ``max_row_buffer`` size can now be greater than
      1000, and the buffer will grow to that size.
 
+* ``max_buffer_bytes`` - when using ``stream_results``, an approximate
+  size in bytes for the row buffer; the number of rows fetched at a time is
+  adjusted based on the size of the rows fetched.  See
+  :paramref:`_engine.Connection.execution_options.max_buffer_bytes`.
+
+  .. versionadded:: 2.0.19
+
 .. _psycopg2_batch_mode:
 
 .. _psycopg2_executemany_mode:
@@ -309,6 +316,9 @@ is below::
     object to execute statements in such a way as to make
     use of the DBAPI ``.executemany()`` method.
 
+    :ref:`postgresql_copy_insert` - delivering large INSERT operations
+    using psycopg2's ``copy_expert()`` method
+
 
 .. _psycopg2_unicode:
 
@@ -471,6 +481,7 @@ which may be more performant.
 from __future__ import annotations
 
 import collections.abc as collections_abc
+import datetime
 import logging
 import re
 from typing import cast
@@ -547,6 +558,78 @@ class _Psycopg2DateTimeTZRange(_Psycopg2Range):
     _psycopg2_range_cls = "DateTimeTZRange"
 
 
+_copy_text_escapes = str.maketrans(
+    {"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+)
+
+
+def _copy_text_scalar(value):
+    if value is True:
+        return "t"
+    elif value is False:
+        return "f"
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    elif isinstance(value, datetime.timedelta):
+        return "%d days %d.%06d seconds" % (
+            value.days,
+            value.seconds,
+            value.microseconds,
+        )
+    else:
+        return str(value)
+
+
+def _copy_array_literal(value):
+    elements = []
+    for elem in value:
+        if elem is None:
+            elements.append("NULL")
+        elif isinstance(elem, (list, tuple)):
+            elements.append(_copy_array_literal(elem))
+        else:
+            elements.append(
+                '"%s"'
+                % _copy_text_scalar(elem)
+                .replace("\\", "\\\\")
+                .replace('"', '\\"')
+            )
+    return "{%s}" % ",".join(elements)
+
+
+def _copy_text_value(value):
+    """Render a processed parameter value in PostgreSQL COPY text format."""
+
+    if value is None:
+        return "\\N"
+    elif isinstance(value, (list, tuple)):
+        value = _copy_array_literal(value)
+    else:
+        value = _copy_text_scalar(value)
+    return value.translate(_copy_text_escapes)
+
+
+class _CopyTextStream:
+    """File-like object consumed by psycopg2's ``copy_expert()``, which
+    renders rows in COPY text format as they are read."""
+
+    def __init__(self, rows):
+        self._lines = (
+            "\t".join([_copy_text_value(value) for value in row]) + "\n"
+            for row in rows
+        )
+
+    def read(self, size=-1):
+        chunks = []
+        length = 0
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            if 0 < size <= length:
+                break
+        return "".join(chunks)
+
+
 class PGExecutionContext_psycopg2(_PGExecutionContext_common_psycopg):
     _psycopg2_fetched_rows = None
 
@@ -603,6 +686,7 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
     returns_native_bytes = False
 
     _has_native_hstore = True
+    _copy_insert_formats = ("text",)
 
     colspecs = util.update_copy(
         _PGDialect_common_psycopg.colspecs,
@@ -761,7 +845,9 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
             return None
 
     def do_executemany(self, cursor, statement, parameters, context=None):
-        if self.executemany_mode is EXECUTEMANY_VALUES_PLUS_BATCH:
+        if context is not None and context._copy_insert_format:
+            self._do_copy_insert(cursor, statement, parameters, context)
+        elif self.executemany_mode is EXECUTEMANY_VALUES_PLUS_BATCH:
             if self.executemany_batch_page_size:
                 kwargs = {"page_size": self.executemany_batch_page_size}
             else:
@@ -772,6 +858,11 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         else:
             cursor.executemany(statement, parameters)
 
+    def _do_copy_insert(self, cursor, statement, parameters, context):
+        cursor.copy_expert(
+            statement, _CopyTextStream(context._copy_insert_rows(parameters))
+        )
+
     def do_begin_twophase(self, connection, xid):
         connection.connection.tpc_begin(xid)
 
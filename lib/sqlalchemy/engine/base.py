@@ -15,6 +15,7 @@ import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Dict
 from typing import Iterable
 from typing import Iterator
 from typing import List
@@ -22,6 +23,7 @@ from typing import Mapping
 from typing import NoReturn
 from typing import Optional
 from typing import overload
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -34,6 +36,7 @@ from .interfaces import ExceptionContext
 from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .interfaces import IsolationLevel
+from .util import _ColumnarParameters
 from .util import _distill_params_20
 from .util import _distill_raw_params
 from .util import TransactionalContext
@@ -42,7 +45,9 @@ from .. import inspection
 from .. import log
 from .. import util
 from ..sql import compiler
+from ..sql import roles
 from ..sql import util as sql_util
+from ..sql.functions import FunctionElement
 
 if typing.TYPE_CHECKING:
     from . import CursorResult
@@ -55,6 +60,7 @@ if typing.TYPE_CHECKING:
     from .interfaces import _DBAPIAnyExecuteParams
     from .interfaces import _DBAPISingleExecuteParams
     from .interfaces import _ExecuteOptions
+    from .interfaces import CacheStats
     from .interfaces import CompiledCacheType
     from .interfaces import CoreExecuteOptionsParameter
     from .interfaces import Dialect
@@ -72,7 +78,7 @@ if typing.TYPE_CHECKING:
     from ..sql.ddl import ExecutableDDLElement
     from ..sql.ddl import SchemaDropper
     from ..sql.ddl import SchemaGenerator
-    from ..sql.functions import FunctionElement
+    from ..sql.elements import BindParameter
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
     from ..sql.schema import SchemaItem
@@ -116,6 +122,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     # used by sqlalchemy.engine.util.TransactionalContext
     _trans_context_manager: Optional[TransactionalContext] = None
 
+    # DBAPI-level pipeline object, present while within the block
+    # established by Connection.pipeline()
+    _pipeline: Optional[Any] = None
+
     # legacy as of 2.0, should be eventually deprecated and
     # removed.  was used in the "pre_ping" recipe that's been in the docs
     # a long time
@@ -243,6 +253,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
@@ -441,6 +452,30 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
             :ref:`engine_stream_results`
 
+        :param max_buffer_bytes: Available on: :class:`_engine.Connection`,
+          :class:`_sql.Executable`.  Sets an approximate budget, in bytes,
+          for the buffer of rows used when the
+          :paramref:`_engine.Connection.execution_options.stream_results`
+          execution option is used on a backend that supports server side
+          cursors.  Rather than growing the number of rows fetched on each
+          round trip by a fixed factor up to
+          :paramref:`_engine.Connection.execution_options.max_row_buffer`,
+          the size of each fetch is computed from the estimated in-memory
+          size of the rows most recently fetched, so that results with wide
+          rows fetch fewer rows at a time and results with narrow rows fetch
+          more.  When this option is used, the number of rows per fetch is
+          not limited unless
+          :paramref:`_engine.Connection.execution_options.max_row_buffer` is
+          also given.  The option has no effect when a fixed buffer size
+          is established using
+          :paramref:`_engine.Connection.execution_options.yield_per`.
+
+          .. versionadded:: 2.0.19
+
+          .. seealso::
+
+            :ref:`engine_stream_results_sr`
+
 
         :param yield_per: Available on: :class:`_engine.Connection`,
           :class:`_sql.Executable`.  Integer value applied which will
@@ -1034,6 +1069,69 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             and self._nested_transaction.is_active
         )
 
+    @contextlib.contextmanager
+    def pipeline(self) -> Iterator[Connection]:
+        """Return a context manager that executes statements in pipeline
+        mode, for those dialects which support it.
+
+        Within the block, statements whose results aren't needed right
+        away, such as an INSERT without RETURNING, are sent to the database
+        without waiting for the server to respond; the responses are
+        collected the next time a statement's result rows or row count are
+        needed, as well as at the end of the block.  Over a connection with
+        high network latency, this may greatly reduce the time taken by a
+        series of independent statements::
+
+            with engine.begin() as conn:
+                with conn.pipeline():
+                    for stmt in statements:
+                        conn.execute(stmt)
+
+        As errors for pipelined statements are only received when the
+        pipeline is synchronized, an error raised by a statement may be
+        reported by a later statement or at the end of the block.
+
+        For dialects that don't support pipeline mode, as indicated by the
+        :attr:`.Dialect.supports_pipeline` attribute, as well as when a
+        pipeline is already in progress for this :class:`_engine.Connection`,
+        the context manager has no effect.  Pipeline mode is currently
+        supported by the ``postgresql+psycopg`` dialect.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`postgresql_psycopg_pipeline`
+
+            :paramref:`_orm.Session.pipeline_flush`
+
+        """
+        if self._pipeline is not None or not self.dialect.supports_pipeline:
+            yield self
+            return
+
+        dbapi_connection = self.connection.dbapi_connection
+        assert dbapi_connection is not None
+
+        body_error: Optional[BaseException] = None
+        try:
+            with self.dialect.do_pipeline(dbapi_connection) as pipeline:
+                self._pipeline = pipeline
+                try:
+                    yield self
+                except BaseException as err:
+                    body_error = err
+                    raise
+                finally:
+                    self._pipeline = None
+        except BaseException as e:
+            if e is body_error:
+                raise
+            # raised when entering the pipeline, or when synchronizing it
+            # at the end of the block, which reports errors for statements
+            # that were pipelined
+            self._handle_dbapi_exception(e, None, None, None, None)
+
     def _is_autocommit_isolation(self) -> bool:
         opt_iso = self._execution_options.get("isolation_level", None)
         return bool(
@@ -1415,6 +1513,134 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 execution_options or NO_OPTIONS,
             )
 
+    def execute_columnar(
+        self,
+        statement: Executable,
+        columns: Mapping[Any, Any],
+        *,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+    ) -> CursorResult[Any]:
+        r"""Execute an INSERT statement using column-oriented parameters.
+
+        Rather than a list of dictionaries, one per row, parameters are
+        passed as a mapping of column name or :class:`_schema.Column` to
+        a sequence of values for that column::
+
+            with engine.begin() as conn:
+                conn.execute_columnar(
+                    user_table.insert(),
+                    {
+                        "id": [1, 2, 3],
+                        "name": ["spongebob", "sandy", "patrick"],
+                    },
+                )
+
+        Each sequence may also be an object that supports the Python
+        buffer protocol, such as an ``array.array`` or a NumPy array of a
+        numeric type, in which case its values are converted to Python
+        scalars in a single step.
+
+        The statement is executed in the same way as it would be by
+        :meth:`_engine.Connection.execute` given the equivalent list of
+        dictionaries, including the use of
+        :ref:`engine_insertmanyvalues` where supported.  However,
+        dictionaries are not created for each row; bind processors are
+        applied to each column as a whole and the rows are passed to the
+        DBAPI directly, as tuples for DBAPIs that use positional
+        parameters.  Statements that require Python-side column defaults
+        to be generated for each row fall back to building a dictionary
+        for each row.
+
+        :param statement: an :class:`_sql.Insert` construct.
+
+        :param columns: a mapping of column names or
+         :class:`_schema.Column` objects to sequences of values, all of the
+         same non-zero length.
+
+        :param execution_options: optional dictionary of execution options,
+         as would be passed to :meth:`_engine.Connection.execute`.
+
+        :return: a :class:`_engine.CursorResult`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`engine_columnar_insert`
+
+        """
+        if not isinstance(statement, roles.StatementRole):
+            raise exc.ObjectNotExecutableError(statement)
+        elif not statement.is_insert:
+            raise exc.ArgumentError(
+                "execute_columnar() requires an INSERT statement"
+            )
+
+        return self._execute_clauseelement(
+            statement,
+            _ColumnarParameters._from_mapping(columns),
+            execution_options or NO_OPTIONS,
+        )
+
+    def prepare(
+        self,
+        statement: Executable,
+        *,
+        execution_options: Optional[CoreExecuteOptionsParameter] = None,
+    ) -> PreparedExecution:
+        r"""Return a :class:`.PreparedExecution` that may be used to execute
+        the given statement repeatedly on this :class:`_engine.Connection`.
+
+        The work normally performed by :meth:`_engine.Connection.execute`
+        before the statement is sent to the driver, which includes
+        generating the statement's cache key, locating the compiled form of
+        the statement in the compiled cache and merging execution options,
+        is performed once when the :class:`.PreparedExecution` is first
+        executed for a particular set of parameter names, after which each
+        call to :meth:`.PreparedExecution.execute` proceeds directly to
+        the creation of the execution context and the invocation of the
+        DBAPI cursor::
+
+            stmt = select(user_table).where(user_table.c.id == bindparam("id"))
+
+            with engine.connect() as conn:
+                prepared = conn.prepare(stmt)
+                for id_ in ids:
+                    row = prepared.execute({"id": id_}).first()
+
+        For those drivers which support it, the statement is additionally
+        prepared on the server; see :class:`.PreparedExecution` for
+        details.
+
+        :param statement: The statement to be executed, as would be passed
+         to :meth:`_engine.Connection.execute`.
+
+        :param execution_options: optional dictionary of execution options,
+         which will be associated with each execution of the statement.
+         Execution options which are established on this
+         :class:`_engine.Connection` are taken into account at the time
+         this method is called.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`engine_prepared_execution`
+
+        """
+        if isinstance(statement, FunctionElement):
+            statement = statement.select()
+        elif (
+            not isinstance(statement, roles.StatementRole)
+            or not getattr(statement, "is_clause_element", False)
+            or isinstance(statement, roles.DDLRole)
+        ):
+            raise exc.ObjectNotExecutableError(statement)
+
+        return PreparedExecution(
+            self, statement, execution_options or NO_OPTIONS
+        )
+
     def _execute_function(
         self,
         func: FunctionElement[Any],
@@ -1590,9 +1816,12 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     ) -> CursorResult[Any]:
         """Execute a sql.ClauseElement object."""
 
-        execution_options = elem._execution_options.merge_with(
-            self._execution_options, execution_options
-        )
+        if execution_options or elem._execution_options:
+            execution_options = elem._execution_options.merge_with(
+                self._execution_options, execution_options
+            )
+        else:
+            execution_options = self._execution_options
 
         has_events = self._has_events or self.engine._has_events
         if has_events:
@@ -2443,6 +2672,169 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         visitorcallable(self.dialect, self, **kwargs).traverse_single(element)
 
 
+class PreparedExecution:
+    """A statement that's been prepared for repeated execution on a
+    :class:`_engine.Connection`.
+
+    The :class:`.PreparedExecution` is returned by the
+    :meth:`_engine.Connection.prepare` method.   It retains the compiled
+    form of its statement, along with the statement's bound parameters and
+    the merged execution options, so that each call to
+    :meth:`.PreparedExecution.execute` only needs to bind the given
+    parameters and invoke the DBAPI cursor.  As the compiled form of the
+    statement is retained, the :class:`_engine.CursorResultMetaData` that's
+    derived from the cursor description is reused as well.
+
+    When listeners for the :meth:`_events.ConnectionEvents.before_execute`
+    or :meth:`_events.ConnectionEvents.after_execute` events are established
+    on the :class:`_engine.Connection` or :class:`_engine.Engine`, each
+    execution proceeds in the same way as :meth:`_engine.Connection.execute`
+    so that these events are invoked.  Cursor-level events such as
+    :meth:`_events.ConnectionEvents.before_cursor_execute` are invoked in
+    all cases.
+
+    For the ``postgresql+psycopg`` dialect, statements executed by a
+    :class:`.PreparedExecution` are prepared on the server upon their first
+    execution, rather than after psycopg's ``prepare_threshold``.  The
+    ``postgresql+asyncpg`` dialect as well as the ``pysqlite`` driver
+    prepare and cache all statements in any case.
+
+    .. versionadded:: 2.0.19
+
+    .. seealso::
+
+        :ref:`engine_prepared_execution`
+
+    """
+
+    __slots__ = (
+        "connection",
+        "statement",
+        "_execution_options",
+        "_merged_execution_options",
+        "_compiled",
+    )
+
+    connection: Connection
+    """The :class:`_engine.Connection` on which the statement is executed."""
+
+    statement: Executable
+    """The statement being executed."""
+
+    _compiled: Dict[
+        Tuple[Tuple[str, ...], bool],
+        Tuple[Compiled, Optional[Sequence[BindParameter[Any]]], CacheStats],
+    ]
+
+    def __init__(
+        self,
+        connection: Connection,
+        statement: Executable,
+        execution_options: CoreExecuteOptionsParameter,
+    ):
+        self.connection = connection
+        self.statement = statement
+        self._execution_options = util.immutabledict(execution_options).union(
+            {"_sa_prepared_execution": True}
+        )
+        self._merged_execution_options = (
+            statement._execution_options.merge_with(
+                connection._execution_options, self._execution_options
+            )
+        )
+        self._compiled = {}
+
+    def execute(
+        self, parameters: Optional[_CoreAnyExecuteParams] = None
+    ) -> CursorResult[Any]:
+        """Execute the statement with the given parameters, returning
+        a :class:`_engine.CursorResult`.
+
+        :param parameters: parameters which will be bound into the
+         statement, as would be passed to
+         :meth:`_engine.Connection.execute`.
+
+        """
+        connection = self.connection
+        distilled_parameters = _distill_params_20(parameters)
+
+        if (connection._has_events or connection.engine._has_events) and (
+            connection.dispatch.before_execute
+            or connection.dispatch.after_execute
+        ):
+            return connection._execute_clauseelement(
+                self.statement, distilled_parameters, self._execution_options
+            )
+
+        if distilled_parameters:
+            keys = tuple(sorted(distilled_parameters[0]))
+            for_executemany = len(distilled_parameters) > 1
+        else:
+            keys = ()
+            for_executemany = False
+
+        dialect = connection.dialect
+        execution_options = self._merged_execution_options
+
+        try:
+            compiled_sql, extracted_params, cache_hit = self._compiled[
+                (keys, for_executemany)
+            ]
+        except KeyError:
+            compiled_sql, extracted_params, cache_hit = self._compile(
+                keys, for_executemany
+            )
+
+        return connection._execute_context(
+            dialect,
+            dialect.execution_ctx_cls._init_compiled,
+            compiled_sql,
+            distilled_parameters,
+            execution_options,
+            compiled_sql,
+            distilled_parameters,
+            self.statement,
+            extracted_params,
+            cache_hit=cache_hit,
+        )
+
+    def _compile(
+        self, keys: Tuple[str, ...], for_executemany: bool
+    ) -> Tuple[Compiled, Optional[Sequence[BindParameter[Any]]], CacheStats]:
+        connection = self.connection
+        statement = self.statement
+        dialect = connection.dialect
+        execution_options = self._merged_execution_options
+
+        compiled_cache: Optional[CompiledCacheType] = execution_options.get(
+            "compiled_cache", connection.engine._compiled_cache
+        )
+
+        compiled_sql, extracted_params, cache_hit = statement._compile_w_cache(
+            dialect=dialect,
+            compiled_cache=compiled_cache,
+            column_keys=list(keys),
+            for_executemany=for_executemany,
+            schema_translate_map=execution_options.get(
+                "schema_translate_map", None
+            ),
+            linting=dialect.compiler_linting | compiler.WARN_LINTING,
+        )
+
+        # the compiled form is retained from here on, so subsequent
+        # executions are reported as cache hits
+        self._compiled[(keys, for_executemany)] = (
+            compiled_sql,
+            extracted_params,
+            (
+                dialect.CACHE_HIT
+                if cache_hit is dialect.CACHE_MISS
+                else cache_hit
+            ),
+        )
+        return compiled_sql, extracted_params, cache_hit
+
+
 class ExceptionContextImpl(ExceptionContext):
     """Implement the :class:`.ExceptionContext` interface."""
 
@@ -2943,6 +3335,7 @@ class Engine(
         query_cache_size: int = 500,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
+        query_cache: Optional[CompiledCacheType] = None,
     ):
         self.pool = pool
         self.url = url
@@ -2951,7 +3344,9 @@ class Engine(
             self.logging_name = logging_name
         self.echo = echo
         self.hide_parameters = hide_parameters
-        if query_cache_size != 0:
+        if query_cache is not None:
+            self._compiled_cache = query_cache
+        elif query_cache_size != 0:
             self._compiled_cache = util.LRUCache(
                 query_cache_size, size_alert=self._lru_size_alert
             )
@@ -2983,8 +3378,9 @@ class Engine(
     def clear_compiled_cache(self) -> None:
         """Clear the compiled cache associated with the dialect.
 
-        This applies **only** to the built-in cache that is established
-        via the :paramref:`_engine.create_engine.query_cache_size` parameter.
+        This applies **only** to the cache that is established
+        via the :paramref:`_engine.create_engine.query_cache_size` or
+        :paramref:`_engine.create_engine.query_cache` parameters.
         It will not impact any dictionary caches that were passed via the
         :paramref:`.Connection.execution_options.query_cache` parameter.
 
@@ -2994,6 +3390,42 @@ class Engine(
         if self._compiled_cache:
             self._compiled_cache.clear()
 
+    def compiled_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Return usage statistics for the compiled cache of this
+        :class:`_engine.Engine`.
+
+        For the default cache, the dictionary returned includes the keys
+        ``"hits"`` and ``"misses"``, counting statements that were or were
+        not found in the cache, ``"evictions"``, counting statements that
+        were removed to make room for others, ``"size"``, the number of
+        statements currently in the cache, and ``"capacity"``, which is the
+        value of :paramref:`_sa.create_engine.query_cache_size`.  The
+        counters accumulate for the lifespan of the cache; a high ratio of
+        evictions or misses to hits once an application is warmed up
+        indicates that :paramref:`_sa.create_engine.query_cache_size` should
+        be increased.
+
+        When a cache object is passed using
+        :paramref:`_sa.create_engine.query_cache`, the value returned by its
+        ``stats()`` method is returned if it has one; otherwise, only
+        ``"size"`` is reported.  If caching is disabled, ``None`` is
+        returned.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`sql_caching`
+
+        """
+        cache = self._compiled_cache
+        if cache is None:
+            return None
+        elif hasattr(cache, "stats"):
+            return cache.stats()  # type: ignore
+        else:
+            return {"size": len(cache)}
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -35,6 +35,7 @@ if typing.TYPE_CHECKING:
     from .base import Engine
     from .interfaces import _ExecuteOptions
     from .interfaces import _ParamStyle
+    from .interfaces import CompiledCacheType
     from .interfaces import IsolationLevel
     from .url import URL
     from ..log import _EchoFlagType
@@ -42,6 +43,7 @@ if typing.TYPE_CHECKING:
     from ..pool import _CreatorWRecFnType
     from ..pool import _ResetStyleArgType
     from ..pool import Pool
+    from ..pool import PoolStatistics
     from ..util.typing import Literal
 
 
@@ -59,6 +61,7 @@ def create_engine(
     future: Literal[True],
     hide_parameters: bool = ...,
     implicit_returning: Literal[True] = ...,
+    in_clause_padding: bool = ...,
     insertmanyvalues_page_size: int = ...,
     isolation_level: IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
@@ -72,14 +75,21 @@ def create_engine(
     pool: Optional[Pool] = ...,
     poolclass: Optional[Type[Pool]] = ...,
     pool_logging_name: str = ...,
+    pool_max_concurrent_recycles: Optional[int] = ...,
+    pool_min_idle: int = ...,
     pool_pre_ping: bool = ...,
+    pool_pre_ping_idle_threshold: Optional[float] = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
+    pool_recycle_jitter: float = ...,
+    pool_replenish_interval: float = ...,
     pool_reset_on_return: Optional[_ResetStyleArgType] = ...,
+    pool_statistics: Union[bool, PoolStatistics] = ...,
     pool_timeout: float = ...,
     pool_use_lifo: bool = ...,
     plugins: List[str] = ...,
     query_cache_size: int = ...,
+    query_cache: Optional[CompiledCacheType] = ...,
     use_insertmanyvalues: bool = ...,
     **kwargs: Any,
 ) -> Engine:
@@ -275,6 +285,22 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
         :paramref:`.Table.implicit_returning` parameter.
 
 
+    :param in_clause_padding=False: if True, the lists of values passed to
+     "expanding" IN parameters, as produced by
+     :meth:`_sql.ColumnOperators.in_` and
+     :meth:`_sql.ColumnOperators.not_in`, are padded up to the next power of
+     two in length by repeating the last value.  This limits the number of
+     distinct SQL strings a statement may produce for different list sizes,
+     so that server-side plan caches and driver-level prepared statement
+     caches are reused, and the rendered SQL string for each size is
+     memoized so that it is not re-rendered on each execution.
+
+     .. versionadded:: 2.0.19
+
+     .. seealso::
+
+        :ref:`engine_in_clause_padding`
+
     :param insertmanyvalues_page_size: number of rows to format into an
      INSERT statement when the statement uses "insertmanyvalues" mode, which is
      a paged form of bulk insert that is used for many backends when using
@@ -427,6 +453,27 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
             :ref:`dbengine_logging` - further detail on how to configure
             logging.
 
+    :param pool_max_concurrent_recycles: optional limit on the number of
+        connections the pool will recycle due to
+        :paramref:`_sa.create_engine.pool_recycle` at the same time.  See
+        :paramref:`_pool.Pool.max_concurrent_recycles`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`pool_recycle_jitter`
+
+    :param pool_min_idle=0: number of idle connections that
+        :class:`.QueuePool` should keep open ahead of demand, maintained by a
+        background replenisher.  See :paramref:`.QueuePool.min_idle`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`pool_min_idle`
+
     :param pool_pre_ping: boolean, if True will enable the connection pool
         "pre-ping" feature that tests connections for liveness upon
         each checkout.
@@ -437,6 +484,17 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_idle_threshold: a number of seconds; when used
+        with :paramref:`_sa.create_engine.pool_pre_ping`, connections that
+        were returned to the pool more recently than this are checked out
+        without a "ping".  See :paramref:`_pool.Pool.pre_ping_idle_threshold`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_idle`
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -458,6 +516,23 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_setting_recycle`
 
+    :param pool_recycle_jitter=0: number of seconds by which the recycle
+        time of each connection is randomly shortened, so that connections
+        opened at the same time are not all recycled at once.  See
+        :paramref:`_pool.Pool.recycle_jitter`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`pool_recycle_jitter`
+
+    :param pool_replenish_interval=5: number of seconds between passes of
+        the background replenisher enabled by
+        :paramref:`_sa.create_engine.pool_min_idle`.
+
+        .. versionadded:: 2.0.19
+
     :param pool_reset_on_return='rollback': set the
         :paramref:`_pool.Pool.reset_on_return` parameter of the underlying
         :class:`_pool.Pool` object, which can be set to the values
@@ -467,6 +542,19 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
             :ref:`pool_reset_on_return`
 
+    :param pool_statistics=False: if True, the connection pool will
+        collect cumulative counters and timing histograms of checkout wait
+        time, checkout duration, connect time, pre-ping time, invalidations
+        and overflow connections, available from the
+        :attr:`_pool.Pool.statistics` attribute of :attr:`_engine.Engine.pool`.
+        See :paramref:`_pool.Pool.statistics`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`pool_statistics`
+
     :param pool_timeout=30: number of seconds to wait before giving
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`. This can be a float but is
@@ -495,6 +583,22 @@ def create_engine(url: Union[str, _url.URL], **kwargs: Any) -> Engine:
 
         .. versionadded:: 1.2.3
 
+    :param query_cache: a dictionary-like object to be used as the cache
+     for SQL compilation, in place of the ``LRUCache`` that's otherwise
+     created using :paramref:`_sa.create_engine.query_cache_size`, which is
+     ignored when this parameter is given.  The object needs to provide
+     ``get()``, ``__setitem__()``, ``__len__()`` and ``clear()``, and must
+     be safe to use from multiple threads if the engine is used
+     concurrently.  Entries are keyed on tuples that include the
+     :class:`.Dialect` in use, so a single cache object may be shared
+     among several engines.
+
+     .. versionadded:: 2.0.19
+
+     .. seealso::
+
+        :ref:`engine_compiled_cache_backend`
+
     :param query_cache_size: size of the cache used to cache the SQL string
      form of queries.  Set to zero to disable caching.
 
@@ -809,10 +913,16 @@ def create_pool_from_url(
     *,
     poolclass: Optional[Type[Pool]] = ...,
     logging_name: str = ...,
+    max_concurrent_recycles: Optional[int] = ...,
+    min_idle: int = ...,
     pre_ping: bool = ...,
+    pre_ping_idle_threshold: Optional[float] = ...,
     size: int = ...,
     recycle: int = ...,
+    recycle_jitter: float = ...,
+    replenish_interval: float = ...,
     reset_on_return: Optional[_ResetStyleArgType] = ...,
+    statistics: Union[bool, PoolStatistics] = ...,
     timeout: float = ...,
     use_lifo: bool = ...,
     **kwargs: Any,
@@ -852,9 +962,15 @@ _pool_translate_kwargs = immutabledict(
         "echo": "echo_pool",
         "timeout": "pool_timeout",
         "recycle": "pool_recycle",
+        "recycle_jitter": "pool_recycle_jitter",
+        "max_concurrent_recycles": "pool_max_concurrent_recycles",
         "events": "pool_events",  # deprecated
         "reset_on_return": "pool_reset_on_return",
         "pre_ping": "pool_pre_ping",
+        "pre_ping_idle_threshold": "pool_pre_ping_idle_threshold",
         "use_lifo": "pool_use_lifo",
+        "min_idle": "pool_min_idle",
+        "replenish_interval": "pool_replenish_interval",
+        "statistics": "pool_statistics",
     }
 )
@@ -12,14 +12,19 @@
 
 from __future__ import annotations
 
+import array
 import collections
 import functools
 import operator
+import sys
 import typing
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import ClassVar
+from typing import Deque
 from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Mapping
@@ -31,6 +36,7 @@ from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
 
+from .result import _merge_sort_key
 from .result import IteratorResult
 from .result import MergedResult
 from .result import Result
@@ -49,8 +55,10 @@ from ..sql.compiler import RM_NAME
 from ..sql.compiler import RM_OBJECTS
 from ..sql.compiler import RM_RENDERED_NAME
 from ..sql.compiler import RM_TYPE
+from ..sql.type_api import _BatchProcessor
 from ..sql.type_api import TypeEngine
 from ..util import compat
+from ..util import NONE_SET
 from ..util.typing import Literal
 from ..util.typing import Self
 
@@ -66,8 +74,11 @@ if typing.TYPE_CHECKING:
     from .result import _KeyMapRecType
     from .result import _KeyMapType
     from .result import _KeyType
+    from .result import _MergeOrderByType
     from .result import _ProcessorsType
     from .result import _TupleGetterType
+    from ..sql.compiler import SQLCompiler
+    from ..sql.type_api import _ResultBatchProcessorType
     from ..sql.type_api import _ResultProcessorType
 
 
@@ -138,6 +149,10 @@ _NonAmbigCursorKeyMapRecType = Tuple[
     str,
 ]
 
+# column index and batch processor for columns whose values are processed
+# for a group of rows at once
+_BatchProcessorsType = List[Tuple[int, "_ResultBatchProcessorType[Any]"]]
+
 
 class CursorResultMetaData(ResultMetaData):
     """Result metadata for DBAPI cursors."""
@@ -151,13 +166,17 @@ class CursorResultMetaData(ResultMetaData):
         "_translated_indexes",
         "_safe_for_cache",
         "_unpickled",
-        "_key_to_index"
+        "_key_to_index",
+        "_effective_processors",
+        "_batch_processors",
         # don't need _unique_filters support here for now.  Can be added
         # if a need arises.
     )
 
     _keymap: _CursorKeyMapType
     _processors: _ProcessorsType
+    _effective_processors: Optional[_ProcessorsType]
+    _batch_processors: Optional[_BatchProcessorsType]
     _keymap_by_result_column_idx: Optional[Dict[int, _KeyMapRecType]]
     _unpickled: bool
     _safe_for_cache: bool
@@ -189,6 +208,10 @@ class CursorResultMetaData(ResultMetaData):
         new_obj = self.__class__.__new__(self.__class__)
         new_obj._unpickled = unpickled
         new_obj._processors = processors
+        (
+            new_obj._effective_processors,
+            new_obj._batch_processors,
+        ) = _effective_processors_for(processors)
         new_obj._keys = keys
         new_obj._keymap = keymap
         new_obj._tuplefilter = tuplefilter
@@ -303,6 +326,23 @@ class CursorResultMetaData(ResultMetaData):
 
         assert invoked_statement is not None
 
+        compiled_raw_columns = getattr(compiled_statement, "_raw_columns", ())
+        invoked_raw_columns = getattr(invoked_statement, "_raw_columns", ())
+        if (
+            compiled_raw_columns
+            and len(compiled_raw_columns) == len(invoked_raw_columns)
+            and all(
+                compiled_col is invoked_col
+                for compiled_col, invoked_col in zip(
+                    compiled_raw_columns, invoked_raw_columns
+                )
+            )
+        ):
+            # the new statement selects from the same column and table
+            # objects as the cached one, such as for a new select() against
+            # the same Table, so the keymap is already correct
+            return self
+
         # this is the most common path for Core statements when
         # caching is used.  In ORM use, this codepath is not really used
         # as the _result_disable_adapt_to_context execution option is
@@ -321,18 +361,20 @@ class CursorResultMetaData(ResultMetaData):
                 for metadata_entry in self._keymap.values()
             }
 
+        keymap = self._keymap
+        new_keys = {
+            new: keymap_by_position[idx]
+            for idx, new in enumerate(invoked_statement._all_selected_columns)
+            if idx in keymap_by_position
+            and keymap.get(new) is not keymap_by_position[idx]
+        }
+
+        if not new_keys:
+            return self
+
         assert not self._tuplefilter
         return self._make_new_metadata(
-            keymap=compat.dict_union(
-                self._keymap,
-                {
-                    new: keymap_by_position[idx]
-                    for idx, new in enumerate(
-                        invoked_statement._all_selected_columns
-                    )
-                    if idx in keymap_by_position
-                },
-            ),
+            keymap=compat.dict_union(keymap, new_keys),
             unpickled=self._unpickled,
             processors=self._processors,
             tuplefilter=None,
@@ -352,7 +394,7 @@ class CursorResultMetaData(ResultMetaData):
         self._translated_indexes = None
         self._safe_for_cache = self._unpickled = False
 
-        if context.result_column_struct:
+        if context.compiled and context.result_column_struct:
             (
                 result_columns,
                 cols_are_ordered,
@@ -388,6 +430,10 @@ class CursorResultMetaData(ResultMetaData):
         self._processors = [
             metadata_entry[MD_PROCESSOR] for metadata_entry in raw
         ]
+        (
+            self._effective_processors,
+            self._batch_processors,
+        ) = _effective_processors_for(self._processors)
 
         # this is used when using this ResultMetaData in a Core-only cache
         # retrieval context.  it's initialized on first cache retrieval
@@ -901,6 +947,7 @@ class CursorResultMetaData(ResultMetaData):
 
     def __setstate__(self, state):
         self._processors = [None for _ in range(len(state["_keys"]))]
+        self._effective_processors = self._batch_processors = None
         self._keymap = state["_keymap"]
         self._keymap_by_result_column_idx = None
         self._key_to_index = self._make_key_to_index(self._keymap, MD_INDEX)
@@ -945,6 +992,22 @@ class ResultFetchStrategy:
     ) -> None:
         return
 
+    def batch_process(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: Optional[DBAPICursor],
+        batch_processors: _BatchProcessorsType,
+    ) -> None:
+        """Apply the given batch processors to each group of rows
+        fetched from here on.
+
+        Called when the :class:`.CursorResult` is set up, if any of its
+        columns are processed in batches.  The strategy may replace itself
+        on the result, as is the case for :meth:`.yield_per`.
+
+        """
+        return
+
     def fetchone(
         self,
         result: CursorResult[Any],
@@ -1094,6 +1157,16 @@ class CursorFetchStrategy(ResultFetchStrategy):
             growth_factor=0,
         )
 
+    def batch_process(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: Optional[DBAPICursor],
+        batch_processors: _BatchProcessorsType,
+    ) -> None:
+        result.cursor_strategy = _BatchProcessingCursorFetchStrategy(
+            batch_processors
+        )
+
     def fetchone(
         self,
         result: CursorResult[Any],
@@ -1142,6 +1215,71 @@ class CursorFetchStrategy(ResultFetchStrategy):
 _DEFAULT_FETCH = CursorFetchStrategy()
 
 
+class _BatchProcessingCursorFetchStrategy(CursorFetchStrategy):
+    """A :class:`.CursorFetchStrategy` that applies batch processors to
+    the rows of each fetch from the DBAPI cursor.
+
+    As the cursor is not buffered, this is each single row for
+    ``fetchone()``.
+
+    """
+
+    __slots__ = ("_batch_processors",)
+
+    def __init__(self, batch_processors: _BatchProcessorsType):
+        self._batch_processors = batch_processors
+
+    def yield_per(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: Optional[DBAPICursor],
+        num: int,
+    ) -> None:
+        super().yield_per(result, dbapi_cursor, num)
+        result.cursor_strategy.batch_process(
+            result, dbapi_cursor, self._batch_processors
+        )
+
+    def batch_process(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: Optional[DBAPICursor],
+        batch_processors: _BatchProcessorsType,
+    ) -> None:
+        self._batch_processors = batch_processors
+
+    def fetchone(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: DBAPICursor,
+        hard_close: bool = False,
+    ) -> Any:
+        row = super().fetchone(result, dbapi_cursor, hard_close)
+        if row is not None:
+            row = _apply_batch_processors(self._batch_processors, [row])[0]
+        return row
+
+    def fetchmany(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: DBAPICursor,
+        size: Optional[int] = None,
+    ) -> Any:
+        return _apply_batch_processors(
+            self._batch_processors,
+            super().fetchmany(result, dbapi_cursor, size),
+        )
+
+    def fetchall(
+        self,
+        result: CursorResult[Any],
+        dbapi_cursor: DBAPICursor,
+    ) -> Any:
+        return _apply_batch_processors(
+            self._batch_processors, super().fetchall(result, dbapi_cursor)
+        )
+
+
 class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
     """A cursor fetch strategy with row buffering behavior.
 
@@ -1165,12 +1303,34 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
 
     .. versionadded:: 1.4 ``max_row_buffer`` may now exceed 1000 rows.
 
+    When the ``max_buffer_bytes`` execution option is present, the number
+    of rows to fetch on each round trip is instead derived from an estimate
+    of the in-memory size of the rows last fetched, so that the buffer
+    stays within roughly the given number of bytes; the buffer still starts
+    small and grows by the growth factor, but is not limited to 1000 rows
+    unless ``max_row_buffer`` is given as well::
+
+        with psycopg2_engine.connect() as conn:
+
+            result = conn.execution_options(
+                stream_results=True, max_buffer_bytes=16 * 1024 * 1024
+                ).execute(text("select * from table"))
+
+    .. versionadded:: 2.0.19 Added ``max_buffer_bytes``.
+
     .. seealso::
 
         :ref:`psycopg2_execution_options`
     """
 
-    __slots__ = ("_max_row_buffer", "_rowbuffer", "_bufsize", "_growth_factor")
+    __slots__ = (
+        "_max_row_buffer",
+        "_max_buffer_bytes",
+        "_rowbuffer",
+        "_bufsize",
+        "_growth_factor",
+        "_batch_processors",
+    )
 
     def __init__(
         self,
@@ -1179,7 +1339,17 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         growth_factor=5,
         initial_buffer=None,
     ):
-        self._max_row_buffer = execution_options.get("max_row_buffer", 1000)
+        self._max_buffer_bytes = execution_options.get(
+            "max_buffer_bytes", None
+        )
+        if self._max_buffer_bytes is not None:
+            self._max_row_buffer = execution_options.get(
+                "max_row_buffer", sys.maxsize
+            )
+        else:
+            self._max_row_buffer = execution_options.get(
+                "max_row_buffer", 1000
+            )
 
         if initial_buffer is not None:
             self._rowbuffer = initial_buffer
@@ -1192,6 +1362,8 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
         else:
             self._bufsize = self._max_row_buffer
 
+        self._batch_processors = None
+
     @classmethod
     def create(cls, result):
         return BufferedRowCursorFetchStrategy(
@@ -1213,16 +1385,37 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
 
         if not new_rows:
             return
+        if self._batch_processors:
+            new_rows = _apply_batch_processors(
+                self._batch_processors, new_rows
+            )
         self._rowbuffer = collections.deque(new_rows)
-        if self._growth_factor and size < self._max_row_buffer:
+        if self._max_buffer_bytes is not None:
+            budget = max(
+                1, self._max_buffer_bytes // _estimate_row_bytes(new_rows)
+            )
+            if self._growth_factor:
+                budget = min(budget, size * self._growth_factor)
+            self._bufsize = min(self._max_row_buffer, budget)
+        elif self._growth_factor and size < self._max_row_buffer:
             self._bufsize = min(
                 self._max_row_buffer, size * self._growth_factor
             )
 
     def yield_per(self, result, dbapi_cursor, num):
         self._growth_factor = 0
+        self._max_buffer_bytes = None
         self._max_row_buffer = self._bufsize = num
 
+    def batch_process(self, result, dbapi_cursor, batch_processors):
+        self._batch_processors = batch_processors
+        if self._rowbuffer:
+            self._rowbuffer = collections.deque(
+                _apply_batch_processors(
+                    batch_processors, list(self._rowbuffer)
+                )
+            )
+
     def soft_close(self, result, dbapi_cursor):
         self._rowbuffer.clear()
         super().soft_close(result, dbapi_cursor)
@@ -1257,6 +1450,10 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
                 if not new:
                     result._soft_close()
                 else:
+                    if self._batch_processors:
+                        new = _apply_batch_processors(
+                            self._batch_processors, new
+                        )
                     buf.extend(new)
 
         result = buf[0:size]
@@ -1265,7 +1462,10 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
 
     def fetchall(self, result, dbapi_cursor):
         try:
-            ret = list(self._rowbuffer) + list(dbapi_cursor.fetchall())
+            new = dbapi_cursor.fetchall()
+            if self._batch_processors:
+                new = _apply_batch_processors(self._batch_processors, new)
+            ret = list(self._rowbuffer) + list(new)
             self._rowbuffer.clear()
             result._soft_close()
             return ret
@@ -1273,6 +1473,21 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             self.handle_exception(result, dbapi_cursor, e)
 
 
+def _estimate_row_bytes(rows: Sequence[Any]) -> int:
+    """Estimate the in-memory size of a single row, using up to ten rows
+    sampled across the given sequence.
+
+    Only the rows and their immediate values are measured; the contents of
+    collections such as deserialized JSON are not traversed.
+
+    """
+    sample = rows[:: max(1, len(rows) // 10)]
+    total = 0
+    for row in sample:
+        total += sys.getsizeof(row) + sum(map(sys.getsizeof, row))
+    return max(1, total // len(sample))
+
+
 class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
     """A cursor strategy that buffers rows fully upon creation.
 
@@ -1296,6 +1511,11 @@ class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
     def yield_per(self, result, dbapi_cursor, num):
         pass
 
+    def batch_process(self, result, dbapi_cursor, batch_processors):
+        self._rowbuffer = collections.deque(
+            _apply_batch_processors(batch_processors, list(self._rowbuffer))
+        )
+
     def soft_close(self, result, dbapi_cursor):
         self._rowbuffer.clear()
         super().soft_close(result, dbapi_cursor)
@@ -1329,10 +1549,75 @@ class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
         return ret
 
 
+class _SortKeyRecordingFetchStrategy(ResultFetchStrategy):
+    """Wraps the fetch strategy of a :class:`.CursorResult`, recording a
+    sort key for each raw row as it is fetched.
+
+    Used to merge results that are produced from cursor rows, such as
+    ORM results, in the order of the cursor rows; see
+    :meth:`.CursorResult._record_sort_keys`.
+
+    """
+
+    __slots__ = ("_strategy", "_key", "keys")
+
+    def __init__(
+        self, strategy: ResultFetchStrategy, key: Callable[[Any], Any]
+    ):
+        self._strategy = strategy
+        self._key = key
+        self.keys: Deque[Any] = collections.deque()
+
+    @property
+    def alternate_cursor_description(  # type: ignore[override]
+        self,
+    ) -> Optional[_DBAPICursorDescription]:
+        return self._strategy.alternate_cursor_description
+
+    def soft_close(self, result, dbapi_cursor):
+        self._strategy.soft_close(result, dbapi_cursor)
+
+    def hard_close(self, result, dbapi_cursor):
+        self._strategy.hard_close(result, dbapi_cursor)
+
+    def handle_exception(self, result, dbapi_cursor, err):
+        self._strategy.handle_exception(result, dbapi_cursor, err)
+
+    def yield_per(self, result, dbapi_cursor, num):
+        self._strategy.yield_per(result, dbapi_cursor, num)
+        # the wrapped strategy may have replaced itself on the result
+        if result.cursor_strategy is not self:
+            self._strategy = result.cursor_strategy
+            result.cursor_strategy = self
+
+    def batch_process(self, result, dbapi_cursor, batch_processors):
+        self._strategy.batch_process(result, dbapi_cursor, batch_processors)
+        if result.cursor_strategy is not self:
+            self._strategy = result.cursor_strategy
+            result.cursor_strategy = self
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        row = self._strategy.fetchone(result, dbapi_cursor, hard_close)
+        if row is not None:
+            self.keys.append(self._key(row))
+        return row
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        rows = self._strategy.fetchmany(result, dbapi_cursor, size)
+        self.keys.extend(map(self._key, rows))
+        return rows
+
+    def fetchall(self, result, dbapi_cursor):
+        rows = self._strategy.fetchall(result, dbapi_cursor)
+        self.keys.extend(map(self._key, rows))
+        return rows
+
+
 class _NoResultMetaData(ResultMetaData):
     __slots__ = ()
 
     returns_rows = False
+    _batch_processors = None
 
     def _we_dont_return_rows(self, err=None):
         raise exc.ResourceClosedError(
@@ -1369,6 +1654,77 @@ class _NoResultMetaData(ResultMetaData):
 _NO_RESULT_METADATA = _NoResultMetaData()
 
 
+def _effective_processors_for(
+    processors: _ProcessorsType,
+) -> Tuple[Optional[_ProcessorsType], Optional[_BatchProcessorsType]]:
+    """Return the processors to be applied to each row, or None if none of
+    them do anything, along with those to be applied to each group of rows
+    fetched from the cursor.
+
+    The result is stored on :class:`.CursorResultMetaData` so that it isn't
+    computed again for each result.
+
+    """
+    if not processors or NONE_SET.issuperset(processors):
+        return None, None
+
+    batch_processors = [
+        (idx, proc.process_batch)
+        for idx, proc in enumerate(processors)
+        if isinstance(proc, _BatchProcessor)
+    ]
+    if not batch_processors:
+        return processors, None
+
+    # columns that are processed in batches aren't processed again
+    # for each row
+    row_processors = [
+        None if isinstance(proc, _BatchProcessor) else proc
+        for proc in processors
+    ]
+    if NONE_SET.issuperset(row_processors):
+        return None, batch_processors
+    else:
+        return row_processors, batch_processors
+
+
+def _apply_batch_processors(
+    batch_processors: _BatchProcessorsType, rows: List[Any]
+) -> List[Any]:
+    """Apply batch processors to a group of rows fetched from the cursor."""
+
+    if not rows:
+        return rows
+
+    columns = list(zip(*rows))
+    for idx, process_batch in batch_processors:
+        columns[idx] = process_batch(columns[idx])
+    return list(zip(*columns))
+
+
+# number of distinct cursor.description structures for which result
+# metadata is cached on a single compiled object
+_MAX_METADATA_BY_DESCRIPTION = 10
+
+# number of rows in each batch delivered by CursorResult.columns_batch()
+# when no size or yield_per is given
+_DEFAULT_COLUMNS_BATCH_SIZE = 1000
+
+
+def _description_fingerprint(
+    context: DefaultExecutionContext,
+    cursor_description: _DBAPICursorDescription,
+) -> Tuple[Any, ...]:
+    translate_colname = context._translate_colname
+    if translate_colname:
+        return tuple(
+            (rec[0], rec[1], translate_colname(rec[0]))
+            for rec in cursor_description
+        )
+    else:
+        return tuple((rec[0], rec[1]) for rec in cursor_description)
+
+
 def null_dml_result() -> IteratorResult[Any]:
     it: IteratorResult[Any] = IteratorResult(_NoResultMetaData(), iter([]))
     it._soft_close()
@@ -1438,6 +1794,11 @@ class CursorResult(Result[_T]):
 
             metadata = self._init_metadata(context, cursor_description)
 
+            if metadata._batch_processors:
+                cursor_strategy.batch_process(
+                    self, self.cursor, metadata._batch_processors
+                )
+
             _make_row = functools.partial(
                 Row,
                 metadata,
@@ -1485,9 +1846,9 @@ class CursorResult(Result[_T]):
             if compiled._cached_metadata:
                 metadata = compiled._cached_metadata
             else:
-                metadata = CursorResultMetaData(self, cursor_description)
-                if metadata._safe_for_cache:
-                    compiled._cached_metadata = metadata
+                metadata = self._metadata_for_description(
+                    context, compiled, cursor_description
+                )
 
             # result rewrite/ adapt step.  this is to suit the case
             # when we are invoked against a cached Compiled object, we want
@@ -1525,6 +1886,43 @@ class CursorResult(Result[_T]):
             )
         return metadata
 
+    def _metadata_for_description(
+        self,
+        context: DefaultExecutionContext,
+        compiled: SQLCompiler,
+        cursor_description: _DBAPICursorDescription,
+    ) -> CursorResultMetaData:
+        """Return a :class:`.CursorResultMetaData` for a compiled statement
+        that doesn't yet have positionally cached metadata.
+
+        Metadata that has to be matched to cursor.description by name, as
+        is the case for a textual "SELECT *", is cached on the compiled
+        object keyed on the names and type codes in the description, so
+        that executions which return the same columns don't have to
+        build it again.
+
+        """
+        by_description = compiled._cached_metadata_by_description
+        if by_description:
+            try:
+                return by_description[
+                    _description_fingerprint(context, cursor_description)
+                ]
+            except KeyError:
+                pass
+
+        metadata = CursorResultMetaData(self, cursor_description)
+        if metadata._safe_for_cache:
+            compiled._cached_metadata = metadata
+        else:
+            if by_description is None:
+                by_description = compiled._cached_metadata_by_description = {}
+            if len(by_description) < _MAX_METADATA_BY_DESCRIPTION:
+                by_description[
+                    _description_fingerprint(context, cursor_description)
+                ] = metadata
+        return metadata
+
     def _soft_close(self, hard=False):
         """Soft close this :class:`_engine.CursorResult`.
 
@@ -2086,6 +2484,144 @@ class CursorResult(Result[_T]):
         """
         return self.context.isinsert
 
+    def columns_batch(
+        self, size: Optional[int] = None, *, arrays: bool = False
+    ) -> Iterator[Dict[str, Sequence[Any]]]:
+        """Iterate through batches of rows delivered in column-oriented form.
+
+        Each batch is a dictionary which is keyed to the names that would
+        be present in :meth:`_engine.CursorResult.keys`, where each value is
+        a list of the values for that column, in row order.  No
+        :class:`.Row` objects are created; the result processor of each
+        column, such as that of a :class:`.TypeDecorator` or of date types
+        for SQLite, is still invoked for each value, but in a single pass
+        over the values of that column, without per-row dispatch.  This is
+        intended for the extraction of very large numbers
+        of rows, for example to feed analytic libraries, where the per-row
+        overhead of :class:`.Row` construction dominates::
+
+            with engine.connect() as conn:
+                result = conn.execution_options(yield_per=10000).execute(
+                    select(table.c.id, table.c.value)
+                )
+                for batch in result.columns_batch():
+                    process(batch["id"], batch["value"])
+
+        The result object is automatically closed when the iterator is
+        fully consumed.  Each batch makes use of a single
+        ``cursor.fetchmany()`` call; when combined with the
+        :paramref:`_engine.Connection.execution_options.yield_per` or
+        :paramref:`_engine.Connection.execution_options.stream_results`
+        options, rows are fetched from the server-side cursor in buffered
+        chunks as the batches are consumed.
+
+        As the batches are keyed on column name, a result that includes more
+        than one column with the same name should make use of labels in order
+        to have all columns represented.  The
+        :meth:`_engine.Result.unique` filter is not supported.
+
+        .. versionadded:: 2.0.19
+
+        :param size: indicate the maximum number of rows to be present in
+         each batch.  If None, makes use of the value set by
+         :meth:`_engine.Result.yield_per` or the
+         :paramref:`_engine.Connection.execution_options.yield_per`
+         execution option, and otherwise defaults to 1000.
+
+        :param arrays: if True, a column whose values are all Python
+         ``int`` or all Python ``float`` values is delivered as an
+         ``array.array`` of typecode ``"q"`` or ``"d"`` respectively, rather
+         than a list.  These objects support the buffer protocol and may be
+         converted without copying using functions such as
+         ``numpy.frombuffer()`` or ``pyarrow.py_buffer()``.  Columns with
+         NULL values, with a mix of datatypes, or of other datatypes remain
+         as lists.
+
+        .. seealso::
+
+            :meth:`_engine.CursorResult.to_columnar`
+
+            :ref:`engine_stream_results`
+
+        """
+        transpose = self._columnar_transposer(arrays)
+
+        if size is None:
+            size = self._yield_per or _DEFAULT_COLUMNS_BATCH_SIZE
+
+        while True:
+            rows = self._fetchmany_impl(size)
+            if not rows:
+                break
+            yield transpose(rows)
+
+    def to_columnar(self, *, arrays: bool = False) -> Dict[str, Sequence[Any]]:
+        """Return all remaining rows in column-oriented form.
+
+        The return value is a single dictionary in the same form as that of
+        each batch yielded by :meth:`_engine.CursorResult.columns_batch`,
+        where columns are present with empty lists if no rows remain.  The
+        result object is closed afterwards.
+
+        .. versionadded:: 2.0.19
+
+        :param arrays: if True, deliver all-``int`` or all-``float`` columns
+         as ``array.array`` objects; see
+         :paramref:`_engine.CursorResult.columns_batch.arrays`.
+
+        """
+        transpose = self._columnar_transposer(arrays)
+        return transpose(self._fetchall_impl())
+
+    def _columnar_transposer(
+        self, arrays: bool
+    ) -> Callable[[List[Any]], Dict[str, Sequence[Any]]]:
+        if self._unique_filter_state:
+            raise exc.InvalidRequestError(
+                "Can't deliver column-oriented results when the unique() "
+                "filter is in use"
+            )
+
+        metadata = self._metadata
+        keys = list(metadata.keys)
+        processors = metadata._effective_processors
+        tf = metadata._tuplefilter
+
+        if processors is None:
+            processors = [None] * len(keys)
+        elif tf:
+            processors = tf(processors)
+
+        row_filter: Optional[Callable[[Any], Any]]
+        if tf:
+            row_filter = tf
+        elif self.context._num_sentinel_cols:
+            # sentinel columns are delivered at the end of each raw row
+            row_filter = operator.itemgetter(
+                slice(-self.context._num_sentinel_cols)
+            )
+        else:
+            row_filter = None
+
+        def transpose(rows: List[Any]) -> Dict[str, Sequence[Any]]:
+            if row_filter:
+                rows = [row_filter(row) for row in rows]
+
+            if rows:
+                columns: Iterable[Sequence[Any]] = zip(*rows)
+            else:
+                columns = [()] * len(keys)
+
+            return {
+                key: _column_vector(
+                    list(map(proc, column)) if proc else list(column),
+                    arrays,
+                )
+                for key, proc, column in zip(keys, processors, columns)
+            }
+
+        return transpose
+
     def _fetchiter_impl(self):
         fetchone = self.cursor_strategy.fetchone
 
@@ -2107,8 +2643,31 @@ class CursorResult(Result[_T]):
     def _raw_row_iterator(self):
         return self._fetchiter_impl()
 
-    def merge(self, *others: Result[Any]) -> MergedResult[Any]:
-        merged_result = super().merge(*others)
+    def _record_sort_keys(
+        self, order_by: Sequence[_MergeOrderByType]
+    ) -> Deque[Any]:
+        """Record the sort key of each raw row fetched from now on,
+        given ``order_by`` in the form accepted by
+        :meth:`_engine.Result.merge`.
+
+        Returns the deque that the keys are appended to, for use with
+        :meth:`_engine.Result._merge_by_sort_keys`, where the result that's
+        merged produces one row for each row of this result, in the same
+        order; this is the case for ORM results.
+
+        """
+        key = _merge_sort_key(self._metadata, order_by, False)
+        strategy = _SortKeyRecordingFetchStrategy(self.cursor_strategy, key)
+        self.cursor_strategy = strategy
+        return strategy.keys
+
+    def merge(
+        self,
+        *others: Result[Any],
+        order_by: Optional[Sequence[_MergeOrderByType]] = None,
+        limit: Optional[int] = None,
+    ) -> MergedResult[Any]:
+        merged_result = super().merge(*others, order_by=order_by, limit=limit)
         setup_rowcounts = self.context._has_rowcount
         if setup_rowcounts:
             merged_result.rowcount = sum(
@@ -2146,4 +2705,26 @@ class CursorResult(Result[_T]):
         return self
 
 
+def _column_vector(values: List[Any], arrays: bool) -> Sequence[Any]:
+    if arrays and values:
+        # only a column of exactly one type becomes an array; NULLs,
+        # bools or a mix of int and float stay as a list
+        types = set(map(type, values))
+        if len(types) != 1:
+            return values
+        type_ = types.pop()
+        if type_ is int:
+            typecode = "q"
+        elif type_ is float:
+            typecode = "d"
+        else:
+            return values
+        try:
+            return array.array(typecode, values)
+        except OverflowError:
+            # integers that don't fit into 64 bits
+            pass
+    return values
+
+
 ResultProxy = CursorResult
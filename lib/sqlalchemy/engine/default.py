@@ -50,6 +50,7 @@ from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .reflection import ObjectKind
 from .reflection import ObjectScope
+from .util import _ColumnarParameters
 from .. import event
 from .. import exc
 from .. import pool
@@ -234,12 +235,16 @@ class DefaultDialect(Dialect):
     insertmanyvalues_page_size: int = 1000
     insertmanyvalues_max_parameters = 32700
 
+    in_clause_padding = False
+
     supports_is_distinct_from = True
 
     supports_server_side_cursors = False
 
     server_side_cursors = False
 
+    supports_pipeline = False
+
     # extra record-level locking features (#4860)
     supports_for_update_of = False
 
@@ -293,6 +298,7 @@ class DefaultDialect(Dialect):
         label_length: Optional[int] = None,
         insertmanyvalues_page_size: Union[_NoArg, int] = _NoArg.NO_ARG,
         use_insertmanyvalues: Optional[bool] = None,
+        in_clause_padding: bool = False,
         # util.deprecated_params decorator cannot render the
         # Linting.NO_LINTING constant
         compiler_linting: Linting = int(compiler.NO_LINTING),  # type: ignore
@@ -364,6 +370,9 @@ class DefaultDialect(Dialect):
         if insertmanyvalues_page_size is not _NoArg.NO_ARG:
             self.insertmanyvalues_page_size = insertmanyvalues_page_size
 
+        if in_clause_padding:
+            self.in_clause_padding = True
+
     @property
     @util.deprecated(
         "2.0",
@@ -1168,9 +1177,6 @@ class DefaultExecutionContext(ExecutionContext):
     execute_style: ExecuteStyle = ExecuteStyle.EXECUTE
 
     compiled: Optional[Compiled] = None
-    result_column_struct: Optional[
-        Tuple[List[ResultColumnsEntry], bool, bool, bool, bool]
-    ] = None
     returned_default_rows: Optional[Sequence[Row[Any]]] = None
 
     execution_options: _ExecuteOptions = util.EMPTY_DICT
@@ -1287,14 +1293,6 @@ class DefaultExecutionContext(ExecutionContext):
 
         self.execution_options = execution_options
 
-        self.result_column_struct = (
-            compiled._result_columns,
-            compiled._ordered_columns,
-            compiled._textual_ordered_columns,
-            compiled._ad_hoc_textual,
-            compiled._loose_column_name_matching,
-        )
-
         self.isinsert = ii = compiled.isinsert
         self.isupdate = iu = compiled.isupdate
         self.isdelete = id_ = compiled.isdelete
@@ -1356,6 +1354,8 @@ class DefaultExecutionContext(ExecutionContext):
                         "DELETE..RETURNING when executemany is used"
                     )
 
+        columnar_parameters: Optional[_ColumnarParameters] = None
+
         if not parameters:
             self.compiled_parameters = [
                 compiled.construct_params(
@@ -1363,6 +1363,21 @@ class DefaultExecutionContext(ExecutionContext):
                     escape_names=False,
                 )
             ]
+        elif (
+            # _ColumnarParameters is a collections.abc.Sequence, for which
+            # isinstance() goes through the ABC machinery on each call
+            type(parameters) is _ColumnarParameters
+            and not compiled.insert_prefetch
+            and not compiled.literal_execute_params
+            and not compiled.post_compile_params
+        ):
+            # column-oriented parameters for a statement that doesn't
+            # need per-row defaults; parameter dictionaries are only
+            # generated if something asks for them
+            columnar_parameters = self._columnar_compiled_parameters(
+                compiled, parameters, extracted_parameters
+            )
+            self.compiled_parameters = columnar_parameters  # type: ignore
         else:
             self.compiled_parameters = [
                 compiled.construct_params(
@@ -1374,15 +1389,15 @@ class DefaultExecutionContext(ExecutionContext):
                 for grp, m in enumerate(parameters)
             ]
 
-            if len(parameters) > 1:
-                if self.isinsert and compiled._insertmanyvalues:
-                    self.execute_style = ExecuteStyle.INSERTMANYVALUES
+        if parameters and len(parameters) > 1:
+            if self.isinsert and compiled._insertmanyvalues:
+                self.execute_style = ExecuteStyle.INSERTMANYVALUES
 
-                    imv = compiled._insertmanyvalues
-                    if imv.sentinel_columns is not None:
-                        self._num_sentinel_cols = imv.num_sentinel_columns
-                else:
-                    self.execute_style = ExecuteStyle.EXECUTEMANY
+                imv = compiled._insertmanyvalues
+                if imv.sentinel_columns is not None:
+                    self._num_sentinel_cols = imv.num_sentinel_columns
+            else:
+                self.execute_style = ExecuteStyle.EXECUTEMANY
 
         self.unicode_statement = compiled.string
 
@@ -1438,7 +1453,24 @@ class DefaultExecutionContext(ExecutionContext):
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
 
-        if compiled.positional:
+        if (
+            columnar_parameters is None
+            and self.execute_style is not ExecuteStyle.EXECUTE
+            and compiled._bind_batch_processors
+        ):
+            # types that process a batch of values at once are given
+            # each parameter's values for all parameter sets
+            all_params = self.compiled_parameters
+            keys = list(all_params[0])
+            columnar_parameters = _ColumnarParameters(
+                keys, [[params[key] for params in all_params] for key in keys]
+            )
+
+        if columnar_parameters is not None:
+            self.parameters = self._columnar_dbapi_parameters(
+                compiled, columnar_parameters, flattened_processors
+            )
+        elif compiled.positional:
             core_positional_parameters: MutableSequence[Sequence[Any]] = []
             assert positiontup is not None
             for compiled_params in self.compiled_parameters:
@@ -1487,6 +1519,82 @@ class DefaultExecutionContext(ExecutionContext):
 
         return self
 
+    def _columnar_compiled_parameters(
+        self,
+        compiled: SQLCompiler,
+        parameters: _ColumnarParameters,
+        extracted_parameters: Optional[Sequence[BindParameter[Any]]],
+    ) -> _ColumnarParameters:
+        """Produce compiled parameters for column-oriented input.
+
+        Bound parameters that aren't among the given columns, such as
+        values embedded in the statement itself, are the same for every
+        row and are taken from the parameters constructed for the first
+        row.
+
+        """
+        first_row = compiled.construct_params(
+            parameters[0],
+            escape_names=False,
+            extracted_parameters=extracted_parameters,
+        )
+        num_rows = len(parameters)
+        given = dict(zip(parameters.keys, parameters.columns))
+
+        columns: Dict[str, Sequence[Any]] = {}
+        for bindparam, name in compiled.bind_names.items():
+            if name in columns:
+                continue
+            elif bindparam.key in given:
+                columns[name] = given[bindparam.key]
+            elif name in given:
+                columns[name] = given[name]
+            else:
+                columns[name] = [first_row[name]] * num_rows
+
+        return _ColumnarParameters(list(columns), list(columns.values()))
+
+    def _columnar_dbapi_parameters(
+        self,
+        compiled: SQLCompiler,
+        parameters: _ColumnarParameters,
+        processors: Mapping[str, _BindProcessorType[Any]],
+    ) -> _DBAPIMultiExecuteParams:
+        """Convert column-oriented compiled parameters into DBAPI
+        parameters, applying each bind processor to a whole column at once.
+
+        """
+        batch_processors = compiled._bind_batch_processors
+
+        columns: Dict[str, Sequence[Any]] = {}
+        for key, column in zip(parameters.keys, parameters.columns):
+            if key in batch_processors:
+                columns[key] = batch_processors[key](column)
+            elif key in processors:
+                columns[key] = list(map(processors[key], column))
+            else:
+                columns[key] = column
+
+        if compiled.positional:
+            positiontup = compiled.positiontup
+            assert positiontup is not None
+            rows = zip(*[columns[key] for key in positiontup])
+
+            execute_sequence_format = self.dialect.execute_sequence_format
+            if execute_sequence_format is tuple:
+                return list(rows)
+            else:
+                return list(map(execute_sequence_format, rows))
+        else:
+            escaped_names = compiled.escaped_bind_names
+            if escaped_names:
+                keys = [escaped_names.get(key, key) for key in columns]
+            else:
+                keys = list(columns)
+
+            # DBAPIs that use named parameters need a dictionary per row
+            return [dict(zip(keys, row)) for row in zip(*columns.values())]
+
     @classmethod
     def _init_statement(
         cls,
@@ -1577,6 +1685,24 @@ class DefaultExecutionContext(ExecutionContext):
         else:
             return "unknown"
 
+    @util.memoized_property
+    def result_column_struct(
+        self,
+    ) -> Optional[Tuple[List[ResultColumnsEntry], bool, bool, bool, bool]]:
+        # only needed when result metadata is built, which for a cached
+        # compiled statement is usually not the case
+        if self.compiled is None or self.isddl:
+            return None
+
+        compiled = cast(SQLCompiler, self.compiled)
+        return (
+            compiled._result_columns,
+            compiled._ordered_columns,
+            compiled._textual_ordered_columns,
+            compiled._ad_hoc_textual,
+            compiled._loose_column_name_matching,
+        )
+
     @property
     def executemany(self):
         return self.execute_style in (
@@ -1797,13 +1923,9 @@ class DefaultExecutionContext(ExecutionContext):
 
             result = _cursor.CursorResult(self, strategy, cursor_description)
 
-        compiled = self.compiled
+        compiled: Optional[SQLCompiler] = self.compiled  # type: ignore
 
-        if (
-            compiled
-            and not self.isddl
-            and cast(SQLCompiler, compiled).has_out_parameters
-        ):
+        if compiled and not self.isddl and compiled.has_out_parameters:
             self._setup_out_parameters(result)
 
         self._soft_closed = result._soft_closed
@@ -281,6 +281,7 @@ class _CoreKnownExecutionOptions(TypedDict, total=False):
     no_parameters: bool
     stream_results: bool
     max_row_buffer: int
+    max_buffer_bytes: int
     yield_per: int
     insertmanyvalues_page_size: int
     schema_translate_map: Optional[SchemaTranslateMapType]
@@ -796,6 +797,14 @@ class Dialect(EventTarget):
     supports_server_side_cursors: bool
     """indicates if the dialect supports server side cursors"""
 
+    supports_pipeline: bool
+    """indicates if the dialect supports pipelined execution of statements,
+    as used by :meth:`_engine.Connection.pipeline`.
+
+    .. versionadded:: 2.0.19
+
+    """
+
     server_side_cursors: bool
     """deprecated; indicates if the dialect should attempt to use server
     side cursors by default"""
@@ -912,6 +921,19 @@ class Dialect(EventTarget):
 
     """
 
+    in_clause_padding: bool
+    """if True, lists of values passed to "expanding" IN parameters are
+    padded up to the next power of two by repeating the last value, so that
+    only a small number of distinct SQL strings are sent to the database.
+
+    .. versionadded:: 2.0.19
+
+    .. seealso::
+
+        :ref:`engine_in_clause_padding`
+
+    """
+
     insertmanyvalues_implicit_sentinel: InsertmanyvaluesSentinelOpts
     """Options indicating the database supports a form of bulk INSERT where
     the autoincrement integer primary key can be reliably used as an ordering
@@ -2021,6 +2043,27 @@ class Dialect(EventTarget):
         usable."""
         raise NotImplementedError()
 
+    def do_pipeline(self, dbapi_connection: DBAPIConnection) -> Any:
+        """Return a context manager which places the given DBAPI connection
+        in pipeline mode for the duration of the block.
+
+        The object returned by the context manager is the DBAPI-level
+        pipeline object; it is made available to execution contexts so
+        that they may synchronize the pipeline when the results of a
+        statement are needed.
+
+        This method is only called for dialects that set
+        :attr:`.Dialect.supports_pipeline` to ``True``.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :meth:`_engine.Connection.pipeline`
+
+        """
+        raise NotImplementedError()
+
     def do_set_input_sizes(
         self,
         cursor: DBAPICursor,
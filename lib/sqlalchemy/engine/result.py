@@ -11,12 +11,14 @@ from __future__ import annotations
 
 from enum import Enum
 import functools
+import heapq
 import itertools
 import operator
 import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Deque
 from typing import Dict
 from typing import Generic
 from typing import Iterable
@@ -37,6 +39,8 @@ from .row import Row
 from .row import RowMapping
 from .. import exc
 from .. import util
+from ..sql import elements
+from ..sql import operators
 from ..sql.base import _generative
 from ..sql.base import HasMemoized
 from ..sql.base import InPlaceGenerative
@@ -57,6 +61,7 @@ if typing.TYPE_CHECKING:
 
 _KeyType = Union[str, "Column[Any]"]
 _KeyIndexType = Union[str, "Column[Any]", int]
+_MergeOrderByType = Union[_KeyIndexType, "elements.UnaryExpression[Any]"]
 
 # is overridden in cursor using _CursorKeyMapRecType
 _KeyMapRecType = Any
@@ -1580,7 +1585,12 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
 
         return FrozenResult(self)
 
-    def merge(self, *others: Result[Any]) -> MergedResult[_TP]:
+    def merge(
+        self,
+        *others: Result[Any],
+        order_by: Optional[Sequence[_MergeOrderByType]] = None,
+        limit: Optional[int] = None,
+    ) -> MergedResult[_TP]:
         """Merge this :class:`_engine.Result` with other compatible result
         objects.
 
@@ -1593,8 +1603,68 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
         set of result / cursor metadata, otherwise the behavior is
         undefined.
 
+        :param order_by: optional sequence of keys indicating that each
+         result is already sorted on these keys; rows from all results will
+         then be interleaved so that the merged result is sorted the same
+         way, rather than being concatenated.   Each key may be any key
+         accepted by :meth:`_engine.Result.columns`, or the
+         :meth:`_sql.ColumnElement.desc` / :meth:`_sql.ColumnElement.asc`
+         form of a column, optionally further modified with
+         :meth:`_sql.ColumnElement.nulls_first` /
+         :meth:`_sql.ColumnElement.nulls_last`; a string key may be
+         made descending using :func:`_sql.desc`.  Unless indicated
+         otherwise, NULL is considered lower than all other values, as is
+         the default for SQLite, MySQL and SQL Server.
+
+         The merge is a k-way merge that holds only one pending row per
+         result in memory, and rows are fetched from each result only as
+         they are needed::
+
+            results = [
+                conn.execute(
+                    select(table).order_by(table.c.name, table.c.id)
+                    .limit(50)
+                )
+                for conn in shard_connections
+            ]
+            merged = results[0].merge(
+                *results[1:], order_by=[table.c.name, table.c.id], limit=50
+            )
+
+         .. versionadded:: 2.0.19
+
+        :param limit: optional maximum number of rows to be returned from
+         the merged result.  Once this number of rows is delivered, all of
+         the results being merged are closed, without fetching their
+         remaining rows.
+
+         .. versionadded:: 2.0.19
+
         """
-        return MergedResult(self._metadata, (self,) + others)
+        return MergedResult(
+            self._metadata, (self,) + others, order_by=order_by, limit=limit
+        )
+
+    def _merge_by_sort_keys(
+        self,
+        others: Sequence[Result[Any]],
+        sort_keys: Sequence[Deque[Any]],
+    ) -> MergedResult[_TP]:
+        """Merge this :class:`_engine.Result` with other results in the
+        same way as :meth:`_engine.Result.merge` with ``order_by``, where
+        the sort key of each row is taken from the given deques, one for
+        each result, rather than from the row itself.
+
+        The deques are typically those returned by
+        :meth:`.CursorResult._record_sort_keys` for the cursor results
+        these results are produced from, such as for ORM results, where
+        the rows themselves may contain ORM entities rather than the
+        columns being sorted on.
+
+        """
+        return MergedResult(
+            self._metadata, (self,) + tuple(others), _sort_keys=sort_keys
+        )
 
 
 class FilterResult(ResultInternal[_R]):
@@ -2373,15 +2443,46 @@ class MergedResult(IteratorResult[_TP]):
     rowcount: Optional[int]
 
     def __init__(
-        self, cursor_metadata: ResultMetaData, results: Sequence[Result[_TP]]
+        self,
+        cursor_metadata: ResultMetaData,
+        results: Sequence[Result[_TP]],
+        order_by: Optional[Sequence[_MergeOrderByType]] = None,
+        limit: Optional[int] = None,
+        _sort_keys: Optional[Sequence[Deque[Any]]] = None,
     ):
         self._results = results
-        super().__init__(
-            cursor_metadata,
-            itertools.chain.from_iterable(
+
+        iterator: Iterator[Any]
+        if _sort_keys is not None:
+            iterator = map(
+                operator.itemgetter(1),
+                heapq.merge(
+                    *[
+                        _keyed_rows(r._raw_row_iterator(), keys)
+                        for r, keys in zip(results, _sort_keys)
+                    ],
+                    key=operator.itemgetter(0),
+                ),
+            )
+        elif order_by:
+            iterator = iter(
+                heapq.merge(
+                    *[r._raw_row_iterator() for r in results],
+                    key=_merge_sort_key(
+                        cursor_metadata,
+                        order_by,
+                        results[0]._source_supports_scalars,
+                    ),
+                )
+            )
+        else:
+            iterator = itertools.chain.from_iterable(
                 r._raw_row_iterator() for r in results
-            ),
-        )
+            )
+        if limit is not None:
+            iterator = itertools.islice(iterator, limit)
+
+        super().__init__(cursor_metadata, iterator)
 
         self._unique_filter_state = results[0]._unique_filter_state
         self._yield_per = results[0]._yield_per
@@ -2398,3 +2499,135 @@ class MergedResult(IteratorResult[_TP]):
             r._soft_close(hard=hard, **kw)
         if hard:
             self.closed = True
+
+
+class _DescendingKey:
+    """Inverts the ordering of a sort key, so that descending and
+    ascending keys may be combined within a single key tuple."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: _DescendingKey) -> bool:
+        return bool(other.value < self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(self.value == other.value)
+
+
+def _merge_sort_key(
+    metadata: ResultMetaData,
+    order_by: Sequence[_MergeOrderByType],
+    source_supports_scalars: bool,
+) -> Callable[[Any], Any]:
+    """Produce a key function for :func:`heapq.merge` that acts upon raw
+    rows, given the ``order_by`` argument of :meth:`_engine.Result.merge`.
+
+    """
+
+    tf = metadata._tuplefilter
+    processors = metadata._effective_processors
+    if tf and processors:
+        processors = tf(processors)
+
+    key_getters: List[Callable[[Any], Any]] = []
+
+    for key in order_by:
+        descending = False
+        nulls_high = False
+        if isinstance(key, elements.UnaryExpression):
+            nulls_modifier = None
+            if key.modifier in (
+                operators.nulls_first_op,
+                operators.nulls_last_op,
+            ):
+                nulls_modifier = key.modifier
+                key = key.element  # type: ignore
+            if isinstance(key, elements.UnaryExpression):
+                if key.modifier is operators.desc_op:
+                    descending = True
+                elif key.modifier is not operators.asc_op:
+                    raise exc.ArgumentError(
+                        "Only asc(), desc(), nulls_first() and "
+                        "nulls_last() modifiers are accepted for "
+                        "order_by keys"
+                    )
+                key = key.element  # type: ignore
+            # NULLs sort "high" in terms of the ascending ordering that
+            # is then reversed for descending
+            if descending:
+                nulls_high = nulls_modifier is operators.nulls_first_op
+            else:
+                nulls_high = nulls_modifier is operators.nulls_last_op
+
+        if isinstance(
+            key, (elements._label_reference, elements._textual_label_reference)
+        ):
+            key = key.element  # type: ignore
+        index = metadata._index_for_key(key, True)  # type: ignore
+        assert index is not None
+
+        value_getter: Callable[[Any], Any]
+        if source_supports_scalars:
+            value_getter = _identity
+        elif tf:
+            value_getter = functools.partial(
+                _apply_tuplefilter, tf, operator.itemgetter(index)
+            )
+        else:
+            value_getter = operator.itemgetter(index)
+
+        proc = processors[index] if processors else None
+        if proc is not None:
+            value_getter = functools.partial(
+                _apply_processor, proc, value_getter
+            )
+
+        key_getters.append(
+            functools.partial(
+                _sort_value, value_getter, nulls_high, descending
+            )
+        )
+
+    if len(key_getters) == 1:
+        return key_getters[0]
+    else:
+        return lambda row: tuple(getter(row) for getter in key_getters)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _keyed_rows(
+    rows: Iterator[Any], keys: Deque[Any]
+) -> Iterator[Tuple[Any, Any]]:
+    # keys are recorded as the rows they correspond to are fetched, so
+    # by the time a row is produced, its key is at the head of the deque
+    for row in rows:
+        yield keys.popleft(), row
+
+
+def _apply_tuplefilter(
+    tf: _TupleGetterType, getter: Callable[[Any], Any], row: Any
+) -> Any:
+    return getter(tf(row))
+
+
+def _apply_processor(
+    proc: Callable[[Any], Any], getter: Callable[[Any], Any], row: Any
+) -> Any:
+    return proc(getter(row))
+
+
+def _sort_value(
+    getter: Callable[[Any], Any], nulls_high: bool, descending: bool, row: Any
+) -> Any:
+    value = getter(row)
+    if nulls_high:
+        key = (value is None, value)
+    else:
+        key = (value is not None, value)
+    return _DescendingKey(key) if descending else key
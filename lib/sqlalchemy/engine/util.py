@@ -10,8 +10,15 @@ from __future__ import annotations
 import typing
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import overload
+from typing import Sequence
 from typing import TypeVar
+from typing import Union
 
 from .. import exc
 from .. import util
@@ -164,3 +171,128 @@ class TransactionalContext:
                     assert subject is not None
                     subject._trans_context_manager = self._outer_trans_ctx
                 self._trans_subject = self._outer_trans_ctx = None
+
+
+class _ColumnarParameters(Sequence[Dict[str, Any]]):
+    """A sequence of parameter dictionaries stored as columns.
+
+    Used by :meth:`_engine.Connection.execute_columnar` to carry
+    column-oriented parameters to the execution context, which can then
+    apply bind processors to each column as a whole.  Individual
+    dictionaries are only created for the rows that are actually
+    accessed, such as by event handlers.
+
+    """
+
+    __slots__ = ("keys", "columns", "_length")
+
+    keys: Sequence[str]
+    columns: Sequence[Sequence[Any]]
+
+    def __init__(self, keys: Sequence[str], columns: Sequence[Sequence[Any]]):
+        self.keys = keys
+        self.columns = columns
+        self._length = len(columns[0]) if columns else 0
+
+    @classmethod
+    def _from_mapping(cls, columns: Mapping[Any, Any]) -> _ColumnarParameters:
+        keys = []
+        values = []
+        for key, column in columns.items():
+            if not isinstance(key, str):
+                key = getattr(key, "key", None)
+                if not isinstance(key, str):
+                    raise exc.ArgumentError(
+                        "Columnar parameters must be keyed on string names "
+                        "or Column objects"
+                    )
+            keys.append(key)
+            values.append(_columnar_values(key, column))
+
+        if not values:
+            raise exc.ArgumentError("At least one column is required")
+
+        length = len(values[0])
+        for key, column in zip(keys, values):
+            if len(column) != length:
+                raise exc.ArgumentError(
+                    "All columns must have the same number of values; "
+                    "column %r has %d values, expected %d"
+                    % (key, len(column), length)
+                )
+        if not length:
+            raise exc.ArgumentError("Columnar parameters have no rows")
+
+        return cls(keys, values)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [
+                dict(zip(self.keys, row))
+                for row in zip(*[column[index] for column in self.columns])
+            ]
+        else:
+            return {
+                key: column[index]
+                for key, column in zip(self.keys, self.columns)
+            }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        keys = self.keys
+        for row in zip(*self.columns):
+            yield dict(zip(keys, row))
+
+
+def _columnar_values(key: str, values: Any) -> Sequence[Any]:
+    """Return the values of a single column as a sequence.
+
+    Objects which support the buffer protocol, such as ``array.array``
+    and numeric NumPy arrays, are converted to a list of Python scalars
+    in one step.
+
+    """
+    if isinstance(values, (str, bytes, bytearray)):
+        raise exc.ArgumentError(
+            "Column %r must be given a sequence of values, not a string" % key
+        )
+
+    try:
+        view = memoryview(values)
+    except (TypeError, ValueError):
+        pass
+    else:
+        with view:
+            if view.ndim != 1:
+                raise exc.ArgumentError(
+                    "Column %r must be given a one-dimensional sequence of "
+                    "values" % key
+                )
+            try:
+                return view.tolist()  # type: ignore[no-any-return]
+            except NotImplementedError:
+                # buffer formats that memoryview can't unpack, such as
+                # fixed-width strings; iterate the object itself
+                pass
+
+    if isinstance(values, (list, tuple)):
+        return values
+
+    try:
+        return list(values)
+    except TypeError as err:
+        raise exc.ArgumentError(
+            "Column %r must be given a sequence of values" % key
+        ) from err
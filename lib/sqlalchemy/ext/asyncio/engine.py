@@ -409,6 +409,7 @@ class AsyncConnection(
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
@@ -972,6 +973,7 @@ class AsyncConnection(
     classmethods=[],
     methods=[
         "clear_compiled_cache",
+        "compiled_cache_stats",
         "update_execution_options",
         "get_execution_options",
     ],
@@ -1143,8 +1145,9 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
             Proxied for the :class:`_engine.Engine` class on
             behalf of the :class:`_asyncio.AsyncEngine` class.
 
-        This applies **only** to the built-in cache that is established
-        via the :paramref:`_engine.create_engine.query_cache_size` parameter.
+        This applies **only** to the cache that is established
+        via the :paramref:`_engine.create_engine.query_cache_size` or
+        :paramref:`_engine.create_engine.query_cache` parameters.
         It will not impact any dictionary caches that were passed via the
         :paramref:`.Connection.execution_options.query_cache` parameter.
 
@@ -1155,6 +1158,43 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
 
         return self._proxied.clear_compiled_cache()
 
+    def compiled_cache_stats(self) -> Optional[Dict[str, int]]:
+        r"""Return usage statistics for the compiled cache of this
+        :class:`_engine.Engine`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_engine.Engine` class on
+            behalf of the :class:`_asyncio.AsyncEngine` class.
+
+        For the default cache, the dictionary returned includes the keys
+        ``"hits"`` and ``"misses"``, counting statements that were or were
+        not found in the cache, ``"evictions"``, counting statements that
+        were removed to make room for others, ``"size"``, the number of
+        statements currently in the cache, and ``"capacity"``, which is the
+        value of :paramref:`_sa.create_engine.query_cache_size`.  The
+        counters accumulate for the lifespan of the cache; a high ratio of
+        evictions or misses to hits once an application is warmed up
+        indicates that :paramref:`_sa.create_engine.query_cache_size` should
+        be increased.
+
+        When a cache object is passed using
+        :paramref:`_sa.create_engine.query_cache`, the value returned by its
+        ``stats()`` method is returned if it has one; otherwise, only
+        ``"size"`` is reported.  If caching is disabled, ``None`` is
+        returned.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`sql_caching`
+
+
+        """  # noqa: E501
+
+        return self._proxied.compiled_cache_stats()
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -25,11 +25,18 @@ the source distribution.
 """
 from __future__ import annotations
 
+import asyncio
+from concurrent import futures
+import threading
+import time
 from typing import Any
 from typing import Callable
+from typing import Deque
 from typing import Dict
 from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
@@ -40,6 +47,7 @@ from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
+from ..engine.cursor import CursorResult
 from ..orm import PassiveFlag
 from ..orm._typing import OrmExecuteOptionsParameter
 from ..orm.interfaces import ORMOption
@@ -48,6 +56,8 @@ from ..orm.query import Query
 from ..orm.session import _BindArguments
 from ..orm.session import _PKIdentityArgument
 from ..orm.session import Session
+from ..util.concurrency import await_only
+from ..util.concurrency import greenlet_spawn
 from ..util.typing import Protocol
 from ..util.typing import Self
 
@@ -55,6 +65,7 @@ if TYPE_CHECKING:
     from ..engine.base import Connection
     from ..engine.base import Engine
     from ..engine.base import OptionEngine
+    from ..engine.interfaces import _ExecuteOptions
     from ..engine.result import IteratorResult
     from ..engine.result import Result
     from ..orm import LoaderCallableStatus
@@ -68,8 +79,9 @@ if TYPE_CHECKING:
     from ..sql import Executable
     from ..sql._typing import _TP
     from ..sql.elements import ClauseElement
+    from ..sql.elements import ColumnElement
 
-__all__ = ["ShardedSession", "ShardedQuery"]
+__all__ = ["ShardedSession", "ShardedQuery", "ShardTimeoutError"]
 
 _T = TypeVar("_T", bound=Any)
 
@@ -77,6 +89,23 @@ _T = TypeVar("_T", bound=Any)
 ShardIdentifier = str
 
 
+class ShardTimeoutError(exc.SQLAlchemyError):
+    """Raised when a shard does not return results within the
+    :paramref:`.ShardedSession.shard_timeout` when running with
+    :paramref:`.ShardedSession.concurrent_shards` enabled.
+
+    .. versionadded:: 2.0.19
+
+    """
+
+    def __init__(self, shard_id: ShardIdentifier, timeout: float):
+        super().__init__(
+            "Shard %r did not complete within %s seconds" % (shard_id, timeout)
+        )
+        self.shard_id = shard_id
+        self.timeout = timeout
+
+
 class ShardChooser(Protocol):
     def __call__(
         self,
@@ -155,6 +184,10 @@ class ShardedSession(Session):
             Callable[[Query[_T], Iterable[_T]], Iterable[Any]]
         ] = None,
         query_chooser: Optional[Callable[[Executable], Iterable[Any]]] = None,
+        concurrent_shards: bool = False,
+        ordered_merge: bool = False,
+        shard_executor: Optional[futures.Executor] = None,
+        shard_timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> None:
         """Construct a ShardedSession.
@@ -184,6 +217,63 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param concurrent_shards: when ``True``, a SELECT statement that
+          is sent to more than one shard will be invoked against all shards
+          at the same time, rather than one shard after the other.  For
+          a synchronous session, each shard is invoked in a worker thread
+          of a :class:`concurrent.futures.ThreadPoolExecutor`; when the
+          session is used via :class:`_asyncio.AsyncSession` with an async
+          driver, the shards are instead awaited together using
+          ``asyncio.gather()``.  Shards that share the same database
+          connection are still invoked serially with respect to each other.
+
+          Rows are still delivered and merged into the identity map in the
+          order given by the ``execute_chooser``, regardless of the order in
+          which the shards complete, so that the outcome is the same as
+          that of serial execution.  INSERT, UPDATE and DELETE statements
+          are always invoked serially.
+
+          .. versionadded:: 2.0.19
+
+        :param ordered_merge: when ``True``, the results of a SELECT
+          statement that has an ORDER BY and is sent to more than one shard
+          are merged in that order, using the same streaming merge as
+          :paramref:`_engine.Result.merge.order_by`, rather than being
+          concatenated in the order given by the ``execute_chooser``.  The
+          rows of each shard are sorted on the columns they deliver from
+          the database, so every ORDER BY expression must be present in the
+          columns clause of the statement, else an error is raised.  The
+          sort takes place in Python and may differ from that of the
+          database for collations or types that don't compare the same way
+          in Python.
+
+          .. versionadded:: 2.0.19
+
+        :param shard_executor: optional :class:`concurrent.futures.Executor`
+          used when :paramref:`.ShardedSession.concurrent_shards` is set.
+          This allows a single pool of worker threads to be shared among
+          many :class:`.ShardedSession` objects.  When omitted, a
+          :class:`concurrent.futures.ThreadPoolExecutor` is created for
+          this session when first needed, and is shut down when
+          :meth:`.Session.close` is called.
+
+          .. versionadded:: 2.0.19
+
+        :param shard_timeout: optional number of seconds that each shard is
+          given to produce its result when
+          :paramref:`.ShardedSession.concurrent_shards` is set.  If a shard
+          does not complete in time, :class:`.ShardTimeoutError` is raised.
+          For asyncio, the shard's operation is cancelled; for threads,
+          the statement in progress is not interrupted, and its worker
+          invalidates the shard's connection once the statement returns.
+          In both cases the session should be rolled back or closed before
+          it is used further; :meth:`.Session.rollback` and
+          :meth:`.Session.close` wait for any such abandoned statement to
+          finish first.  Shards that share a connection are invoked one
+          after the other, each of them given the full timeout.
+
+          .. versionadded:: 2.0.19
+
         """
         super().__init__(query_cls=query_cls, **kwargs)
 
@@ -248,11 +338,43 @@ class ShardedSession(Session):
                 "execute_chooser or query_chooser is required"
             )
         self.execute_chooser = execute_chooser
+        self.concurrent_shards = concurrent_shards
+        self.ordered_merge = ordered_merge
+        self.shard_timeout = shard_timeout
+        self._shard_executor = shard_executor
+        self._owns_shard_executor = shard_executor is None
+        self._abandoned_shard_work: List[futures.Future[None]] = []
         self.__shards: Dict[ShardIdentifier, _SessionBind] = {}
         if shards is not None:
             for k in shards:
                 self.bind_shard(k, shards[k])
 
+    def _get_shard_executor(self) -> futures.Executor:
+        if self._shard_executor is None:
+            self._shard_executor = futures.ThreadPoolExecutor(
+                max_workers=len(self.__shards) or None,
+                thread_name_prefix="sqlalchemy_shard",
+            )
+        return self._shard_executor
+
+    def _wait_for_abandoned_shards(self) -> None:
+        # shards that timed out may still be running their statement;
+        # the worker discards the connection once it returns
+        if self._abandoned_shard_work:
+            futures.wait(self._abandoned_shard_work)
+            self._abandoned_shard_work.clear()
+
+    def rollback(self) -> None:
+        self._wait_for_abandoned_shards()
+        super().rollback()
+
+    def close(self) -> None:
+        self._wait_for_abandoned_shards()
+        super().close()
+        if self._owns_shard_executor and self._shard_executor is not None:
+            self._shard_executor.shutdown(wait=True)
+            self._shard_executor = None
+
     def _identity_lookup(
         self,
         mapper: Mapper[_O],
@@ -475,9 +597,371 @@ def execute_and_instances(
 
     if shard_id is not None:
         return iter_for_shard(shard_id)
+
+    shard_ids = list(session.execute_chooser(orm_context))
+    if orm_context.is_select and session.ordered_merge and len(shard_ids) > 1:
+        order_by = getattr(orm_context.statement, "_order_by_clauses", ())
+    else:
+        order_by = ()
+
+    if (
+        orm_context.is_select
+        and len(shard_ids) > 1
+        and session.concurrent_shards
+        # remaining do_orm_execute hooks expect to be invoked for each
+        # shard via invoke_statement()
+        and not orm_context._remaining_events()
+    ):
+        return _invoke_shards(orm_context, session, shard_ids, order_by)
     else:
         partial = []
-        for shard_id in session.execute_chooser(orm_context):
+        for shard_id in shard_ids:
             result_ = iter_for_shard(shard_id)
             partial.append(result_)
+        if order_by:
+            return _merge_ordered(partial, order_by)
         return partial[0].merge(*partial[1:])
+
+
+def _merge_ordered(
+    results: Sequence[Result[Any]],
+    order_by: Sequence[ColumnElement[Any]],
+) -> Result[Any]:
+    """Merge the results of :meth:`.ORMExecuteState.invoke_statement` for
+    each shard in the order given by ``order_by``.
+
+    The sort keys are recorded from the cursor result underlying each
+    result, before any rows are fetched from it.
+
+    """
+    try:
+        sort_keys = []
+        for result in results:
+            raw = getattr(result, "raw", None)
+            if raw is None and isinstance(result, CursorResult):
+                raw = result
+            if not isinstance(raw, CursorResult):
+                raise exc.InvalidRequestError(
+                    "Can't merge shard results in ORDER BY order; a result "
+                    "of type %r does not provide its cursor result"
+                    % type(result)
+                )
+            sort_keys.append(
+                _record_sort_keys(raw, order_by, raw is not result)
+            )
+    except BaseException:
+        with util.safe_reraise():
+            for result in results:
+                result.close()
+
+    return results[0]._merge_by_sort_keys(results[1:], sort_keys)
+
+
+class _ShardInvocation:
+    """A statement prepared for one shard, to be run by
+    :func:`._invoke_shards`."""
+
+    __slots__ = (
+        "shard_id",
+        "statement",
+        "execution_options",
+        "bind_arguments",
+        "connection",
+        "result",
+        "error",
+        "done",
+    )
+
+    result: Optional[CursorResult[Any]]
+    error: Optional[BaseException]
+
+    def __init__(
+        self,
+        shard_id: ShardIdentifier,
+        statement: Executable,
+        execution_options: _ExecuteOptions,
+        bind_arguments: _BindArguments,
+        connection: Connection,
+    ):
+        self.shard_id = shard_id
+        self.statement = statement
+        self.execution_options = execution_options
+        self.bind_arguments = bind_arguments
+        self.connection = connection
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class _ShardGroup:
+    """Shards which share a DBAPI connection, and are therefore invoked
+    one after the other."""
+
+    __slots__ = ("invocations", "lock", "abandoned")
+
+    def __init__(self) -> None:
+        self.invocations: List[_ShardInvocation] = []
+        self.lock = threading.Lock()
+        self.abandoned = False
+
+    def discard(self) -> None:
+        """Close the results of the group and invalidate its connections.
+
+        Used once the group has been abandoned after a timeout; this is
+        only called by whoever is running the group, i.e. the worker, so
+        that the connection is never used from two threads at once.  The
+        results of an abandoned group are left to this method, so that
+        each is closed only once.
+
+        """
+        for invocation in self.invocations:
+            if invocation.result is not None:
+                invocation.result.close()
+        for connection in {
+            id(invocation.connection): invocation.connection
+            for invocation in self.invocations
+        }.values():
+            connection.invalidate()
+
+
+def _invoke_shards(
+    orm_context: ORMExecuteState,
+    session: ShardedSession,
+    shard_ids: List[ShardIdentifier],
+    order_by: Sequence[ColumnElement[Any]],
+) -> Result[Any]:
+    """Invoke a SELECT statement against the given shards, returning the
+    merged result.
+
+    When :paramref:`.ShardedSession.concurrent_shards` is set, the shards
+    are invoked at the same time.  Only :meth:`_engine.Connection.execute`
+    is run concurrently.  The :class:`.Session` is not thread safe, so
+    everything that involves it, i.e. autoflush, the procurement of a
+    :class:`_engine.Connection` for each shard and the setup of the ORM
+    result that loads objects into the identity map, takes place in the
+    calling thread.
+
+    When ``order_by`` is given, as with
+    :paramref:`.ShardedSession.ordered_merge`, the results of the shards
+    are merged in that order.  The sort keys are taken from the cursor
+    rows of each shard, as ORM results may deliver entities rather than
+    the columns being sorted on.
+
+    """
+
+    if orm_context.load_options._autoflush:
+        session._autoflush()
+
+    # the ORM compile state hooks are untyped
+    compile_state_cls: Any = orm_context._compile_state_cls
+    params = orm_context.parameters
+
+    # group shards by DBAPI connection, as shards may be distinguished
+    # only by execution options against a single connection, such as
+    # with schema_translate_map; these have to run one after the other
+    groups: Dict[int, _ShardGroup] = {}
+    invocations: List[_ShardInvocation] = []
+    is_async = False
+    for shard_id in shard_ids:
+        statement = orm_context.statement
+        bind_arguments = dict(orm_context.bind_arguments)
+        bind_arguments["shard_id"] = shard_id
+        execution_options = orm_context.local_execution_options.union(
+            {"identity_token": shard_id, "autoflush": False}
+        )
+        if compile_state_cls is not None:
+            (
+                statement,
+                execution_options,
+            ) = compile_state_cls.orm_pre_session_exec(
+                session,
+                statement,
+                params,
+                execution_options,
+                bind_arguments,
+                False,
+            )
+        else:
+            bind_arguments.setdefault("clause", statement)
+
+        conn = session._connection_for_bind(session.get_bind(**bind_arguments))
+        is_async = is_async or conn.dialect.is_async
+
+        invocation = _ShardInvocation(
+            shard_id, statement, execution_options, bind_arguments, conn
+        )
+        invocations.append(invocation)
+        key = id(conn.connection.dbapi_connection)
+        if key not in groups:
+            groups[key] = _ShardGroup()
+        groups[key].invocations.append(invocation)
+
+    timeout = session.shard_timeout
+
+    def execute(invocation: _ShardInvocation) -> CursorResult[Any]:
+        return invocation.connection.execute(
+            invocation.statement,  # type: ignore[arg-type]
+            params or {},
+            execution_options=invocation.execution_options,
+        )
+
+    error: Optional[BaseException] = None
+
+    if len(groups) == 1:
+        # nothing to run concurrently
+        for invocation in invocations:
+            invocation.result = execute(invocation)
+    elif is_async:
+
+        async def run_async(group: _ShardGroup) -> None:
+            for invocation in group.invocations:
+                try:
+                    invocation.result = await asyncio.wait_for(
+                        greenlet_spawn(execute, invocation), timeout
+                    )
+                except asyncio.TimeoutError as err:
+                    assert timeout is not None
+                    group.abandoned = True
+                    raise ShardTimeoutError(
+                        invocation.shard_id, timeout
+                    ) from err
+
+        outcomes = await_only(
+            asyncio.gather(
+                *[run_async(group) for group in groups.values()],
+                return_exceptions=True,
+            )
+        )
+        # the cancelled shard operations are complete at this point, so
+        # their connections can be discarded from the calling greenlet
+        for group in groups.values():
+            if group.abandoned:
+                group.discard()
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                error = outcome
+                break
+    else:
+        executor = session._get_shard_executor()
+
+        def run_group(group: _ShardGroup) -> None:
+            for invocation in group.invocations:
+                with group.lock:
+                    if group.abandoned:
+                        break
+                try:
+                    invocation.result = execute(invocation)
+                except BaseException as err:
+                    invocation.error = err
+                with group.lock:
+                    invocation.done.set()
+                    if group.abandoned or invocation.error is not None:
+                        break
+            else:
+                return
+
+            # all shards of the group are marked done, including those
+            # that won't be invoked, so that the caller does not wait on
+            # them
+            for invocation in group.invocations:
+                invocation.done.set()
+            if group.abandoned:
+                group.discard()
+
+        started = time.monotonic()
+        submitted = [
+            (group, executor.submit(run_group, group))
+            for group in groups.values()
+        ]
+
+        # wait for every shard before raising, so that no connection is
+        # still in use by a worker when the error reaches the caller.  A
+        # shard that times out is abandoned instead; its worker closes
+        # and invalidates the connection once the statement returns,
+        # and the session waits for this in close() and rollback().
+        for group, future in submitted:
+            deadline = started
+            for invocation in group.invocations:
+                if timeout is None:
+                    invocation.done.wait()
+                elif not invocation.done.wait(
+                    max(0, deadline + timeout - time.monotonic())
+                ):
+                    with group.lock:
+                        if not invocation.done.is_set():
+                            group.abandoned = True
+                    if group.abandoned:
+                        session._abandoned_shard_work.append(future)
+                        if error is None:
+                            error = ShardTimeoutError(
+                                invocation.shard_id, timeout
+                            )
+                        break
+                deadline = time.monotonic()
+                if invocation.error is not None:
+                    if error is None:
+                        error = invocation.error
+                    break
+
+    if error is not None:
+        for group in groups.values():
+            with group.lock:
+                if group.abandoned:
+                    # closed by discard(), possibly in a worker thread
+                    # that's still running
+                    continue
+            for invocation in group.invocations:
+                if invocation.result is not None:
+                    invocation.result.close()
+        raise error
+
+    sort_keys: Optional[List[Deque[Any]]] = None
+    if order_by:
+        try:
+            sort_keys = [
+                _record_sort_keys(
+                    invocation.result,  # type: ignore[arg-type]
+                    order_by,
+                    compile_state_cls is not None,
+                )
+                for invocation in invocations
+            ]
+        except BaseException:
+            with util.safe_reraise():
+                for invocation in invocations:
+                    invocation.result.close()  # type: ignore[union-attr]
+
+    results: List[Result[Any]] = []
+    for invocation in invocations:
+        result: Result[Any] = invocation.result  # type: ignore[assignment]
+        if compile_state_cls is not None:
+            result = compile_state_cls.orm_setup_cursor_result(
+                session,
+                invocation.statement,
+                params,
+                invocation.execution_options,
+                invocation.bind_arguments,
+                result,
+            )
+        results.append(result)
+
+    if sort_keys is not None:
+        return results[0]._merge_by_sort_keys(results[1:], sort_keys)
+    else:
+        return results[0].merge(*results[1:])
+
+
+def _record_sort_keys(
+    result: CursorResult[Any],
+    order_by: Sequence[ColumnElement[Any]],
+    is_orm: bool,
+) -> Deque[Any]:
+    if is_orm:
+        # ORM results are not adapted to the statement invoked, so the
+        # columns in the result are those of the statement that was
+        # compiled, which may have been a different but equivalent one
+        # that's cached; use the ORDER BY of that statement.
+        compiled = result.context.compiled
+        assert compiled is not None
+        order_by = compiled.statement._order_by_clauses  # type: ignore
+    return result._record_sort_keys(order_by)  # type: ignore[arg-type]
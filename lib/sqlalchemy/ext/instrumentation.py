@@ -355,6 +355,10 @@ class _ClassInstrumentationAdapter(ClassManager):
         self.setup_instance(instance, state)
         return instance
 
+    def _new_instance_and_state(self):
+        instance = self.class_.__new__(self.class_)
+        return instance, self.setup_instance(instance)
+
     def _new_state_if_none(self, instance):
         """Install a default InstanceState if none is present.
 
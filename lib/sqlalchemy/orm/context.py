@@ -111,6 +111,7 @@ class QueryContext:
         "session",
         "autoflush",
         "populate_existing",
+        "readonly_objects",
         "invoke_all_eagers",
         "version_check",
         "refresh_state",
@@ -133,6 +134,7 @@ class QueryContext:
     class default_load_options(Options):
         _only_return_tuples = False
         _populate_existing = False
+        _readonly_objects = False
         _version_check = False
         _invoke_all_eagers = True
         _autoflush = True
@@ -192,6 +194,7 @@ class QueryContext:
 
         self.autoflush = load_options._autoflush
         self.populate_existing = load_options._populate_existing
+        self.readonly_objects = load_options._readonly_objects
         self.invoke_all_eagers = load_options._invoke_all_eagers
         self.version_check = load_options._version_check
         self.refresh_state = load_options._refresh_state
@@ -480,6 +483,7 @@ class ORMCompileState(AbstractORMCompileState):
             "_sa_orm_load_options",
             {
                 "populate_existing",
+                "readonly_objects",
                 "autoflush",
                 "yield_per",
                 "identity_token",
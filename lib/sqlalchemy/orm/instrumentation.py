@@ -512,6 +512,14 @@ class ClassManager(
         self._state_setter(instance, state)
         return instance  # type: ignore[no-any-return]
 
+    def _new_instance_and_state(self) -> Tuple[_O, InstanceState[_O]]:
+        # inlined form of new_instance() used by loading.py, which
+        # returns the new state along with the instance
+        instance = self.class_.__new__(self.class_)  # type: ignore
+        state = self._state_constructor(instance, self)
+        self._state_setter(instance, state)
+        return instance, state
+
     def setup_instance(
         self, instance: _O, state: Optional[InstanceState[_O]] = None
     ) -> None:
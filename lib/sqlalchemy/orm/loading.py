@@ -71,6 +71,10 @@ _T = TypeVar("_T", bound=Any)
 _O = TypeVar("_O", bound=object)
 _new_runid = util.counter()
 
+# the smallest chunk of rows for which new instances are created a chunk
+# at a time; see _bulk_instances() in _instance_processor()
+_BULK_INSTANCES_MIN_ROWS = 10
+
 
 _PopulatorDict = Dict[str, List[Tuple[str, Any]]]
 
@@ -176,7 +180,14 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
         labels, extra, _unique_filters=unique_filters
     )
 
+    # a single entity that loads plain columns only may supply a routine
+    # which processes an entire chunk of rows at once; it's looked up when
+    # the first chunk of at least _BULK_INSTANCES_MIN_ROWS rows arrives
+    bulk_process = None
+
     def chunks(size):  # type: ignore
+        nonlocal bulk_process
+
         while True:
             yield_per = size
 
@@ -192,7 +203,18 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
 
             if single_entity:
                 proc = process[0]
-                rows = [proc(row) for row in fetch]
+                rows = None
+                # slice rather than len(), so that small loads make no
+                # additional calls at all
+                if fetch[
+                    _BULK_INSTANCES_MIN_ROWS - 1 : _BULK_INSTANCES_MIN_ROWS
+                ]:
+                    if bulk_process is None:
+                        bulk_process = getattr(proc, "_bulk_instances", False)
+                    if bulk_process:
+                        rows = bulk_process(fetch)
+                if rows is None:
+                    rows = [proc(row) for row in fetch]
             else:
                 rows = [
                     tuple([proc(row) for proc in process]) for row in fetch
@@ -851,10 +873,18 @@ def _instance_processor(
         else:
             primary_key_getter = None
 
+        # columns that are delivered by a plain row getter, keyed on
+        # attribute key; when every column attribute is delivered this way,
+        # a single tuple getter can populate all of them at once for new
+        # objects
+        quick_cols = {}
+
         getters = {
             "cached_populators": cached_populators,
             "todo": todo,
             "primary_key_getter": primary_key_getter,
+            "quick_cols": quick_cols if refresh_state is None else None,
+            "quick_getter": None,
         }
         for prop in props:
             if prop in quick_populators:
@@ -899,11 +929,15 @@ def _instance_processor(
                         adapted_col = adapter.columns[col]
                         if adapted_col is not None:
                             getter = result._getter(adapted_col, False)
+                            if getter:
+                                col = adapted_col
                     if not getter:
                         getter = result._getter(col, False)
                     if getter:
                         cached_populators["quick"].append((prop.key, getter))
+                        quick_cols[prop.key] = col
                     else:
+                        getters["quick_cols"] = None
                         # fall back to the ColumnProperty itself, which
                         # will iterate through all of its columns
                         # to see if one fits
@@ -1180,6 +1214,140 @@ def _instance_processor(
 
         return instance
 
+    readonly_objects = context.readonly_objects and not refresh_state
+
+    if readonly_objects:
+        if populators["eager"] or post_load:
+            raise sa_exc.InvalidRequestError(
+                "The readonly_objects execution option can't be used with "
+                "eager loaders or with polymorphic loading that emits "
+                "additional SELECT statements"
+            )
+
+        # read-only snapshots; instances of the mapped class which have
+        # no InstanceState and aren't placed in the identity map.
+        # attributes that aren't delivered by the row are simply not
+        # present, including relationships.
+        class_ = mapper.class_
+        new_instance = class_.__new__
+        quick_populators = populators["quick"]
+
+        def _readonly_instance(row):
+            if is_not_primary_key(primary_key_getter(row)):
+                return None
+
+            instance = new_instance(class_)
+            dict_ = instance_dict(instance)
+            for key, getter in quick_populators:
+                dict_[key] = getter(row)
+            return instance
+
+        instance_fn = _readonly_instance
+    else:
+        instance_fn = _instance
+
+        if (
+            refresh_state is None
+            and getters["quick_cols"]
+            and not populate_existing
+            and not load_evt
+            and not persistent_evt
+            and post_load is None
+            and not populators["new"]
+            and not populators["existing"]
+            and not populators["eager"]
+            and not populators["deferred"]
+        ):
+            # column-only load with no events, eager loaders or
+            # populate_existing in play; newly created objects can be
+            # populated from a chunk of rows at once.  instances() uses
+            # this routine only for chunks of _BULK_INSTANCES_MIN_ROWS or
+            # more, so that small loads don't pay for its setup, which
+            # takes place on first use.  The routine returns None for a
+            # chunk that refers to a NULL primary key, to the same identity
+            # more than once or to objects already present in the identity
+            # map, in which case each row is processed by _instance(),
+            # which the routine doesn't refer to.
+            bulk_setup = None
+
+            def _bulk_instances(rows):
+                nonlocal bulk_setup
+
+                if bulk_setup is None:
+                    quick_cols = getters["quick_cols"]
+                    quick_keys = [key for key, getter in populators["quick"]]
+                    if len(quick_keys) != len(quick_cols):
+                        bulk_setup = False
+                    else:
+                        # the tuple getter is only produced for loads that
+                        # make use of it
+                        quick_getter = getters["quick_getter"]
+                        if quick_getter is None:
+                            quick_getter = getters[
+                                "quick_getter"
+                            ] = result._tuple_getter(
+                                [quick_cols[key] for key in quick_keys]
+                            )
+                        bulk_setup = (
+                            quick_keys,
+                            quick_getter,
+                            [
+                                key
+                                for key, set_callable in populators["expire"]
+                                if set_callable
+                            ],
+                            mapper.class_manager._new_instance_and_state,
+                        )
+                if not bulk_setup:
+                    return None
+                (
+                    quick_keys,
+                    quick_getter,
+                    expire_keys,
+                    new_instance,
+                ) = bulk_setup
+
+                primary_keys = list(map(primary_key_getter, rows))
+                if any(map(is_not_primary_key, primary_keys)):
+                    return None
+
+                # distinct identities that aren't in the identity map need
+                # no per-row lookups
+                identitykeys = [
+                    (identity_class, primary_key, identity_token)
+                    for primary_key in primary_keys
+                ]
+                if len(set(identitykeys)) != len(identitykeys):
+                    return None
+                elif not session_identity_map.keys().isdisjoint(identitykeys):
+                    return None
+
+                add_unpresent = session_identity_map._add_unpresent
+
+                instances = []
+                append = instances.append
+                for identitykey, values in zip(
+                    identitykeys, map(quick_getter, rows)
+                ):
+                    instance, state = new_instance()
+                    state.key = identitykey
+                    state.identity_token = identity_token
+                    state.session_id = session_id
+                    add_unpresent(state, identitykey)
+
+                    state.runid = runid
+                    state.load_options = propagated_loader_options
+                    state.load_path = load_path
+
+                    instance_dict(instance).update(zip(quick_keys, values))
+                    if expire_keys:
+                        state.expired_attributes.update(expire_keys)
+
+                    append(instance)
+                return instances
+
+            _instance._bulk_instances = _bulk_instances
+
     if mapper.polymorphic_map and not _polymorphic_from and not refresh_state:
         # if we are doing polymorphic, dispatch to a different _instance()
         # method specific to the subclass mapper
@@ -1194,8 +1362,8 @@ def _instance_processor(
             else:
                 return None
 
-        _instance = _decorate_polymorphic_switch(
-            _instance,
+        instance_fn = _decorate_polymorphic_switch(
+            instance_fn,
             context,
             query_entity,
             mapper,
@@ -1206,7 +1374,7 @@ def _instance_processor(
             ensure_no_pk,
         )
 
-    return _instance
+    return instance_fn
 
 
 def _load_subclass_via_in(
@@ -1718,10 +1718,12 @@ class Query(
         no_parameters: bool = False,
         stream_results: bool = False,
         max_row_buffer: int = ...,
+        max_buffer_bytes: int = ...,
         yield_per: int = ...,
         insertmanyvalues_page_size: int = ...,
         schema_translate_map: Optional[SchemaTranslateMapType] = ...,
         populate_existing: bool = False,
+        readonly_objects: bool = False,
         autoflush: bool = False,
         **opt: Any,
     ) -> Self:
@@ -1412,6 +1412,7 @@ class Session(_SessionClassMethods, EventTarget):
     enable_baked_queries: bool
     twophase: bool
     join_transaction_mode: JoinTransactionMode
+    pipeline_flush: bool
     _query_cls: Type[Query[Any]]
 
     def __init__(
@@ -1429,6 +1430,7 @@ class Session(_SessionClassMethods, EventTarget):
         query_cls: Optional[Type[Query[Any]]] = None,
         autocommit: Literal[False] = False,
         join_transaction_mode: JoinTransactionMode = "conditional_savepoint",
+        pipeline_flush: bool = False,
     ):
         r"""Construct a new :class:`_orm.Session`.
 
@@ -1636,6 +1638,23 @@ class Session(_SessionClassMethods, EventTarget):
 
           .. versionadded:: 2.0.0rc1
 
+        :param pipeline_flush: When ``True``, the :meth:`_orm.Session.flush`
+          process will run the statements it emits within
+          :meth:`_engine.Connection.pipeline` for each connection in use,
+          for those dialects which support pipelined execution.  INSERT
+          statements for objects whose primary key values are known ahead
+          of time, and which don't otherwise need RETURNING, are then sent
+          without waiting for each one to complete, which reduces the time
+          taken by the flush over high latency network connections.  As
+          errors are only received when the pipeline is synchronized, a
+          failed statement may be reported by a later statement in the flush.
+
+          .. versionadded:: 2.0.19
+
+          .. seealso::
+
+            :ref:`postgresql_psycopg_pipeline`
+
 
         """  # noqa
 
@@ -1678,6 +1697,7 @@ class Session(_SessionClassMethods, EventTarget):
                 f'"{join_transaction_mode}"'
             )
         self.join_transaction_mode = join_transaction_mode
+        self.pipeline_flush = pipeline_flush
 
         self.twophase = twophase
         self._query_cls = query_cls if query_cls else query.Query
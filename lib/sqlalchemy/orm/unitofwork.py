@@ -17,8 +17,11 @@ organizes them in order of dependency, and executes.
 
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import Set
 from typing import TYPE_CHECKING
@@ -453,6 +456,31 @@ class UOWTransaction:
         # print "\nCOUNT OF POSTSORT ACTIONS", len(postsort_actions)
 
         # execute
+        if self.session.pipeline_flush:
+            with self._pipelines():
+                self._execute_actions(postsort_actions)
+        else:
+            self._execute_actions(postsort_actions)
+
+    @contextlib.contextmanager
+    def _pipelines(self) -> Iterator[None]:
+        """Establish Connection.pipeline() for each connection the
+        flush will use."""
+
+        if self.session.connection_callable:
+            # connections are chosen per object
+            yield
+            return
+
+        with contextlib.ExitStack() as stack:
+            for connection in util.unique_list(
+                self.transaction.connection(mapper.base_mapper)
+                for mapper in self.mappers
+            ):
+                stack.enter_context(connection.pipeline())
+            yield
+
+    def _execute_actions(self, postsort_actions: List[PostSortRec]) -> None:
         if self.cycles:
             for subset in topological.sort_as_subsets(
                 self.dependencies, postsort_actions
@@ -11,10 +11,13 @@
 """
 from __future__ import annotations
 
+import asyncio
 import threading
+import time
 import traceback
 import typing
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import List
 from typing import Optional
@@ -41,6 +44,10 @@ from ..util.typing import Literal
 if typing.TYPE_CHECKING:
     from ..engine.interfaces import DBAPIConnection
 
+# stands in for a replenisher that couldn't be started, so that checkouts
+# don't attempt to start one again
+_NO_REPLENISHER = util.symbol("NO_REPLENISHER")
+
 
 class QueuePool(Pool):
 
@@ -68,6 +75,8 @@ class QueuePool(Pool):
         max_overflow: int = 10,
         timeout: float = 30.0,
         use_lifo: bool = False,
+        min_idle: int = 0,
+        replenish_interval: float = 5.0,
         **kw: Any,
     ):
         r"""
@@ -118,6 +127,29 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param min_idle: the number of idle connections the pool should
+          keep open and ready for checkout, up to ``pool_size``.   When set
+          to a value greater than zero, a background replenisher is started
+          upon first checkout; this is a daemon thread, or an asyncio task
+          for :class:`.AsyncAdaptedQueuePool`, which starts no replenisher
+          when it's not used within an event loop.   Every
+          ``replenish_interval`` seconds the replenisher re-establishes
+          idle connections that were invalidated or which would exceed
+          :paramref:`_pool.Pool.recycle` before the next pass, and then opens
+          new connections until ``min_idle`` connections are idle.
+          Defaults to zero, meaning connections are only opened on demand.
+
+          .. versionadded:: 2.0.19
+
+          .. seealso::
+
+            :ref:`pool_min_idle`
+
+        :param replenish_interval: number of seconds between passes of the
+          background replenisher enabled by ``min_idle``.  Defaults to 5.
+
+          .. versionadded:: 2.0.19
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -130,17 +162,26 @@ class QueuePool(Pool):
         self._max_overflow = -1 if pool_size == 0 else max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._min_idle = min_idle
+        self._replenish_interval = replenish_interval
+        self._replenisher: Optional[Any] = None
+        self._replenisher_stop = threading.Event()
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
         try:
             self._pool.put(record, False)
         except sqla_queue.Full:
+            if self._stats is not None:
+                self._stats._incr("overflow_discarded")
             try:
                 record.close()
             finally:
                 self._dec_overflow()
 
     def _do_get(self) -> ConnectionPoolEntry:
+        if self._min_idle and self._replenisher is None:
+            self._start_replenisher()
+
         use_overflow = self._max_overflow > -1
 
         wait = use_overflow and self._overflow >= self._max_overflow
@@ -155,6 +196,8 @@ class QueuePool(Pool):
             if not wait:
                 return self._do_get()
             else:
+                if self._stats is not None:
+                    self._stats._incr("timeouts")
                 raise exc.TimeoutError(
                     "QueuePool limit of size %d overflow %d reached, "
                     "connection timed out, timeout %0.2f"
@@ -164,11 +207,18 @@ class QueuePool(Pool):
 
         if self._inc_overflow():
             try:
-                return self._create_connection()
+                rec = self._create_connection()
             except:
                 with util.safe_reraise():
                     self._dec_overflow()
                 raise
+            if (
+                self._stats is not None
+                and self._pool.maxsize
+                and self._overflow > 0
+            ):
+                self._stats._incr("overflow_created")
+            return rec
         else:
             return self._do_get()
 
@@ -191,6 +241,132 @@ class QueuePool(Pool):
             self._overflow -= 1
             return True
 
+    def warm(self, n: Optional[int] = None) -> int:
+        """Open new connections ahead of time so that at least ``n``
+        connections are idle in the pool, returning the number of
+        connections that were opened.
+
+        :param n: number of idle connections to ensure.  Defaults to
+         the :paramref:`.QueuePool.min_idle` setting.  The pool does not
+         grow beyond its ``pool_size`` as a result of this method.
+
+        For :class:`.AsyncAdaptedQueuePool`, this method must be invoked
+        from within the greenlet context used by SQLAlchemy's asyncio
+        extension, in the same way as :meth:`_pool.Pool.connect`.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :ref:`pool_min_idle`
+
+        """
+        if n is None:
+            n = self._min_idle
+        if self._pool.maxsize:
+            n = min(n, self._pool.maxsize)
+
+        created = 0
+        while (
+            self._pool.qsize() < n
+            and (not self._pool.maxsize or self._overflow < 0)
+            and self._inc_overflow()
+        ):
+            try:
+                rec = self._create_connection()
+            except:
+                with util.safe_reraise():
+                    self._dec_overflow()
+                raise
+            self._do_return_conn(rec)
+            created += 1
+        return created
+
+    def _replenish(self) -> None:
+        """Re-establish idle connections that are invalidated or close to
+        their recycle time, then open new ones up to ``min_idle``."""
+
+        next_pass = time.time() + self._replenish_interval
+
+        # take out only the idle connections that need to be
+        # re-established, leaving the others available for checkout
+        def needs_refresh(rec: Any) -> bool:
+            return bool(
+                rec._is_hard_or_soft_invalidated()
+                or rec._is_due_for_recycle(next_pass)
+            )
+
+        stale: List[_ConnectionRecord] = []
+        expiring: List[_ConnectionRecord] = []
+        for rec in cast(
+            List[_ConnectionRecord], self._pool.remove_matching(needs_refresh)
+        ):
+            if rec._is_hard_or_soft_invalidated():
+                stale.append(rec)
+            else:
+                expiring.append(rec)
+
+        for rec in stale:
+            self._refresh_idle(rec)
+
+        # connections that expire soon are recycled one at a time, within
+        # the limit of max_concurrent_recycles
+        recycle_slots = self._recycle_slots
+        for rec in expiring:
+            if recycle_slots is None:
+                self._refresh_idle(rec)
+            elif recycle_slots.acquire(False):
+                try:
+                    self._refresh_idle(rec)
+                finally:
+                    recycle_slots.release()
+            else:
+                self._do_return_conn(rec)
+
+        self.warm()
+
+    def _refresh_idle(self, rec: _ConnectionRecord) -> None:
+        try:
+            rec._refresh()
+        except Exception:
+            self.logger.error(
+                "Error re-establishing idle connection", exc_info=True
+            )
+        self._do_return_conn(rec)
+
+    def _start_replenisher(self) -> None:
+        with self._overflow_lock:
+            if self._replenisher is not None:
+                return
+            self._replenisher = self._create_replenisher(
+                weakref.ref(self),
+                self._replenisher_stop,
+                self._replenish_interval,
+            )
+
+    def _create_replenisher(
+        self,
+        ref: Callable[[], Optional[QueuePool]],
+        stop: threading.Event,
+        interval: float,
+    ) -> Any:
+        thread = threading.Thread(
+            target=_replenish_in_thread,
+            args=(ref, stop, interval),
+            name="sqlalchemy-pool-replenisher",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    def _stop_replenisher(self) -> None:
+        # the pool may continue to be used after dispose(), so a new
+        # replenisher is started with a new event on the next checkout
+        with self._overflow_lock:
+            self._replenisher_stop.set()
+            self._replenisher_stop = threading.Event()
+            self._replenisher = None
+
     def recreate(self) -> QueuePool:
         self.logger.info("Pool recreating")
         return self.__class__(
@@ -198,9 +374,15 @@ class QueuePool(Pool):
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             pre_ping=self._pre_ping,
+            pre_ping_idle_threshold=self._pre_ping_idle_threshold,
+            statistics=self._stats,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
+            min_idle=self._min_idle,
+            replenish_interval=self._replenish_interval,
             recycle=self._recycle,
+            recycle_jitter=self._recycle_jitter,
+            max_concurrent_recycles=self._max_concurrent_recycles,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
@@ -209,6 +391,8 @@ class QueuePool(Pool):
         )
 
     def dispose(self) -> None:
+        self._stop_replenisher()
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -248,6 +432,40 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _replenish_in_thread(
+    ref: Callable[[], Optional[QueuePool]],
+    stop: threading.Event,
+    interval: float,
+) -> None:
+    while not stop.is_set():
+        pool = ref()
+        if pool is None:
+            return
+        try:
+            pool._replenish()
+        except Exception:
+            pool.logger.error("Error replenishing pool", exc_info=True)
+        del pool
+        stop.wait(interval)
+
+
+async def _replenish_in_task(
+    ref: Callable[[], Optional[QueuePool]],
+    stop: threading.Event,
+    interval: float,
+) -> None:
+    while not stop.is_set():
+        pool = ref()
+        if pool is None:
+            return
+        try:
+            await util.greenlet_spawn(pool._replenish)
+        except Exception:
+            pool.logger.error("Error replenishing pool", exc_info=True)
+        del pool
+        await asyncio.sleep(interval)
+
+
 class AsyncAdaptedQueuePool(QueuePool):
     _is_asyncio = True  # type: ignore[assignment]
     _queue_class: Type[
@@ -256,6 +474,31 @@ class AsyncAdaptedQueuePool(QueuePool):
 
     _dialect = _AsyncConnDialect()
 
+    def _create_replenisher(
+        self,
+        ref: Callable[[], Optional[QueuePool]],
+        stop: threading.Event,
+        interval: float,
+    ) -> Any:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop, as when the fallback queue is used
+            # synchronously; the pool's queue can't be used from another
+            # thread, so there's no replenisher
+            return _NO_REPLENISHER
+        return loop.create_task(_replenish_in_task(ref, stop, interval))
+
+    def _stop_replenisher(self) -> None:
+        task = self._replenisher
+        super()._stop_replenisher()
+        if isinstance(task, asyncio.Task) and not task.done():
+            try:
+                task.cancel()
+            except RuntimeError:
+                # event loop already closed
+                pass
+
 
 class FallbackAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
     _queue_class = sqla_queue.FallbackAsyncAdaptedQueue
@@ -289,10 +532,14 @@ class NullPool(Pool):
         return self.__class__(
             self._creator,
             recycle=self._recycle,
+            recycle_jitter=self._recycle_jitter,
+            max_concurrent_recycles=self._max_concurrent_recycles,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_idle_threshold=self._pre_ping_idle_threshold,
+            statistics=self._stats,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -352,8 +599,12 @@ class SingletonThreadPool(Pool):
             self._creator,
             pool_size=self.size,
             recycle=self._recycle,
+            recycle_jitter=self._recycle_jitter,
+            max_concurrent_recycles=self._max_concurrent_recycles,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_idle_threshold=self._pre_ping_idle_threshold,
+            statistics=self._stats,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             _dispatch=self.dispatch,
@@ -452,8 +703,12 @@ class StaticPool(Pool):
         return self.__class__(
             creator=self._creator,
             recycle=self._recycle,
+            recycle_jitter=self._recycle_jitter,
+            max_concurrent_recycles=self._max_concurrent_recycles,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_idle_threshold=self._pre_ping_idle_threshold,
+            statistics=self._stats,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
@@ -526,7 +781,11 @@ class AssertionPool(Pool):
             self._creator,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_idle_threshold=self._pre_ping_idle_threshold,
+            statistics=self._stats,
             recycle=self._recycle,
+            recycle_jitter=self._recycle_jitter,
+            max_concurrent_recycles=self._max_concurrent_recycles,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
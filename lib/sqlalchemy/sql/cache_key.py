@@ -30,6 +30,7 @@ from .visitors import prefix_anon_map
 from .. import util
 from ..inspection import inspect
 from ..util import HasMemoized
+from ..util._has_cy import HAS_CYEXTENSION
 from ..util.typing import Literal
 from ..util.typing import Protocol
 
@@ -329,6 +330,35 @@ class HasCacheKey:
                         )
         return result
 
+    def _gen_static_cache_key_fragment(
+        self,
+    ) -> Union[Tuple[Any, ...], None, Literal[CacheConst.NO_CACHE]]:
+        """generate the cache key for this element standalone, not
+        including its leading anon_map index, for use by elements that
+        memoize it.
+
+        Returns None if the key makes use of bound parameters or anonymous
+        names, which are specific to the statement being keyed, and NO_CACHE
+        if the element can't be cached at all.
+
+        """
+        anon_map_ = anon_map()
+        bindparams: List[BindParameter[Any]] = []
+
+        key = HasCacheKey._gen_cache_key(self, anon_map_, bindparams)
+        if NO_CACHE in anon_map_:
+            return NO_CACHE
+        elif (
+            key is None
+            or bindparams
+            # anonymous names are keyed on strings, object identities on
+            # ints
+            or not all(isinstance(k, int) for k in anon_map_)
+        ):
+            return None
+        else:
+            return key[1:]
+
     def _generate_cache_key(self) -> Optional[CacheKey]:
         """return a cache key.
 
@@ -386,6 +416,16 @@ class HasCacheKey:
             return CacheKey(key, bindparams)
 
 
+_py_gen_cache_key = HasCacheKey._gen_cache_key
+
+if not typing.TYPE_CHECKING and HAS_CYEXTENSION:
+    # compiled version of the traversal in HasCacheKey._gen_cache_key();
+    # the Python version above remains the implementation of reference
+    from sqlalchemy.cyextension.util import _gen_cache_key
+
+    HasCacheKey._gen_cache_key = _gen_cache_key
+
+
 class HasCacheKeyTraverse(HasTraverseInternals, HasCacheKey):
     pass
 
@@ -78,6 +78,7 @@ from .elements import ClauseElement
 from .elements import quoted_name
 from .schema import Column
 from .sqltypes import TupleType
+from .type_api import _BatchProcessor
 from .type_api import TypeEngine
 from .visitors import prefix_anon_map
 from .visitors import Visitable
@@ -112,6 +113,7 @@ if typing.TYPE_CHECKING:
     from .selectable import ReturnsRows
     from .selectable import Select
     from .selectable import SelectState
+    from .type_api import _BindBatchProcessorType
     from .type_api import _BindProcessorType
     from .type_api import _SentinelProcessorType
     from ..engine.cursor import CursorResultMetaData
@@ -762,6 +764,13 @@ class Compiled:
 
     _cached_metadata: Optional[CursorResultMetaData] = None
 
+    _cached_metadata_by_description: Optional[
+        Dict[Tuple[Any, ...], CursorResultMetaData]
+    ] = None
+    """result metadata that's not positionally safe to cache, such as
+    that of a textual "SELECT *", keyed on the cursor.description it was
+    built from."""
+
     _result_columns: Optional[List[ResultColumnsEntry]] = None
 
     schema_translate_map: Optional[SchemaTranslateMapType] = None
@@ -1228,6 +1237,23 @@ class SQLCompiler(Compiled):
 
     """
 
+    _expanding_array_types: Mapping[
+        BindParameter[Any], TypeEngine[Any]
+    ] = util.EMPTY_DICT
+    """Expanding parameters which a dialect compiler may choose to send as
+    a single array value, mapped to the array type used to process them.
+
+    When an expanding parameter present here is sent as an array,
+    :meth:`.SQLCompiler._literal_execute_expanding_parameter` returns it as
+    a single parameter under the parameter's own name.
+
+    """
+
+    _padded_statements: Optional[Dict[Tuple[Any, ...], str]] = None
+    """When the dialect uses ``in_clause_padding``, memoized "expanded"
+    SQL strings keyed on the number of elements in each expanding
+    parameter."""
+
     _pre_expanded_string: Optional[str] = None
     """Stores the original string SQL before 'post_compile' is applied,
     for cases where 'post_compile' were used.
@@ -1781,6 +1807,16 @@ class SQLCompiler(Compiled):
             if value is not None
         }
 
+    @util.memoized_property
+    def _bind_batch_processors(
+        self,
+    ) -> Mapping[str, _BindBatchProcessorType[Any]]:
+        return {
+            key: value.process_batch
+            for key, value in self._bind_processors.items()
+            if isinstance(value, _BatchProcessor)
+        }
+
     @util.memoized_property
     def _imv_sentinel_value_resolvers(
         self,
@@ -2043,6 +2079,14 @@ class SQLCompiler(Compiled):
         else:
             new_positiontup = pre_expanded_positiontup = None
 
+        # when padding IN lists to buckets, the expanded SQL string for a
+        # given set of list lengths is always the same and may be reused,
+        # as long as no values are rendered inline
+        padding = self.dialect.in_clause_padding
+        padded_key: Optional[List[Any]] = (
+            [] if padding and not self.literal_execute_params else None
+        )
+
         processors = self._bind_processors
         single_processors = cast(
             "Mapping[str, _BindProcessorType[Any]]", processors
@@ -2107,11 +2151,22 @@ class SQLCompiler(Compiled):
                     # in the escaped_bind_names dictionary.
                     values = parameters.pop(name)
 
+                    if (
+                        padding
+                        and values
+                        and parameter.expand_op
+                        in (operators.in_op, operators.not_in_op)
+                    ):
+                        values = self._pad_in_parameter_values(values)
+
                     leep_res = self._literal_execute_expanding_parameter(
                         escaped_name, parameter, values
                     )
                     (to_update, replacement_expr) = leep_res
 
+                    if padded_key is not None:
+                        padded_key.append((len(values), len(to_update)))
+
                     to_update_sets[escaped_name] = to_update
                     replacement_expressions[escaped_name] = replacement_expr
 
@@ -2129,6 +2184,16 @@ class SQLCompiler(Compiled):
                             if name in tuple_processors
                             and tuple_processors[name][j - 1] is not None
                         )
+                    elif (
+                        parameter in self._expanding_array_types
+                        and to_update
+                        and to_update[0][0] == escaped_name
+                    ):
+                        array_processor = self._expanding_array_types[
+                            parameter
+                        ]._cached_bind_processor(self.dialect)
+                        if array_processor is not None:
+                            new_processors[escaped_name] = array_processor
                     else:
                         new_processors.update(
                             (key, single_processors[name])
@@ -2165,22 +2230,38 @@ class SQLCompiler(Compiled):
                 )
             return expr
 
-        statement = re.sub(
-            self._post_compile_pattern, process_expanding, pre_expanded_string
-        )
+        statement: Optional[str] = None
+        if padded_key is not None:
+            if self._padded_statements is None:
+                self._padded_statements = {}
+            padded_statements = self._padded_statements
+            statement_key = tuple(padded_key)
+            statement = padded_statements.get(statement_key)
+
+        if statement is None:
+            statement = re.sub(
+                self._post_compile_pattern,
+                process_expanding,
+                pre_expanded_string,
+            )
+
+            if numeric_positiontup is not None:
+                param_pos = {
+                    key: f"{self._numeric_binds_identifier_char}{num}"
+                    for num, key in enumerate(
+                        numeric_positiontup, self.next_numeric_pos
+                    )
+                }
+                # Can't use format here since % chars are not escaped.
+                statement = self._pyformat_pattern.sub(
+                    lambda m: param_pos[m.group(1)], statement
+                )
+
+            if padded_key is not None:
+                padded_statements[statement_key] = statement
 
         if numeric_positiontup is not None:
             assert new_positiontup is not None
-            param_pos = {
-                key: f"{self._numeric_binds_identifier_char}{num}"
-                for num, key in enumerate(
-                    numeric_positiontup, self.next_numeric_pos
-                )
-            }
-            # Can't use format here since % chars are not escaped.
-            statement = self._pyformat_pattern.sub(
-                lambda m: param_pos[m.group(1)], statement
-            )
             new_positiontup.extend(numeric_positiontup)
 
         expanded_state = ExpandedState(
@@ -3196,6 +3277,19 @@ class SQLCompiler(Compiled):
 
         return (), replacement_expression
 
+    def _pad_in_parameter_values(self, values):
+        """pad a list of IN values up to the next power of two by repeating
+        the last value, so that a statement renders a limited number of
+        distinct IN lists."""
+
+        length = len(values)
+        bucket = 1 << (length - 1).bit_length()
+        if bucket == length:
+            return values
+        values = list(values)
+        values.extend([values[-1]] * (bucket - length))
+        return values
+
     def _literal_execute_expanding_parameter(self, name, parameter, values):
         if parameter.literal_execute:
             return self._literal_execute_expanding_parameter_literal_binds(
@@ -5675,6 +5769,9 @@ class SQLCompiler(Compiled):
         else:
             crud_params_single = crud_params_struct.single_params
 
+        if toplevel:
+            self._insert_crud_params = crud_params_single
+
         preparer = self.preparer
         supports_default_values = self.dialect.supports_default_values
 
@@ -66,6 +66,7 @@ from .base import DedupeColumnCollection
 from .base import DialectKWArgs
 from .base import Executable
 from .base import SchemaEventTarget as SchemaEventTarget
+from .cache_key import NO_CACHE
 from .coercions import _document_text_coercion
 from .elements import ClauseElement
 from .elements import ColumnClause
@@ -2231,6 +2232,67 @@ class Column(DialectKWArgs, SchemaItem, ColumnClause[_T]):
         """
         return self.table is not None and self.table._is_table
 
+    _static_cache_key_memo: Optional[
+        Tuple[TypeEngine[Any], Union[Tuple[Any, ...], None, Any]]
+    ] = None
+
+    def _gen_cache_key(
+        self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
+    ) -> Optional[Tuple[Any, ...]]:
+        # the cache key of a column that's part of a Table doesn't change
+        # from one statement to the next, so generate it only once.  the
+        # type may however be replaced after the fact, such as when a
+        # ForeignKey resolves the type of its parent column.
+        if not isinstance(self.table, Table):
+            return super()._gen_cache_key(anon_map, bindparams)
+
+        memo = self._static_cache_key_memo
+        if memo is None or memo[0] is not self.type:
+            memo = self._set_static_cache_key_memo()
+
+        fragment = memo[1]
+        if fragment is None:
+            return super()._gen_cache_key(anon_map, bindparams)
+        elif fragment is NO_CACHE:
+            anon_map[NO_CACHE] = True
+            return None
+
+        id_, found = anon_map.get_anon(self)
+        if found:
+            return (id_, self.__class__)
+        elif self._annotations:
+            return (
+                (id_, self.__class__) + fragment + self._annotations_cache_key
+            )
+        else:
+            return (id_, self.__class__) + fragment
+
+    def _set_static_cache_key_memo(
+        self,
+    ) -> Tuple[TypeEngine[Any], Union[Tuple[Any, ...], None, Any]]:
+        """memoize the cache key of this column without its leading
+        anon_map index, class and annotations, so that annotated copies,
+        which carry a copy of the __dict__ of the column, can share it.
+
+        """
+        base = self.__dict__.get("_Annotated__element", self)
+        memo = base._static_cache_key_memo
+        if memo is None or memo[0] is not base.type:
+            fragment = base._gen_static_cache_key_fragment()
+            if fragment is not None and fragment is not NO_CACHE:
+                fragment = fragment[1:]
+            memo = base.__dict__["_static_cache_key_memo"] = (
+                base.type,
+                fragment,
+            )
+
+        if memo[0] is not self.type:
+            # an annotated copy made before the type of the column was
+            # replaced; generate its key in full
+            memo = (self.type, None)
+        self.__dict__["_static_cache_key_memo"] = memo
+        return memo
+
     def _extra_kwargs(self, **kwargs: Any) -> None:
         self._validate_dialect_kwargs(kwargs)
 
@@ -144,6 +144,7 @@ if TYPE_CHECKING:
     from .sqltypes import TableValueType
     from .type_api import TypeEngine
     from .visitors import _CloneCallableType
+    from .visitors import anon_map
 
 
 _ColumnsClauseElement = Union["FromClause", ColumnElement[Any], "TextClause"]
@@ -1226,6 +1227,87 @@ class Join(roles.DMLTableRole, FromClause):
         self.isouter = isouter
         self.full = full
 
+    @HasMemoized.memoized_attribute
+    @util.preload_module("sqlalchemy.sql.schema")
+    def _static_cache_key_columns(self) -> Optional[List[ColumnClause[Any]]]:
+        """the columns within the ON clauses of this join, if it's a join
+        among :class:`_schema.Table` objects and other such joins only, with
+        no bound parameters, else None.
+
+        The cache key of a :class:`_schema.Table` is keyed on its identity,
+        so of such a join only the types of the columns in the ON clauses
+        may change once it's created.   A :class:`_expression.TableClause`
+        is keyed on its columns, which may be appended to, and bound
+        parameters are specific to each statement.  An :class:`.Alias`,
+        named or not, is keyed on its position among the other aliases of
+        the statement, which a key generated apart from the statement
+        can't refer to.
+
+        """
+        Table = util.preloaded.sql_schema.Table
+
+        columns: List[ColumnClause[Any]] = []
+        for side in (self.left, self.right):
+            if isinstance(side, Join):
+                side_columns = side._static_cache_key_columns
+                if side_columns is None:
+                    return None
+                columns.extend(side_columns)
+            elif not isinstance(side, Table):
+                return None
+
+        for elem in visitors.iterate(self.onclause):
+            if isinstance(elem, BindParameter):
+                return None
+            elif isinstance(elem, ColumnClause):
+                columns.append(elem)
+        return columns
+
+    @HasMemoized.memoized_attribute
+    def _static_cache_key_memo(
+        self,
+    ) -> Tuple[
+        List[TypeEngine[Any]],
+        Union[Tuple[Any, ...], None, Literal[cache_key.CacheConst.NO_CACHE]],
+    ]:
+        columns = self._static_cache_key_columns
+        assert columns is not None
+        return (
+            [col.type for col in columns],
+            self._gen_static_cache_key_fragment(),
+        )
+
+    def _gen_cache_key(
+        self, anon_map: anon_map, bindparams: List[BindParameter[Any]]
+    ) -> Optional[Tuple[Any, ...]]:
+        # a join between tables on criteria that includes no bound
+        # parameters has the same cache key in every statement, so
+        # generate it only once.  the type of a column in the ON clause
+        # may however be replaced after the fact, such as when a
+        # ForeignKey resolves the type of its parent column
+        if self._annotations:
+            return super()._gen_cache_key(anon_map, bindparams)
+
+        columns = self._static_cache_key_columns
+        if columns is None:
+            return super()._gen_cache_key(anon_map, bindparams)
+
+        types, fragment = self._static_cache_key_memo
+        if any(col.type is not type_ for col, type_ in zip(columns, types)):
+            del self.__dict__["_static_cache_key_memo"]
+            types, fragment = self._static_cache_key_memo
+
+        if fragment is None:
+            return super()._gen_cache_key(anon_map, bindparams)
+        elif fragment is cache_key.NO_CACHE:
+            anon_map[cache_key.NO_CACHE] = True
+            return None
+
+        id_, found = anon_map.get_anon(self)
+        if found:
+            return (id_, self.__class__)
+        return (id_,) + fragment
+
     @util.ro_non_memoized_property
     def description(self) -> str:
         return "Join object on %s(%d) and %s(%d)" % (
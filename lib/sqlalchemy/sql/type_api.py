@@ -99,6 +99,53 @@ class _SentinelProcessorType(Protocol[_T_co]):
         ...
 
 
+class _BindBatchProcessorType(Protocol[_T_con]):
+    def __call__(self, values: Sequence[Optional[_T_con]]) -> Sequence[Any]:
+        ...
+
+
+class _ResultBatchProcessorType(Protocol[_T_co]):
+    def __call__(self, values: Sequence[Any]) -> Sequence[Optional[_T_co]]:
+        ...
+
+
+class _BatchProcessor:
+    """A bind or result processor for a type that also supports
+    processing a sequence of values at once.
+
+    This is what's returned by ``_cached_bind_processor()`` and
+    ``_cached_result_processor()`` for a type that implements
+    :meth:`.TypeEngine.bind_batch_processor` or
+    :meth:`.TypeEngine.result_batch_processor`.  It's called for a single
+    value like any other processor, while the execution and result fetching
+    paths that deal with many rows at once look for it in order to call
+    ``process_batch`` with all the values of a column.
+
+    """
+
+    __slots__ = ("process", "process_batch")
+
+    def __init__(
+        self,
+        process: Optional[Callable[[Any], Any]],
+        process_batch: Union[
+            _BindBatchProcessorType[Any], _ResultBatchProcessorType[Any]
+        ],
+    ):
+        if process is None:
+
+            def process_one(value: Any) -> Any:
+                return process_batch((value,))[0]
+
+            process = process_one
+
+        self.process = process
+        self.process_batch = process_batch
+
+    def __call__(self, value: Any) -> Any:
+        return self.process(value)
+
+
 class _BaseTypeMemoDict(TypedDict):
     impl: TypeEngine[Any]
     result: Dict[Any, Optional[_ResultProcessorType[Any]]]
@@ -497,6 +544,71 @@ class TypeEngine(Visitable, Generic[_T]):
         """
         return None
 
+    def bind_batch_processor(
+        self, dialect: Dialect
+    ) -> Optional[_BindBatchProcessorType[_T]]:
+        """Return a conversion function for processing a sequence of bind
+        values at once.
+
+        Returns a callable which will receive a sequence of bind parameter
+        values for the same parameter, one for each parameter set of an
+        "executemany" operation, and will return a sequence of the same
+        length containing the values to send to the DB-API.  When present,
+        it's used in place of the function returned by
+        :meth:`_types.TypeEngine.bind_processor` when a statement is
+        executed with many parameter sets, including with
+        :meth:`_engine.Connection.execute_columnar`.
+
+        If batch processing is not supported, the method should return
+        ``None``, which is the default.  A type that returns a batch
+        processor but no per-value processor from
+        :meth:`_types.TypeEngine.bind_processor` will have single values
+        processed by calling the batch processor with a sequence of one
+        value.
+
+        As is the case for :meth:`_types.TypeEngine.bind_processor`,
+        custom behavior is normally provided by implementing
+        :meth:`_types.TypeDecorator.process_bind_batch`.
+
+        :param dialect: Dialect instance in use.
+
+        .. versionadded:: 2.0.19
+
+        """
+        return None
+
+    def result_batch_processor(
+        self, dialect: Dialect, coltype: object
+    ) -> Optional[_ResultBatchProcessorType[_T]]:
+        """Return a conversion function for processing a sequence of
+        result values at once.
+
+        Returns a callable which will receive a sequence of values for the
+        same result column, one for each of a group of rows fetched from the
+        cursor, and will return a sequence of the same length containing the
+        values to return to the user.  When present, it's used in place of
+        the function returned by :meth:`_types.TypeEngine.result_processor`
+        for rows fetched by a :class:`_engine.CursorResult`, which will call
+        it once for each group of rows fetched from the DBAPI cursor, such as
+        each partition when using
+        :paramref:`_engine.Connection.execution_options.yield_per`.
+
+        If batch processing is not supported, the method should return
+        ``None``, which is the default.
+
+        As is the case for :meth:`_types.TypeEngine.result_processor`,
+        custom behavior is normally provided by implementing
+        :meth:`_types.TypeDecorator.process_result_batch`.
+
+        :param dialect: Dialect instance in use.
+
+        :param coltype: DBAPI coltype argument received in cursor.description.
+
+        .. versionadded:: 2.0.19
+
+        """
+        return None
+
     def column_expression(
         self, colexpr: ColumnElement[_T]
     ) -> Optional[ColumnElement[_T]]:
@@ -940,7 +1052,12 @@ class TypeEngine(Visitable, Generic[_T]):
         # avoid KeyError context coming into bind_processor() function
         # raises
         d = self._dialect_info(dialect)
-        d["bind"] = bp = d["impl"].bind_processor(dialect)
+        impl = d["impl"]
+        bp = impl.bind_processor(dialect)
+        bbp = impl.bind_batch_processor(dialect)
+        if bbp is not None:
+            bp = _BatchProcessor(bp, bbp)
+        d["bind"] = bp
         return bp
 
     def _cached_result_processor(
@@ -959,7 +1076,11 @@ class TypeEngine(Visitable, Generic[_T]):
         # key assumption: DBAPI type codes are
         # constants.  Else this dictionary would
         # grow unbounded.
-        rp = d["impl"].result_processor(dialect, coltype)
+        impl = d["impl"]
+        rp = impl.result_processor(dialect, coltype)
+        brp = impl.result_batch_processor(dialect, coltype)
+        if brp is not None:
+            rp = _BatchProcessor(rp, brp)
         d["result"][coltype] = rp
         return rp
 
@@ -1969,6 +2090,71 @@ class TypeDecorator(SchemaEventTarget, ExternalType, TypeEngine[_T]):
 
         raise NotImplementedError()
 
+    def process_bind_batch(
+        self, values: Sequence[Optional[_T]], dialect: Dialect
+    ) -> Sequence[Any]:
+        """Receive a sequence of bound parameter values to be converted.
+
+        Custom subclasses of :class:`_types.TypeDecorator` may override this
+        method to convert all the values for a parameter in one call, rather
+        than one call per value as is the case for
+        :meth:`_types.TypeDecorator.process_bind_param`.  It's called when a
+        statement is executed with many parameter sets, such as an INSERT
+        given a list of dictionaries or one invoked using
+        :meth:`_engine.Connection.execute_columnar`, and is passed the values
+        of the parameter for every parameter set.  It should return a
+        sequence of converted values of the same length.
+
+        If :meth:`_types.TypeDecorator.process_bind_param` is not also
+        implemented, single values are converted by calling this method with
+        a sequence of one value.
+
+        :param values: sequence of data values to operate upon.  Individual
+         values can be ``None``.
+        :param dialect: the :class:`.Dialect` in use.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :meth:`_types.TypeDecorator.process_result_batch`
+
+        """
+
+        raise NotImplementedError()
+
+    def process_result_batch(
+        self, values: Sequence[Any], dialect: Dialect
+    ) -> Sequence[Optional[_T]]:
+        """Receive a sequence of result-row column values to be converted.
+
+        Custom subclasses of :class:`_types.TypeDecorator` may override this
+        method to convert the values of a result column for a group of rows
+        in one call, rather than one call per value as is the case for
+        :meth:`_types.TypeDecorator.process_result_value`.  It's called by
+        :class:`_engine.CursorResult` for each group of rows fetched from the
+        cursor, such as each partition when using
+        :paramref:`_engine.Connection.execution_options.yield_per`, and
+        should return a sequence of converted values of the same length.
+
+        When this method is implemented, it's used for all rows fetched by
+        a :class:`_engine.CursorResult`, including those fetched one at a
+        time, in place of :meth:`_types.TypeDecorator.process_result_value`.
+
+        :param values: sequence of data values to operate upon.  Individual
+         values can be ``None``.
+        :param dialect: the :class:`.Dialect` in use.
+
+        .. versionadded:: 2.0.19
+
+        .. seealso::
+
+            :meth:`_types.TypeDecorator.process_bind_batch`
+
+        """
+
+        raise NotImplementedError()
+
     @util.memoized_property
     def _has_bind_processor(self) -> bool:
         """memoized boolean, check if process_bind_param is implemented.
@@ -1983,6 +2169,14 @@ class TypeDecorator(SchemaEventTarget, ExternalType, TypeEngine[_T]):
             self, TypeDecorator.process_bind_param
         )
 
+    @util.memoized_property
+    def _has_bind_batch_processor(self) -> bool:
+        """memoized boolean, check if process_bind_batch is implemented."""
+
+        return util.method_is_overridden(
+            self, TypeDecorator.process_bind_batch
+        )
+
     @util.memoized_property
     def _has_literal_processor(self) -> bool:
         """memoized boolean, check if process_literal_param is implemented."""
@@ -2096,10 +2290,70 @@ class TypeDecorator(SchemaEventTarget, ExternalType, TypeEngine[_T]):
                 def process(value: Optional[_T]) -> Any:
                     return fixed_process_param(value, dialect)
 
+            return process
+        elif self._has_bind_batch_processor:
+            process_batch = self.bind_batch_processor(dialect)
+            assert process_batch is not None
+            fixed_process_batch = process_batch
+
+            def process(value: Optional[_T]) -> Any:
+                return fixed_process_batch((value,))[0]
+
             return process
         else:
             return self.impl_instance.bind_processor(dialect)
 
+    def bind_batch_processor(
+        self, dialect: Dialect
+    ) -> Optional[_BindBatchProcessorType[_T]]:
+        """Provide a function to process a sequence of bound values for the
+        given :class:`.Dialect`.
+
+        This is the method that fulfills the :class:`.TypeEngine`
+        contract for batched bound value conversion which normally occurs
+        via the :meth:`_types.TypeEngine.bind_batch_processor` method.
+
+        .. note::
+
+            User-defined subclasses of :class:`_types.TypeDecorator` should
+            **not** implement this method, and should instead implement
+            :meth:`_types.TypeDecorator.process_bind_batch` so that the
+            "inner" processing provided by the implementing type is
+            maintained.
+
+        :param dialect: Dialect instance in use.
+
+        .. versionadded:: 2.0.19
+
+        """
+        if self._has_bind_batch_processor:
+            process_batch = self.process_bind_batch
+            impl_batch = self.impl_instance.bind_batch_processor(dialect)
+            impl_processor = self.impl_instance.bind_processor(dialect)
+            if impl_batch:
+                fixed_impl_batch = impl_batch
+
+                def process(values: Sequence[Optional[_T]]) -> Sequence[Any]:
+                    return fixed_impl_batch(process_batch(values, dialect))
+
+            elif impl_processor:
+                fixed_impl_processor = impl_processor
+
+                def process(values: Sequence[Optional[_T]]) -> Sequence[Any]:
+                    processed = process_batch(values, dialect)
+                    return list(map(fixed_impl_processor, processed))
+
+            else:
+
+                def process(values: Sequence[Optional[_T]]) -> Sequence[Any]:
+                    return process_batch(values, dialect)
+
+            return process
+        elif self._has_bind_processor:
+            return None
+        else:
+            return self.impl_instance.bind_batch_processor(dialect)
+
     @util.memoized_property
     def _has_result_processor(self) -> bool:
         """memoized boolean, check if process_result_value is implemented.
@@ -2114,6 +2368,14 @@ class TypeDecorator(SchemaEventTarget, ExternalType, TypeEngine[_T]):
             self, TypeDecorator.process_result_value
         )
 
+    @util.memoized_property
+    def _has_result_batch_processor(self) -> bool:
+        """memoized boolean, check if process_result_batch is implemented."""
+
+        return util.method_is_overridden(
+            self, TypeDecorator.process_result_batch
+        )
+
     def result_processor(
         self, dialect: Dialect, coltype: Any
     ) -> Optional[_ResultProcessorType[_T]]:
@@ -2155,10 +2417,76 @@ class TypeDecorator(SchemaEventTarget, ExternalType, TypeEngine[_T]):
                 def process(value: Any) -> Optional[_T]:
                     return fixed_process_value(value, dialect)
 
+            return process
+        elif self._has_result_batch_processor:
+            process_batch = self.result_batch_processor(dialect, coltype)
+            assert process_batch is not None
+            fixed_process_batch = process_batch
+
+            def process(value: Any) -> Optional[_T]:
+                return fixed_process_batch((value,))[0]
+
             return process
         else:
             return self.impl_instance.result_processor(dialect, coltype)
 
+    def result_batch_processor(
+        self, dialect: Dialect, coltype: Any
+    ) -> Optional[_ResultBatchProcessorType[_T]]:
+        """Provide a function to process a sequence of result values for the
+        given :class:`.Dialect`.
+
+        This is the method that fulfills the :class:`.TypeEngine`
+        contract for batched result value conversion which normally occurs
+        via the :meth:`_types.TypeEngine.result_batch_processor` method.
+
+        .. note::
+
+            User-defined subclasses of :class:`_types.TypeDecorator` should
+            **not** implement this method, and should instead implement
+            :meth:`_types.TypeDecorator.process_result_batch` so that the
+            "inner" processing provided by the implementing type is
+            maintained.
+
+        :param dialect: Dialect instance in use.
+        :param coltype: A SQLAlchemy data type
+
+        .. versionadded:: 2.0.19
+
+        """
+        if self._has_result_batch_processor:
+            process_batch = self.process_result_batch
+            impl_batch = self.impl_instance.result_batch_processor(
+                dialect, coltype
+            )
+            impl_processor = self.impl_instance.result_processor(
+                dialect, coltype
+            )
+            if impl_batch:
+                fixed_impl_batch = impl_batch
+
+                def process(values: Sequence[Any]) -> Sequence[Optional[_T]]:
+                    return process_batch(fixed_impl_batch(values), dialect)
+
+            elif impl_processor:
+                fixed_impl_processor = impl_processor
+
+                def process(values: Sequence[Any]) -> Sequence[Optional[_T]]:
+                    return process_batch(
+                        list(map(fixed_impl_processor, values)), dialect
+                    )
+
+            else:
+
+                def process(values: Sequence[Any]) -> Sequence[Optional[_T]]:
+                    return process_batch(values, dialect)
+
+            return process
+        elif self._has_result_processor:
+            return None
+        else:
+            return self.impl_instance.result_batch_processor(dialect, coltype)
+
     @util.memoized_property
     def _has_bind_expression(self) -> bool:
         return (
@@ -10,7 +10,6 @@
 from __future__ import annotations
 
 import collections.abc as collections_abc
-import operator
 import threading
 import types
 import typing
@@ -481,10 +480,29 @@ def flatten_iterator(x: Iterable[_T]) -> Iterator[_T]:
             yield elem
 
 
+_LRU_MISSING = object()
+
+
 class LRUCache(typing.MutableMapping[_KT, _VT]):
     """Dictionary with 'squishy' removal of least
     recently used items.
 
+    Items are stored in a series of "segments", each a plain dictionary,
+    ordered from most to least recently used.  New and recently accessed
+    items go into the first segment; once that segment reaches
+    ``capacity * threshold`` items, a new, empty segment is added in front.
+    When the cache grows beyond ``capacity * (1 + threshold)`` items, the
+    least recently used items are discarded from the oldest segments,
+    dropping whole segments where possible, until ``capacity`` items
+    remain.  This avoids sorting the contents of the cache on each prune.
+
+    Lookups and assignments do not acquire a lock; pruning uses a
+    non-blocking lock so that only one thread does so at a time.
+
+    The ``hits``, ``misses`` and ``evictions`` counters track the outcome
+    of :meth:`.LRUCache.get` and of pruning; under concurrent
+    use they are approximate.
+
     Note that either get() or [] should be used here, but
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
@@ -495,14 +513,20 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         "capacity",
         "threshold",
         "size_alert",
-        "_data",
-        "_counter",
+        "hits",
+        "misses",
+        "evictions",
+        "_segment_size",
+        "_segments",
         "_mutex",
     )
 
     capacity: int
     threshold: float
     size_alert: Optional[Callable[[LRUCache[_KT, _VT]], None]]
+    hits: int
+    misses: int
+    evictions: int
 
     def __init__(
         self,
@@ -513,13 +537,10 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         self.capacity = capacity
         self.threshold = threshold
         self.size_alert = size_alert
-        self._counter = 0
+        self.hits = self.misses = self.evictions = 0
+        self._segment_size = max(1, int(capacity * threshold))
         self._mutex = threading.Lock()
-        self._data: Dict[_KT, Tuple[_KT, _VT, List[int]]] = {}
-
-    def _inc_counter(self):
-        self._counter += 1
-        return self._counter
+        self._segments: List[Dict[_KT, Any]] = [{}]
 
     @overload
     def get(self, key: _KT) -> Optional[_VT]:
@@ -532,58 +553,140 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
     def get(
         self, key: _KT, default: Optional[Union[_VT, _T]] = None
     ) -> Optional[Union[_VT, _T]]:
-        item = self._data.get(key, default)
-        if item is not default and item is not None:
-            item[2][0] = self._inc_counter()
-            return item[1]
-        else:
-            return default
+        segments = self._segments
+        recent = segments[0]
+        item = recent.get(key, _LRU_MISSING)
+        if item is not _LRU_MISSING:
+            self.hits += 1
+            return item  # type: ignore
+
+        for segment in segments[1:]:
+            item = segment.pop(key, _LRU_MISSING)
+            if item is not _LRU_MISSING:
+                # promote to the most recent segment
+                recent[key] = item
+                if len(recent) >= self._segment_size:
+                    self._manage_size()
+                self.hits += 1
+                return item  # type: ignore
+
+        self.misses += 1
+        return default
 
     def __getitem__(self, key: _KT) -> _VT:
-        item = self._data[key]
-        item[2][0] = self._inc_counter()
-        return item[1]
+        segments = self._segments
+        recent = segments[0]
+        item = recent.get(key, _LRU_MISSING)
+        if item is not _LRU_MISSING:
+            return item  # type: ignore
+
+        for segment in segments[1:]:
+            item = segment.pop(key, _LRU_MISSING)
+            if item is not _LRU_MISSING:
+                recent[key] = item
+                if len(recent) >= self._segment_size:
+                    self._manage_size()
+                return item  # type: ignore
+        raise KeyError(key)
 
     def __iter__(self) -> Iterator[_KT]:
-        return iter(self._data)
+        return iter(
+            {key: None for segment in self._segments for key in segment}
+        )
 
     def __len__(self) -> int:
-        return len(self._data)
+        return sum(len(segment) for segment in self._segments)
 
     def values(self) -> ValuesView[_VT]:
-        return typing.ValuesView({k: i[1] for k, i in self._data.items()})
+        return typing.ValuesView(
+            {
+                key: value
+                for segment in reversed(self._segments)
+                for key, value in segment.items()
+            }
+        )
 
     def __setitem__(self, key: _KT, value: _VT) -> None:
-        self._data[key] = (key, value, [self._inc_counter()])
-        self._manage_size()
+        segments = self._segments
+        recent = segments[0]
+        recent[key] = value
+        for segment in segments[1:]:
+            segment.pop(key, None)
+        if (
+            len(recent) >= self._segment_size
+            or len(self) > self.size_threshold
+        ):
+            self._manage_size()
 
     def __delitem__(self, __v: _KT) -> None:
-        del self._data[__v]
+        found = False
+        for segment in self._segments:
+            if segment.pop(__v, _LRU_MISSING) is not _LRU_MISSING:
+                found = True
+        if not found:
+            raise KeyError(__v)
+
+    def clear(self) -> None:
+        self._segments = [{}]
 
     @property
     def size_threshold(self) -> float:
         return self.capacity + self.capacity * self.threshold
 
+    def stats(self) -> Dict[str, int]:
+        """Return a dictionary of usage statistics for this cache.
+
+        The dictionary includes the keys ``"hits"``, ``"misses"``,
+        ``"evictions"``, ``"size"`` and ``"capacity"``.
+
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self),
+            "capacity": self.capacity,
+        }
+
     def _manage_size(self) -> None:
         if not self._mutex.acquire(False):
             return
         try:
-            size_alert = bool(self.size_alert)
-            while len(self) > self.capacity + self.capacity * self.threshold:
-                if size_alert:
-                    size_alert = False
-                    self.size_alert(self)  # type: ignore
-                by_counter = sorted(
-                    self._data.values(),
-                    key=operator.itemgetter(2),
-                    reverse=True,
-                )
-                for item in by_counter[self.capacity :]:
-                    try:
-                        del self._data[item[0]]
-                    except KeyError:
-                        # deleted elsewhere; skip
-                        continue
+            segments = self._segments
+            evicted = 0
+            size = sum(len(segment) for segment in segments)
+            if size > self.size_threshold:
+                # discard least recently used items down to "capacity";
+                # whole segments are dropped where possible, else the
+                # first items of the oldest segment, as each segment is
+                # ordered by insertion.  Lookups may pop keys from
+                # segments concurrently, so keys are copied out in one
+                # step and removed with pop().
+                excess = size - self.capacity
+                while excess > 0:
+                    oldest = segments[-1]
+                    if len(segments) > 1 and len(oldest) <= excess:
+                        segments = segments[:-1]
+                        excess -= len(oldest)
+                        evicted += len(oldest)
+                    else:
+                        for key in list(oldest)[:excess]:
+                            if oldest.pop(key, _LRU_MISSING) is not (
+                                _LRU_MISSING
+                            ):
+                                evicted += 1
+                        excess = 0
+
+            if len(segments[0]) >= self._segment_size:
+                # start a new most recent segment, dropping segments
+                # that promotions have left empty
+                segments = [{}] + [segment for segment in segments if segment]
+
+            self._segments = segments
+            if evicted:
+                self.evictions += evicted
+                if self.size_alert:
+                    self.size_alert(self)
         finally:
             self._mutex.release()
 
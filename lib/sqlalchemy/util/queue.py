@@ -17,6 +17,11 @@ rare cases be invoked within the ``get()`` method of the Queue itself,
 producing a ``put()`` inside the ``get()`` and therefore a reentrant
 condition.
 
+Unlike the standard library's Queue, ``get()`` doesn't acquire the mutex
+when an item is available and no other thread is waiting, and ``put()`` hands
+items directly to threads waiting in ``get()`` in first-in-first-out order,
+rather than notifying a condition that any thread may win.
+
 """
 from __future__ import annotations
 
@@ -27,8 +32,10 @@ from time import time as _time
 import typing
 from typing import Any
 from typing import Awaitable
+from typing import Callable
 from typing import Deque
 from typing import Generic
+from typing import List
 from typing import Optional
 from typing import TypeVar
 
@@ -83,6 +90,22 @@ class QueueCommon(Generic[_T]):
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
         raise NotImplementedError()
 
+    def remove_matching(self, predicate: Callable[[_T], bool]) -> List[_T]:
+        raise NotImplementedError()
+
+
+class _Waiter(Generic[_T]):
+    """A thread blocked in :meth:`.Queue.get`, to which :meth:`.Queue.put`
+    hands an item directly."""
+
+    __slots__ = ("lock", "item")
+
+    item: _T
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.lock.acquire()
+
 
 class Queue(QueueCommon[_T]):
     queue: Deque[_T]
@@ -96,17 +119,20 @@ class Queue(QueueCommon[_T]):
         """
 
         self._init(maxsize)
-        # mutex must be held whenever the queue is mutating.  All methods
-        # that acquire mutex must release it before returning.  mutex
-        # is shared between the two conditions, so acquiring and
-        # releasing the conditions also acquires and releases mutex.
+        # mutex must be held whenever items are added to the queue, and
+        # whenever a thread registers itself as a waiter.  Removing an
+        # item while no thread is waiting takes place without the mutex,
+        # relying upon deque.pop() / deque.popleft() being atomic.
         self.mutex = threading.RLock()
-        # Notify not_empty whenever an item is added to the queue; a
-        # thread waiting to get is notified then.
-        self.not_empty = threading.Condition(self.mutex)
-        # Notify not_full whenever an item is removed from the queue;
-        # a thread waiting to put is notified then.
+        # Notify not_full whenever an item is removed from the queue while
+        # a thread is blocked in put().  put() counts itself in
+        # _full_waiters before it checks whether the queue is full, so
+        # that a lock-free removal in get() can't miss it.
         self.not_full = threading.Condition(self.mutex)
+        self._full_waiters = 0
+        # threads blocked in get(), in order of arrival; put() hands each
+        # new item to the longest-waiting thread
+        self._waiters: Deque[_Waiter[_T]] = deque()
         # If this queue uses LIFO or FIFO
         self.use_lifo = use_lifo
 
@@ -143,26 +169,46 @@ class Queue(QueueCommon[_T]):
         is false), put an item on the queue if a free slot is
         immediately available, else raise the ``Full`` exception
         (`timeout` is ignored in that case).
+
+        If threads are blocked in :meth:`.Queue.get`, the item is handed
+        directly to the one that has been waiting the longest.
         """
 
-        with self.not_full:
-            if not block:
-                if self._full():
-                    raise Full
-            elif timeout is None:
-                while self._full():
-                    self.not_full.wait()
-            else:
+        with self.mutex:
+            if block and timeout is not None:
                 if timeout < 0:
                     raise ValueError("'timeout' must be a positive number")
                 endtime = _time() + timeout
-                while self._full():
-                    remaining = endtime - _time()
-                    if remaining <= 0.0:
-                        raise Full
-                    self.not_full.wait(remaining)
-            self._put(item)
-            self.not_empty.notify()
+
+            if not self._waiters and self._full():
+                if not block:
+                    raise Full
+
+                # count ourselves as waiting before checking again whether
+                # the queue is full; a get() that removes an item without
+                # the mutex then either sees the count and notifies us,
+                # or has removed the item before the check below
+                self._full_waiters += 1
+                try:
+                    while not self._waiters and self._full():
+                        if timeout is None:
+                            self.not_full.wait()
+                        else:
+                            remaining = endtime - _time()
+                            if remaining <= 0.0:
+                                raise Full
+                            self.not_full.wait(remaining)
+                finally:
+                    self._full_waiters -= 1
+
+            if self._waiters:
+                # hand the item to the longest-waiting thread in get(),
+                # which may have begun waiting while we were blocked
+                waiter = self._waiters.popleft()
+                waiter.item = item
+                waiter.lock.release()
+            else:
+                self._put(item)
 
     def put_nowait(self, item: _T) -> None:
         """Put an item into the queue without blocking.
@@ -183,26 +229,48 @@ class Queue(QueueCommon[_T]):
         return an item if one is immediately available, else raise the
         ``Empty`` exception (`timeout` is ignored in that case).
 
+        When an item is available and no other thread is waiting, it is
+        returned without acquiring the mutex.  Otherwise, the calling
+        thread waits in line, and items are handed to waiting threads
+        in the order in which they began waiting.
+
         """
-        with self.not_empty:
+        if not self._waiters:
+            try:
+                item = self._get()
+            except IndexError:
+                pass
+            else:
+                if self._full_waiters:
+                    with self.mutex:
+                        self.not_full.notify()
+                return item
+
+        if block and timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a positive number")
+
+        with self.mutex:
+            if not self._empty():
+                item = self._get()
+                if self._full_waiters:
+                    self.not_full.notify()
+                return item
             if not block:
-                if self._empty():
-                    raise Empty
-            elif timeout is None:
-                while self._empty():
-                    self.not_empty.wait()
+                raise Empty
+            waiter: _Waiter[_T] = _Waiter()
+            self._waiters.append(waiter)
+
+        if waiter.lock.acquire(True, -1 if timeout is None else timeout):
+            return waiter.item
+
+        with self.mutex:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                # an item was handed to us after the timeout expired
+                return waiter.item
             else:
-                if timeout < 0:
-                    raise ValueError("'timeout' must be a positive number")
-                endtime = _time() + timeout
-                while self._empty():
-                    remaining = endtime - _time()
-                    if remaining <= 0.0:
-                        raise Empty
-                    self.not_empty.wait(remaining)
-            item = self._get()
-            self.not_full.notify()
-            return item
+                raise Empty
 
     def get_nowait(self) -> _T:
         """Remove and return an item from the queue without blocking.
@@ -213,6 +281,25 @@ class Queue(QueueCommon[_T]):
 
         return self.get(False)
 
+    def remove_matching(self, predicate: Callable[[_T], bool]) -> List[_T]:
+        """Remove and return the items in the queue for which the given
+        callable returns True, leaving the others in place.
+        """
+
+        removed = []
+        with self.mutex:
+            for item in list(self.queue):
+                if predicate(item):
+                    try:
+                        self.queue.remove(item)
+                    except ValueError:
+                        # taken by get() in the meantime
+                        continue
+                    removed.append(item)
+            if removed and self._full_waiters:
+                self.not_full.notify(len(removed))
+        return removed
+
     def _init(self, maxsize: int) -> None:
         self.maxsize = maxsize
         self.queue = deque()
@@ -318,6 +405,37 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
         except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
             raise Empty() from err
 
+    def remove_matching(self, predicate: Callable[[_T], bool]) -> List[_T]:
+        # take all items out and put back those that don't match; as
+        # nothing here awaits, no other task sees the queue meanwhile
+        queue = self._queue
+        items = []
+        while True:
+            try:
+                items.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+            queue.task_done()
+
+        if self.use_lifo:
+            # put back the bottom of the stack first
+            items.reverse()
+
+        try:
+            matched = [predicate(item) for item in items]
+        except BaseException:
+            for item in items:
+                queue.put_nowait(item)
+            raise
+
+        removed = []
+        for item, match in zip(items, matched):
+            if match:
+                removed.append(item)
+            else:
+                queue.put_nowait(item)
+        return removed
+
 
 class FallbackAsyncAdaptedQueue(AsyncAdaptedQueue[_T]):
     if not typing.TYPE_CHECKING:
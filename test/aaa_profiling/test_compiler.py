@@ -104,3 +104,30 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             s.compile(dialect=self.dialect)
 
         go()
+
+    def test_cache_key_joins(self):
+        a1 = t2.alias("a1")
+        a2 = t2.alias("a2")
+        j = (
+            t1.join(t2, t1.c.c1 == t2.c.c1)
+            .join(a1, t2.c.c1 == a1.c.c1)
+            .join(a2, a1.c.c1 == a2.c.c1)
+        )
+
+        stmts = [
+            select(t1.c.c2, t2.c.c2, a1.c.c2, a2.c.c2)
+            .select_from(j)
+            .where(t1.c.c2 == "x")
+            for i in range(20)
+        ]
+
+        # generate the key of a different statement so that the parts of
+        # the key that are generated only once are warmed up
+        select(t1.c.c1).select_from(j)._generate_cache_key()
+
+        @profiling.function_call_count(variance=0.15, warmup=0)
+        def go():
+            for stmt in stmts:
+                stmt._generate_cache_key()
+
+        go()
@@ -3,6 +3,7 @@ from sqlalchemy.pool import QueuePool
 from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import profiling
+from sqlalchemy.util.queue import Queue
 
 pool = None
 
@@ -47,3 +48,22 @@ class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
             return conn2
 
         go()
+
+
+class QueueTest(fixtures.TestBase):
+    """Call counts of util.queue.Queue, which backs QueuePool, when items
+    are available and no thread is waiting."""
+
+    __requires__ = ("cpython", "python_profiling_backend")
+
+    def test_get_put(self):
+        q = Queue(5)
+        for i in range(5):
+            q.put(i)
+
+        @profiling.function_call_count()
+        def go():
+            for i in range(10):
+                q.put(q.get())
+
+        go()
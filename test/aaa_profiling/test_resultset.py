@@ -3,6 +3,8 @@ import sys
 from sqlalchemy import Column
 from sqlalchemy import create_engine
 from sqlalchemy import Integer
+from sqlalchemy import literal
+from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
@@ -204,6 +206,25 @@ class ExecutionTest(fixtures.TestBase):
 
         go()
 
+    def test_minimal_cached_select_execute(self):
+        # create an engine without any instrumentation.
+        e = create_engine("sqlite://")
+        c = e.connect()
+        stmt = select(literal(5, Integer).label("x"))
+
+        # ensure initial connect activities complete and the statement
+        # is present in the compiled cache
+        c.execute(stmt).close()
+
+        @profiling.function_call_count()
+        def go():
+            c.execute(stmt).close()
+
+        try:
+            go()
+        finally:
+            c.close()
+
 
 class RowTest(fixtures.TestBase):
     __requires__ = ("cpython",)
@@ -4,6 +4,7 @@ import random
 import threading
 
 from sqlalchemy import exc
+from sqlalchemy import testing
 from sqlalchemy.testing import async_test
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
@@ -235,6 +236,49 @@ class TestAsyncAdaptedQueue(fixtures.TestBase):
 
         is_true(run[0])
 
+    @testing.combinations(False, True, argnames="use_lifo")
+    @async_test
+    async def test_remove_matching(self, use_lifo):
+        q = queue.AsyncAdaptedQueue(use_lifo=use_lifo)
+        for i in range(6):
+            q.put_nowait(i)
+
+        eq_(q.remove_matching(lambda i: i % 2), [1, 3, 5])
+        eq_(q.qsize(), 3)
+        eq_(
+            [q.get_nowait() for i in range(3)],
+            [4, 2, 0] if use_lifo else [0, 2, 4],
+        )
+
+    @async_test
+    async def test_remove_matching_unfinished_tasks(self):
+        q = queue.AsyncAdaptedQueue()
+        for i in range(6):
+            q.put_nowait(i)
+
+        eq_(q.remove_matching(lambda i: i % 2), [1, 3, 5])
+        for i in range(3):
+            q.get_nowait()
+            q._queue.task_done()
+
+        # all items were accounted for
+        await asyncio.wait_for(q._queue.join(), 1)
+
+    @async_test
+    async def test_remove_matching_error(self):
+        q = queue.AsyncAdaptedQueue()
+        for i in range(3):
+            q.put_nowait(i)
+
+        def predicate(item):
+            if item == 1:
+                raise ValueError("bad item")
+            return False
+
+        with expect_raises_message(ValueError, "bad item"):
+            q.remove_matching(predicate)
+        eq_([q.get_nowait() for i in range(3)], [0, 1, 2])
+
     @async_test
     async def test_error_other_loop(self):
         run = [False]
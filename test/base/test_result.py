@@ -1,3 +1,7 @@
+from sqlalchemy import asc
+from sqlalchemy import column
+from sqlalchemy import desc
+from sqlalchemy import distinct
 from sqlalchemy import exc
 from sqlalchemy import testing
 from sqlalchemy.engine import result
@@ -8,6 +12,7 @@ from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing.assertions import expect_raises
+from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.util import picklers
 from sqlalchemy.util import compat
 
@@ -1070,6 +1075,118 @@ class MergeResultTest(fixtures.TestBase):
         # unique takes place
         eq_(result.scalars("y").all(), [2, 1, 3])
 
+    @testing.fixture
+    def ordered_fixture(self):
+        def go():
+            r1 = result.IteratorResult(
+                result.SimpleResultMetaData(["id", "name"]),
+                iter([(1, "d"), (4, "b"), (6, None)]),
+            )
+            r2 = result.IteratorResult(
+                result.SimpleResultMetaData(["id", "name"]),
+                iter([(2, "a"), (3, "c"), (8, "a")]),
+            )
+            r3 = result.IteratorResult(
+                result.SimpleResultMetaData(["id", "name"]),
+                iter([(5, "e"), (7, None)]),
+            )
+            return r1, r2, r3
+
+        return go
+
+    def test_ordered_merge(self, ordered_fixture):
+        r1, r2, r3 = ordered_fixture()
+
+        result = r1.merge(r2, r3, order_by=["id"])
+        eq_(
+            result.scalars("id").all(),
+            [1, 2, 3, 4, 5, 6, 7, 8],
+        )
+
+    def test_ordered_merge_limit(self, ordered_fixture):
+        r1, r2, r3 = ordered_fixture()
+
+        result = r1.merge(r2, r3, order_by=["id"], limit=3)
+        eq_(result.all(), [(1, "d"), (2, "a"), (3, "c")])
+
+        # remaining rows are not consumed; results are closed
+        for r in (r1, r2, r3):
+            assert r._soft_closed
+
+    def test_ordered_merge_desc(self):
+        r1 = result.IteratorResult(
+            result.SimpleResultMetaData(["id", "name"]),
+            iter([(6, None), (4, "b"), (1, "d")]),
+        )
+        r2 = result.IteratorResult(
+            result.SimpleResultMetaData(["id", "name"]),
+            iter([(8, "a"), (3, "c"), (2, "a")]),
+        )
+        result_ = r1.merge(r2, order_by=[desc("id")])
+        eq_(result_.scalars("id").all(), [8, 6, 4, 3, 2, 1])
+
+    @testing.combinations(
+        (None, [None, "a", "b", "c", "d", "e"]),
+        ("nulls_first", [None, "a", "b", "c", "d", "e"]),
+        ("nulls_last", ["a", "b", "c", "d", "e", None]),
+        argnames="nulls, expected",
+    )
+    def test_ordered_merge_nulls(self, nulls, expected):
+        def make(rows):
+            return result.IteratorResult(
+                result.SimpleResultMetaData(["id", "name"]),
+                iter(rows),
+            )
+
+        if nulls == "nulls_last":
+            r1 = make([(1, "a"), (2, "c"), (3, None)])
+            key = asc("name").nulls_last()
+        else:
+            r1 = make([(3, None), (1, "a"), (2, "c")])
+            key = asc("name")
+            if nulls == "nulls_first":
+                key = key.nulls_first()
+        r2 = make([(4, "b"), (5, "d"), (6, "e")])
+
+        eq_(r1.merge(r2, order_by=[key]).scalars("name").all(), expected)
+
+    def test_ordered_merge_multiple_keys(self):
+        r1 = result.IteratorResult(
+            result.SimpleResultMetaData(["id", "name"]),
+            iter([(9, "a"), (1, "b"), (10, "c")]),
+        )
+        r2 = result.IteratorResult(
+            result.SimpleResultMetaData(["id", "name"]),
+            iter([(2, "a"), (3, "b"), (2, "c")]),
+        )
+
+        result_ = r1.merge(r2, order_by=["name", desc("id")])
+        eq_(
+            result_.all(),
+            [(9, "a"), (2, "a"), (3, "b"), (1, "b"), (10, "c"), (2, "c")],
+        )
+
+    def test_ordered_merge_scalars(self):
+        r1 = result.ChunkedIteratorResult(
+            result.SimpleResultMetaData(["x"]),
+            lambda size: iter([[1, 3, 5]]),
+            source_supports_scalars=True,
+        )
+        r2 = result.ChunkedIteratorResult(
+            result.SimpleResultMetaData(["x"]),
+            lambda size: iter([[2, 4]]),
+            source_supports_scalars=True,
+        )
+        eq_(r1.merge(r2, order_by=["x"]).scalars().all(), [1, 2, 3, 4, 5])
+
+    def test_ordered_merge_bad_modifier(self, ordered_fixture):
+        r1, r2, r3 = ordered_fixture()
+
+        with expect_raises_message(
+            exc.ArgumentError, "Only asc\\(\\), desc\\(\\)"
+        ):
+            r1.merge(r2, r3, order_by=[distinct(column("id"))])
+
 
 class OnlyScalarsTest(fixtures.TestBase):
     """the chunkediterator supports "non tuple mode", where we bypass
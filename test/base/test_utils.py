@@ -2,7 +2,10 @@ import copy
 import inspect
 from pathlib import Path
 import pickle
+import random
 import sys
+import threading
+import time
 
 from sqlalchemy import exc
 from sqlalchemy import sql
@@ -33,6 +36,7 @@ from sqlalchemy.util import FastIntFlag
 from sqlalchemy.util import get_callable_argspec
 from sqlalchemy.util import langhelpers
 from sqlalchemy.util import preloaded
+from sqlalchemy.util import queue
 from sqlalchemy.util import WeakSequence
 from sqlalchemy.util._collections import merge_lists_w_ordering
 from sqlalchemy.util._has_cy import _import_cy_extensions
@@ -1463,6 +1467,224 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_size_bounds(self):
+        lru = util.LRUCache(100, threshold=0.5)
+
+        for id_ in range(1000):
+            lru[id_] = id_
+            assert len(lru) <= 150
+
+            if id_ >= 100:
+                assert len(lru) >= 100
+
+                # the most recent "capacity" items are present
+                assert id_ - 99 in set(lru)
+
+    def test_recently_used_retained(self):
+        lru = util.LRUCache(10, threshold=0.5)
+
+        lru["x"] = "x"
+        for id_ in range(100):
+            lru[id_] = id_
+            eq_(lru.get("x"), "x")
+
+        eq_(lru["x"], "x")
+
+    def test_promotion_retains_capacity(self):
+        lru = util.LRUCache(10, threshold=0.2)
+
+        for id_ in range(200):
+            lru[id_] = id_
+            # re-access some older items, which moves them out of older
+            # segments
+            lru.get(id_ - 3)
+            lru.get(id_ - 7)
+            if id_ >= 10:
+                assert len(lru) >= 10
+            assert len(lru) <= 12
+
+    def test_size_bounded_w_recent_gets(self):
+        lru = util.LRUCache(10)
+
+        for id_ in range(1000):
+            lru[id_] = id_
+            lru.get(id_ - 1)
+            lru.get(id_)
+            assert len(lru) <= 15
+
+        eq_(lru.evictions, 990)
+
+    def test_delete(self):
+        lru = util.LRUCache(10, threshold=0.2)
+        for id_ in range(8):
+            lru[id_] = id_
+
+        del lru[0]
+        del lru[7]
+        assert 0 not in lru
+        assert 7 not in lru
+        eq_(len(lru), 6)
+        eq_(set(lru), {1, 2, 3, 4, 5, 6})
+
+        assert_raises(KeyError, lru.__delitem__, 0)
+
+        lru.clear()
+        eq_(len(lru), 0)
+
+    def test_stats(self):
+        alerts = []
+        lru = util.LRUCache(4, threshold=0.5, size_alert=alerts.append)
+
+        for id_ in range(10):
+            lru[id_] = id_
+        for id_ in range(10):
+            lru.get(id_)
+
+        eq_(
+            lru.stats(),
+            {
+                "hits": 4,
+                "misses": 6,
+                "evictions": 6,
+                "size": 4,
+                "capacity": 4,
+            },
+        )
+        eq_(len(alerts), 2)
+
+    def test_prune_single_segment(self):
+        lru = util.LRUCache(100, threshold=0.5)
+
+        # all entries in the most recent segment, as when other threads
+        # held the pruning lock while it filled up
+        lru._segments = [{id_: id_ for id_ in range(400)}]
+        lru[400] = 400
+
+        eq_(len(lru), 100)
+        eq_(set(lru), set(range(301, 401)))
+        eq_(lru.evictions, 301)
+
+    def test_threaded_access(self):
+        lru = util.LRUCache(100, threshold=0.5)
+        errors = []
+
+        def worker(seed):
+            rand = random.Random(seed)
+            for i in range(20000):
+                key = rand.randint(0, 400)
+                try:
+                    if rand.random() < 0.5:
+                        lru[key] = key
+                    else:
+                        lru.get(key)
+                        try:
+                            lru[key]
+                        except KeyError:
+                            pass
+                except Exception as err:
+                    errors.append(err)
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [
+                threading.Thread(target=worker, args=(seed,))
+                for seed in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        eq_(errors, [])
+
+        # a pruning pass skipped while another thread held the lock
+        # is caught up by the next assignment
+        lru[401] = 401
+        assert len(lru) <= lru.size_threshold
+
+
+class QueueTest(fixtures.TestBase):
+    def _run(self, fn):
+        results = []
+
+        def go():
+            try:
+                results.append(fn())
+            except Exception as err:
+                results.append(err)
+
+        t = threading.Thread(target=go)
+        t.daemon = True
+        t.start()
+        return t, results
+
+    def _wait_for(self, condition):
+        for i in range(500):
+            if condition():
+                return
+            time.sleep(0.01)
+        assert False, "condition not reached"
+
+    @testing.combinations(None, 5, argnames="timeout")
+    def test_blocked_put_hands_off_to_waiter(self, timeout):
+        """a put() blocked on a full queue gives its item to a thread
+        that began waiting in get() while the put() was blocked"""
+
+        q = queue.Queue(maxsize=1)
+        q.put(1)
+
+        put_thread, _ = self._run(lambda: q.put(2, timeout=timeout))
+        self._wait_for(lambda: q._full_waiters == 1)
+
+        # empty the queue without notifying the put(), so that a get()
+        # can begin waiting before the put() wakes up
+        eq_(q.queue.popleft(), 1)
+        get_thread, got = self._run(lambda: q.get(timeout=5))
+        self._wait_for(lambda: len(q._waiters) == 1)
+
+        with q.mutex:
+            q.not_full.notify()
+
+        put_thread.join(5)
+        get_thread.join(5)
+        eq_(got, [2])
+        eq_(q.qsize(), 0)
+        eq_(len(q._waiters), 0)
+
+    def test_put_races_unlocked_get(self):
+        """a get() that removes an item without the mutex just after a
+        put() found the queue full doesn't leave the put() waiting"""
+
+        run = self._run
+        got = []
+
+        class RacingQueue(queue.Queue):
+            raced = False
+
+            def _full(self):
+                full = super()._full()
+                if full and not self.raced:
+                    self.raced = True
+                    # another thread takes the item using the lock-free
+                    # path of get() before put() counts itself as waiting
+                    t, results = run(self.get_nowait)
+                    t.join(5)
+                    got.extend(results)
+                return full
+
+        q = RacingQueue(maxsize=1)
+        q.put(1)
+
+        put_thread, _ = self._run(lambda: q.put(2))
+        put_thread.join(5)
+        is_false(put_thread.is_alive())
+        eq_(got, [1])
+        eq_(q.get_nowait(), 2)
+        eq_(q._full_waiters, 0)
+
 
 class ImmutableSubclass(str):
     pass
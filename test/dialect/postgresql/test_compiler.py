@@ -3861,6 +3861,143 @@ class RegexpTest(fixtures.TestBase, testing.AssertsCompiledSQL):
         )
 
 
+class InAnyTest(fixtures.TestBase, AssertsCompiledSQL):
+    __dialect__ = postgresql.dialect(in_any_threshold=3)
+
+    @testing.fixture
+    def t(self):
+        return table(
+            "t",
+            column("x", Integer),
+            column("s", String(20)),
+            column("e", Enum("a", "b", name="myenum")),
+        )
+
+    def test_render(self, t):
+        self.assert_compile(
+            select(t.c.x).where(
+                t.c.x.in_([1, 2]), t.c.s.not_in(["q"]), t.c.e.in_(["a"])
+            ),
+            "SELECT t.x FROM t WHERE t.x = ANY (__[POSTCOMPILE_x_1]) "
+            "AND (t.s != ALL (__[POSTCOMPILE_s_1])) "
+            "AND t.e = ANY (__[POSTCOMPILE_e_1])",
+        )
+
+    @testing.combinations(
+        (
+            [1, 2],
+            "t.x = ANY (ARRAY[%(x_1)s, %(x_2)s]::INTEGER[])",
+            {"x_1": 1, "x_2": 2},
+        ),
+        ([1, 2, 3], "t.x = ANY (%(x)s::INTEGER[])", {"x": [1, 2, 3]}),
+        ([], "t.x = ANY (%(x)s::INTEGER[])", {"x": []}),
+        argnames="values, expected, params",
+    )
+    def test_threshold(self, t, values, expected, params):
+        compiled = (
+            select(t.c.x)
+            .where(t.c.x.in_(bindparam("x")))
+            .compile(dialect=self.__dialect__)
+        )
+        es = compiled.construct_expanded_state({"x": values})
+        eq_(es.statement, "SELECT t.x \nFROM t \nWHERE " + expected)
+        eq_(es.parameters, params)
+
+    def test_not_in_string(self, t):
+        compiled = (
+            select(t.c.x)
+            .where(t.c.s.not_in(["a", "b", "c"]))
+            .compile(dialect=self.__dialect__)
+        )
+        es = compiled.construct_expanded_state()
+        eq_ignore_whitespace(
+            es.statement,
+            "SELECT t.x FROM t WHERE (t.s != ALL (%(s_1)s::VARCHAR[]))",
+        )
+
+    def test_positional(self, t):
+        dialect = postgresql.asyncpg.dialect(in_any_threshold=3)
+        compiled = (
+            select(t.c.x)
+            .where(t.c.x.in_([1, 2, 3]), t.c.s.in_(["a", "b"]))
+            .compile(dialect=dialect)
+        )
+        es = compiled.construct_expanded_state()
+        eq_ignore_whitespace(
+            es.statement,
+            "SELECT t.x FROM t WHERE t.x = ANY ($1::INTEGER[]) AND "
+            "t.s = ANY (ARRAY[$2::VARCHAR, $3::VARCHAR]::VARCHAR[])",
+        )
+        eq_(es.positional_parameters, ([1, 2, 3], "a", "b"))
+
+    def test_array_processor(self):
+        class Reversed(sqltypes.TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value[::-1]
+
+        t = table("t", column("r", Reversed()))
+        compiled = (
+            select(t.c.r)
+            .where(t.c.r.in_(["ab", "cd", "ef"]))
+            .compile(dialect=self.__dialect__)
+        )
+        es = compiled.construct_expanded_state()
+        eq_(es.parameters, {"r_1": ["ab", "cd", "ef"]})
+        eq_(es.processors["r_1"](es.parameters["r_1"]), ["ba", "dc", "fe"])
+
+    def test_not_used(self, t):
+        # no threshold
+        self.assert_compile(
+            select(t.c.x).where(t.c.x.in_([1, 2, 3])),
+            "SELECT t.x FROM t WHERE t.x IN (__[POSTCOMPILE_x_1])",
+            dialect=postgresql.dialect(),
+        )
+
+        # tuples, literal execute, arrays
+        self.assert_compile(
+            select(t.c.x).where(
+                tuple_(t.c.x, t.c.s).in_([(1, "a")]),
+                t.c.x.in_(bindparam("x", literal_execute=True)),
+                column("a", PG_ARRAY(Integer)).in_([[1, 2]]),
+            ),
+            "SELECT t.x FROM t WHERE (t.x, t.s) IN (__[POSTCOMPILE_param_1]) "
+            "AND t.x IN (__[POSTCOMPILE_x]) AND a IN (__[POSTCOMPILE_a_1])",
+        )
+
+        # literal binds
+        self.assert_compile(
+            select(t.c.x).where(t.c.x.in_([1, 2, 3])),
+            "SELECT t.x FROM t WHERE t.x IN (1, 2, 3)",
+            literal_binds=True,
+        )
+
+    def test_subclass_load_via_in(self, decl_base):
+        class A(decl_base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(20))
+            __mapper_args__ = {"polymorphic_on": type}
+
+        class B(A):
+            __tablename__ = "b"
+            id = Column(ForeignKey("a.id"), primary_key=True)
+            __mapper_args__ = {
+                "polymorphic_identity": "b",
+                "polymorphic_load": "selectin",
+            }
+
+        q = B.__mapper__._subclass_load_via_in_mapper[0]
+        self.assert_compile(
+            q,
+            "SELECT b.id AS b_id, a.id AS a_id, a.type AS a_type "
+            "FROM a JOIN b ON a.id = b.id "
+            "WHERE a.id = ANY (__[POSTCOMPILE_primary_keys]) ORDER BY a.id",
+        )
+
+
 class CacheKeyTest(fixtures.CacheKeyFixture, fixtures.TestBase):
     def test_aggregate_order_by(self):
         """test #8574"""
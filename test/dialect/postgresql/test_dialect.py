@@ -6,6 +6,7 @@ import re
 
 from sqlalchemy import BigInteger
 from sqlalchemy import bindparam
+from sqlalchemy import Boolean
 from sqlalchemy import cast
 from sqlalchemy import Column
 from sqlalchemy import create_engine
@@ -13,7 +14,9 @@ from sqlalchemy import DateTime
 from sqlalchemy import DDL
 from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import Enum
 from sqlalchemy import extract
+from sqlalchemy import Float
 from sqlalchemy import func
 from sqlalchemy import Integer
 from sqlalchemy import literal
@@ -26,11 +29,15 @@ from sqlalchemy import SmallInteger
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
+from sqlalchemy import Text
 from sqlalchemy import text
 from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import asyncpg as asyncpg_dialect
 from sqlalchemy.dialects.postgresql import base as postgresql
+from sqlalchemy.dialects.postgresql import DOMAIN
 from sqlalchemy.dialects.postgresql import HSTORE
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import psycopg as psycopg_dialect
 from sqlalchemy.dialects.postgresql import psycopg2 as psycopg2_dialect
@@ -40,6 +47,8 @@ from sqlalchemy.dialects.postgresql.psycopg2 import (
     EXECUTEMANY_VALUES_PLUS_BATCH,
 )
 from sqlalchemy.engine import url
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import Session
 from sqlalchemy.sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
@@ -47,6 +56,7 @@ from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
@@ -768,6 +778,536 @@ class ExecutemanyFlagOptionsTest(fixtures.TablesTest):
             )
 
 
+class CopyInsertTest(fixtures.TestBase):
+    """python-side tests for the postgresql_copy_insert execution option"""
+
+    @testing.fixture
+    def copy_table(self):
+        return Table(
+            "data",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("x", String(30)),
+            Column("y", Integer, default=5),
+            Column("z", DateTime, default=func.now()),
+        )
+
+    @testing.fixture
+    def mock_engine(self):
+        cursor = mock.Mock(description=None, rowcount=2)
+        dbapi = mock.Mock(
+            paramstyle="pyformat",
+            __version__="2.9.6",
+            Error=type("Error", (Exception,), {}),
+            connect=mock.Mock(
+                return_value=mock.Mock(cursor=mock.Mock(return_value=cursor))
+            ),
+        )
+        return (
+            create_engine(
+                "postgresql+psycopg2://", module=dbapi, _initialize=False
+            ),
+            cursor,
+        )
+
+    @testing.combinations(
+        psycopg2_dialect.dialect,
+        psycopg_dialect.dialect,
+        asyncpg_dialect.dialect,
+        argnames="dialect_cls",
+    )
+    @testing.combinations(
+        (lambda t: t.insert(), True),
+        (lambda t: t.insert().values(x=bindparam("x")), True),
+        (lambda t: t.insert().values(x=func.lower(bindparam("x"))), False),
+        (lambda t: t.insert().values(x=bindparam("q")), False),
+        (lambda t: t.insert().returning(t.c.id), False),
+        (lambda t: insert(t).on_conflict_do_nothing(), False),
+        argnames="stmt, eligible",
+    )
+    def test_copy_insert_columns(
+        self, copy_table, dialect_cls, stmt, eligible
+    ):
+        compiled = stmt(copy_table).compile(
+            dialect=dialect_cls(),
+            column_keys=["id", "x", "z"],
+            for_executemany=True,
+        )
+        columns = compiled._copy_insert_columns
+        if eligible:
+            eq_(
+                [(name, key) for _, name, key in columns],
+                [("id", "id"), ("x", "x"), ("y", "y"), ("z", "z")],
+            )
+        else:
+            is_(columns, None)
+
+    def test_copy_insert_sql_default(self, copy_table):
+        """a SQL expression default rendered inline can't be part of
+        a COPY"""
+
+        compiled = copy_table.insert().compile(
+            dialect=psycopg2_dialect.dialect(),
+            column_keys=["id", "x"],
+            for_executemany=True,
+        )
+        is_(compiled._copy_insert_columns, None)
+
+    def test_copy_text_format(self):
+        stream = psycopg2_dialect._CopyTextStream(
+            [
+                (1, "tab\there", None, True),
+                (2, "back\\slash\nline", b"\x01\xff", False),
+                (
+                    3,
+                    [1, None, 'q"uote'],
+                    datetime.timedelta(days=1, seconds=5, microseconds=3),
+                    datetime.datetime(2023, 6, 5, 10, 15, 30),
+                ),
+            ]
+        )
+        eq_(
+            stream.read(),
+            "1\ttab\\there\t\\N\tt\n"
+            "2\tback\\\\slash\\nline\t\\\\x01ff\tf\n"
+            '3\t{"1",NULL,"q\\\\"uote"}\t1 days 5.000003 seconds\t'
+            "2023-06-05 10:15:30\n",
+        )
+        eq_(stream.read(), "")
+
+    def test_copy_insert_psycopg2(self, copy_table, mock_engine):
+        engine, cursor = mock_engine
+
+        copied = []
+        cursor.copy_expert.side_effect = lambda stmt, stream: copied.append(
+            (stmt, stream.read())
+        )
+
+        with engine.connect() as conn:
+            result = conn.execute(
+                copy_table.insert().execution_options(
+                    postgresql_copy_insert=True
+                ),
+                [
+                    {"id": 1, "x": "d1", "z": None},
+                    {"id": 2, "x": None, "z": None},
+                ],
+            )
+
+        eq_(
+            copied,
+            [
+                (
+                    "COPY data (id, x, y, z) FROM STDIN",
+                    "1\td1\t5\t\\N\n2\t\\N\t5\t\\N\n",
+                )
+            ],
+        )
+        eq_(cursor.executemany.mock_calls, [])
+        eq_(result.rowcount, 2)
+
+    def test_copy_insert_fallback(self, copy_table, mock_engine):
+        engine, cursor = mock_engine
+
+        with engine.connect() as conn:
+            conn.execute(
+                copy_table.insert().execution_options(
+                    postgresql_copy_insert=True
+                ),
+                [{"id": 1, "x": "d1"}, {"id": 2, "x": "d2"}],
+            )
+
+        eq_(cursor.copy_expert.mock_calls, [])
+        eq_(len(cursor.execute.mock_calls), 1)
+
+    def test_copy_insert_invalid_format(self, copy_table, mock_engine):
+        engine, cursor = mock_engine
+
+        with engine.connect() as conn:
+            with expect_raises_message(
+                exc.ArgumentError,
+                "Invalid value for 'postgresql_copy_insert' execution "
+                "option: 'binary'; the psycopg2 dialect supports 'text'",
+            ):
+                conn.execute(
+                    copy_table.insert().execution_options(
+                        postgresql_copy_insert="binary"
+                    ),
+                    [
+                        {"id": 1, "x": "d1", "z": None},
+                        {"id": 2, "x": "d2", "z": None},
+                    ],
+                )
+
+    @testing.combinations(
+        (psycopg2_dialect.dialect, True, "text"),
+        (psycopg_dialect.dialect, True, "text"),
+        (psycopg_dialect.dialect, "binary", "binary"),
+        (asyncpg_dialect.dialect, True, "binary"),
+        (asyncpg_dialect.dialect, "text", None),
+        argnames="dialect_cls, copy_format, expected",
+    )
+    def test_copy_insert_format(
+        self, copy_table, dialect_cls, copy_format, expected
+    ):
+        dialect = dialect_cls()
+        context = dialect.execution_ctx_cls()
+        context.dialect = dialect
+        context.root_connection = mock.Mock(_pipeline=None)
+        context.compiled = copy_table.insert().compile(
+            dialect=dialect,
+            column_keys=["id", "x", "z"],
+            for_executemany=True,
+        )
+
+        if expected is None:
+            with expect_raises_message(
+                exc.ArgumentError,
+                "Invalid value for 'postgresql_copy_insert' execution "
+                "option: 'text'; the asyncpg dialect supports 'binary'",
+            ):
+                context._setup_copy_insert(copy_format)
+        else:
+            context._setup_copy_insert(copy_format)
+            eq_(context._copy_insert_format, expected)
+            eq_(
+                context.statement.endswith("(FORMAT BINARY)"),
+                expected == "binary",
+            )
+
+    def _copy_insert_context(self, dialect_cls, table):
+        dialect = dialect_cls()
+        context = dialect.execution_ctx_cls()
+        context.dialect = dialect
+        context.root_connection = mock.Mock(_pipeline=None)
+        context.statement = "INSERT"
+        context.compiled = table.insert().compile(
+            dialect=dialect,
+            column_keys=[c.key for c in table.c],
+            for_executemany=True,
+        )
+        return context
+
+    def test_copy_insert_binary_types(self):
+        class MyInt(TypeDecorator):
+            impl = Integer
+            cache_ok = True
+
+        t = Table(
+            "data",
+            MetaData(),
+            Column("a", SmallInteger),
+            Column("b", Integer().with_variant(BigInteger, "postgresql")),
+            Column("c", MyInt),
+            Column("d", Float),
+            Column("e", Float(10)),
+            Column("f", String(30)),
+            Column("g", Text),
+            Column("h", Boolean),
+            Column("i", DateTime),
+            Column("j", DateTime(timezone=True)),
+            Column("k", postgresql.BYTEA),
+            Column("l", postgresql.INTERVAL),
+            Column("m", JSONB),
+        )
+        context = self._copy_insert_context(psycopg_dialect.dialect, t)
+        context._setup_copy_insert("binary")
+
+        eq_(context._copy_insert_format, "binary")
+        eq_(
+            context._copy_insert_types,
+            [
+                "int2",
+                "int8",
+                "int4",
+                "float8",
+                "float4",
+                "varchar",
+                "text",
+                "bool",
+                "timestamp",
+                "timestamptz",
+                "bytea",
+                "interval",
+                "jsonb",
+            ],
+        )
+
+    @testing.combinations(
+        (Enum("a", "b", name="myenum"),),
+        (postgresql.ENUM("a", "b", name="myenum"),),
+        (ARRAY(Integer),),
+        (ARRAY(String(30)),),
+        (DOMAIN("mydomain", Integer),),
+        (postgresql.CITEXT,),
+        (HSTORE,),
+        argnames="type_",
+    )
+    @testing.combinations(
+        (psycopg_dialect.dialect, "binary", None, None),
+        (psycopg_dialect.dialect, "text", "text", None),
+        (asyncpg_dialect.dialect, "binary", "binary", []),
+        argnames="dialect_cls, copy_format, expected, expected_types",
+    )
+    def test_copy_insert_binary_unsupported_type(
+        self, type_, dialect_cls, copy_format, expected, expected_types
+    ):
+        """types which psycopg can't write in COPY binary format fall back
+        to executemany; asyncpg determines the types itself"""
+
+        t = Table(
+            "data",
+            MetaData(),
+            Column("id", Integer),
+            Column("x", type_),
+        )
+        context = self._copy_insert_context(dialect_cls, t)
+        context._setup_copy_insert(copy_format)
+
+        eq_(context._copy_insert_format, expected)
+        eq_(context._copy_insert_types, expected_types)
+        if expected is None:
+            eq_(context.statement, "INSERT")
+        else:
+            assert context.statement.startswith("COPY data (id, x)")
+
+    def test_copy_insert_pipeline(self, copy_table):
+        dialect = psycopg_dialect.dialect()
+        context = dialect.execution_ctx_cls()
+        context.dialect = dialect
+        context.root_connection = mock.Mock(_pipeline=mock.Mock())
+        context.compiled = copy_table.insert().compile(
+            dialect=dialect,
+            column_keys=["id", "x", "z"],
+            for_executemany=True,
+        )
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "The 'postgresql_copy_insert' execution option can't be used "
+            r"within Connection.pipeline\(\)",
+        ):
+            context._setup_copy_insert(True)
+
+
+class CopyInsertBackendTest(fixtures.TablesTest):
+    __only_on__ = (
+        "postgresql+psycopg2",
+        "postgresql+psycopg",
+        "postgresql+asyncpg",
+    )
+    __backend__ = True
+
+    run_deletes = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(30)),
+            Column("y", Integer, default=5),
+            Column("d", DateTime),
+            Column("j", JSONB),
+        )
+        Table(
+            "enum_array_data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("e", postgresql.ENUM("a", "b", name="copy_enum")),
+            Column("a", ARRAY(Integer)),
+        )
+
+    @testing.combinations(True, "text", "binary", argnames="copy_format")
+    def test_copy_insert(self, connection, copy_format):
+        data = self.tables.data
+
+        if (
+            copy_format not in connection.dialect._copy_insert_formats
+            and copy_format is not True
+        ):
+            return
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            statements.append(stmt)
+
+        rows = [
+            {
+                "id": i,
+                "x": "d\t%d" % i if i % 2 else None,
+                "d": datetime.datetime(2023, 6, 5, 10, i),
+                "j": {"i": i, "s": "q\"'\\"},
+            }
+            for i in range(1, 11)
+        ]
+        result = connection.execute(
+            data.insert().execution_options(
+                postgresql_copy_insert=copy_format
+            ),
+            rows,
+        )
+        if connection.dialect.driver != "asyncpg":
+            eq_(result.rowcount, 10)
+
+        assert statements[0].startswith("COPY data (id, x, y, d, j) FROM")
+
+        eq_(
+            connection.execute(select(data).order_by(data.c.id)).all(),
+            [(row["id"], row["x"], 5, row["d"], row["j"]) for row in rows],
+        )
+
+    @testing.combinations(True, "text", "binary", argnames="copy_format")
+    def test_copy_insert_enum_array(self, connection, copy_format):
+        data = self.tables.enum_array_data
+
+        if (
+            copy_format not in connection.dialect._copy_insert_formats
+            and copy_format is not True
+        ):
+            return
+
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            statements.append(stmt)
+
+        rows = [
+            {"id": i, "e": "b" if i % 2 else "a", "a": [i, None, i * 2]}
+            for i in range(1, 11)
+        ]
+        connection.execute(
+            data.insert().execution_options(
+                postgresql_copy_insert=copy_format
+            ),
+            rows,
+        )
+
+        if connection.dialect.driver == "psycopg" and copy_format == "binary":
+            # psycopg can't write ENUM or ARRAY in binary format without
+            # knowing their database types; runs as executemany
+            assert statements[0].startswith("INSERT INTO enum_array_data")
+        else:
+            assert statements[0].startswith(
+                "COPY enum_array_data (id, e, a) FROM"
+            )
+
+        eq_(
+            connection.execute(select(data).order_by(data.c.id)).all(),
+            [(row["id"], row["e"], row["a"]) for row in rows],
+        )
+
+    def test_returning_fallback(self, connection):
+        data = self.tables.data
+
+        result = connection.execute(
+            data.insert()
+            .returning(data.c.id, sort_by_parameter_order=True)
+            .execution_options(postgresql_copy_insert=True),
+            [{"id": 1, "x": "d1"}, {"id": 2, "x": "d2"}],
+        )
+        eq_(result.all(), [(1,), (2,)])
+
+
+class PipelineBackendTest(fixtures.TablesTest):
+    __only_on__ = "postgresql+psycopg"
+    __backend__ = True
+
+    run_deletes = "each"
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(30)),
+        )
+
+    @testing.fixture
+    def connection(self, connection):
+        if not connection.dialect.supports_pipeline:
+            config.skip_test("psycopg / libpq don't support pipeline mode")
+        return connection
+
+    def test_pipelined_statements(self, connection):
+        data = self.tables.data
+
+        with connection.pipeline():
+            is_not(connection._pipeline, None)
+            for i in range(1, 6):
+                connection.execute(data.insert(), {"id": i, "x": "d%d" % i})
+
+            result = connection.execute(
+                data.update().where(data.c.id > 3).values(x="u")
+            )
+            eq_(result.rowcount, 2)
+
+            eq_(
+                connection.execute(select(data).order_by(data.c.id)).all(),
+                [(1, "d1"), (2, "d2"), (3, "d3"), (4, "u"), (5, "u")],
+            )
+        is_(connection._pipeline, None)
+
+    def test_returning(self, connection):
+        data = self.tables.data
+
+        with connection.pipeline():
+            result = connection.execute(
+                data.insert().returning(data.c.id), {"id": 1, "x": "d1"}
+            )
+            eq_(result.all(), [(1,)])
+
+    def test_copy_insert_not_supported(self, connection):
+        data = self.tables.data
+
+        with connection.pipeline():
+            with expect_raises_message(
+                exc.InvalidRequestError,
+                "The 'postgresql_copy_insert' execution option can't be "
+                "used within",
+            ):
+                connection.execute(
+                    data.insert().execution_options(
+                        postgresql_copy_insert=True
+                    ),
+                    [{"id": 1, "x": "d1"}, {"id": 2, "x": "d2"}],
+                )
+
+    def test_error_received_at_sync(self, connection):
+        data = self.tables.data
+
+        with expect_raises(exc.IntegrityError):
+            with connection.pipeline():
+                connection.execute(data.insert(), {"id": 1, "x": "d1"})
+                connection.execute(data.insert(), {"id": 1, "x": "d1"})
+
+    def test_session_flush(self, connection):
+        data = self.tables.data
+
+        class Data:
+            pass
+
+        registry().map_imperatively(Data, data)
+
+        with Session(connection, pipeline_flush=True) as sess:
+            for i in range(1, 4):
+                d = Data()
+                d.id = i
+                d.x = "d%d" % i
+                sess.add(d)
+            sess.flush()
+
+            eq_(
+                sess.scalars(select(Data.id).order_by(Data.id)).all(),
+                [1, 2, 3],
+            )
+
+
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
 ):
@@ -1411,3 +1951,22 @@ class Psycopg3Test(fixtures.TestBase):
     def test_async_version(self):
         e = create_engine("postgresql+psycopg_async://")
         is_true(isinstance(e.dialect, psycopg_dialect.PGDialectAsync_psycopg))
+
+    def test_prepared_execution(self, connection):
+        import psycopg
+
+        stmt = select(literal(5) + bindparam("x", type_=Integer))
+
+        with mock.patch.object(
+            psycopg.Cursor,
+            "execute",
+            autospec=True,
+            side_effect=psycopg.Cursor.execute,
+        ) as execute:
+            eq_(connection.execute(stmt, {"x": 1}).scalar(), 6)
+            eq_(connection.prepare(stmt).execute({"x": 2}).scalar(), 7)
+
+        eq_(
+            [c.kwargs.get("prepare", None) for c in execute.mock_calls],
+            [None, True],
+        )
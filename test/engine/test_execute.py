@@ -1107,6 +1107,59 @@ class CompiledCacheTest(fixtures.TestBase):
         # the statement values (only the keys).
         eq_(ref_blob(), None)
 
+    def test_engine_query_cache(self, testing_engine):
+        cache = {}
+        e1 = testing_engine(options={"query_cache": cache})
+        e2 = testing_engine(options={"query_cache": cache})
+        is_(e1._compiled_cache, cache)
+        is_(e1.execution_options(foo="bar")._compiled_cache, cache)
+
+        stmt = select(literal(5))
+        with patch.object(
+            stmt, "_compiler", Mock(side_effect=stmt._compiler)
+        ) as compile_mock:
+            for e in (e1, e1, e2, e2):
+                with e.connect() as conn:
+                    eq_(conn.scalar(stmt), 5)
+
+        # entries are per dialect
+        eq_(compile_mock.call_count, 2)
+        eq_({key[0] for key in cache}, {e1.dialect, e2.dialect})
+
+        e1.clear_compiled_cache()
+        eq_(len(cache), 0)
+
+    def test_engine_cache_stats(self, testing_engine):
+        e1 = testing_engine(options={"query_cache_size": 2})
+
+        stmts = [select(literal(i).label("x%d" % i)) for i in range(4)]
+        with e1.connect() as conn:
+            e1.clear_compiled_cache()
+            before = e1.compiled_cache_stats()
+            for stmt in stmts + stmts[-1:]:
+                conn.execute(stmt)
+
+        stats = e1.compiled_cache_stats()
+        eq_(stats["capacity"], 2)
+        eq_(stats["hits"] - before["hits"], 1)
+        eq_(stats["misses"] - before["misses"], 4)
+        eq_(stats["evictions"] - before["evictions"], 2)
+        eq_(stats["size"], 2)
+
+        is_(
+            testing_engine(
+                options={"query_cache_size": 0}
+            ).compiled_cache_stats(),
+            None,
+        )
+
+        eq_(
+            testing_engine(
+                options={"query_cache": {"x": 1}}
+            ).compiled_cache_stats(),
+            {"size": 1},
+        )
+
     def test_keys_independent_of_ordering(self, connection, metadata):
         users = Table(
             "users",
@@ -1691,6 +1744,242 @@ class ExecutionOptionsTest(fixtures.TestBase):
             eq_(c.get_execution_options(), {"foo": "bar"})
 
 
+class PipelineTest(fixtures.TestBase):
+    def _pipeline_engine(self, testing_engine):
+        engine = testing_engine("sqlite://")
+        canary = Mock()
+
+        @contextmanager
+        def do_pipeline(dbapi_connection):
+            canary.enter(dbapi_connection)
+            yield canary.pipeline
+            canary.exit()
+
+        engine.dialect.supports_pipeline = True
+        engine.dialect.do_pipeline = do_pipeline
+        return engine, canary
+
+    def test_pipeline(self, testing_engine):
+        engine, canary = self._pipeline_engine(testing_engine)
+
+        with engine.connect() as conn:
+            with conn.pipeline() as pipeline_conn:
+                is_(pipeline_conn, conn)
+                is_(conn._pipeline, canary.pipeline)
+                eq_(conn.scalar(select(1)), 1)
+            is_(conn._pipeline, None)
+
+            eq_(
+                canary.mock_calls,
+                [call.enter(conn.connection.dbapi_connection), call.exit()],
+            )
+
+    def test_pipeline_nested(self, testing_engine):
+        engine, canary = self._pipeline_engine(testing_engine)
+
+        with engine.connect() as conn:
+            with conn.pipeline():
+                with conn.pipeline():
+                    is_(conn._pipeline, canary.pipeline)
+                is_(conn._pipeline, canary.pipeline)
+            is_(conn._pipeline, None)
+
+        eq_(len(canary.enter.mock_calls), 1)
+        eq_(len(canary.exit.mock_calls), 1)
+
+    def test_pipeline_reset_on_error(self, testing_engine):
+        engine, canary = self._pipeline_engine(testing_engine)
+
+        with engine.connect() as conn:
+            with expect_raises_message(ZeroDivisionError, "division"):
+                with conn.pipeline():
+                    1 / 0
+            is_(conn._pipeline, None)
+
+    def test_pipeline_error_on_exit(self, testing_engine):
+        engine, canary = self._pipeline_engine(testing_engine)
+        dbapi_error = engine.dialect.loaded_dbapi.OperationalError("sync")
+        canary.exit.side_effect = dbapi_error
+
+        handle_error = Mock(return_value=None)
+        event.listen(engine, "handle_error", handle_error)
+
+        engine.dialect.is_disconnect = Mock(return_value=True)
+
+        with engine.connect() as conn:
+            with expect_raises_message(tsa.exc.OperationalError, "sync"):
+                with conn.pipeline():
+                    conn.execute(select(1))
+            is_(conn._pipeline, None)
+            is_true(conn.invalidated)
+
+        eq_(len(handle_error.mock_calls), 1)
+        ctx = handle_error.mock_calls[0][1][0]
+        is_(ctx.original_exception, dbapi_error)
+        is_true(ctx.is_disconnect)
+
+    def test_pipeline_body_error_not_handled_twice(self, testing_engine):
+        engine, canary = self._pipeline_engine(testing_engine)
+
+        handle_error = Mock(return_value=None)
+        event.listen(engine, "handle_error", handle_error)
+
+        with engine.connect() as conn:
+            with expect_raises_message(
+                tsa.exc.OperationalError, "no such table"
+            ):
+                with conn.pipeline():
+                    conn.execute(text("select * from nonexistent"))
+
+        eq_(len(handle_error.mock_calls), 1)
+
+    def test_pipeline_not_supported(self, testing_engine):
+        engine = testing_engine("sqlite://")
+        is_false(engine.dialect.supports_pipeline)
+
+        with engine.connect() as conn:
+            with conn.pipeline() as pipeline_conn:
+                is_(pipeline_conn, conn)
+                is_(conn._pipeline, None)
+                eq_(conn.scalar(select(1)), 1)
+
+
+class PreparedExecutionTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "users",
+            metadata,
+            Column("user_id", INT, primary_key=True, autoincrement=False),
+            Column("user_name", VARCHAR(20)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.users.insert(),
+            [
+                {"user_id": 1, "user_name": "jack"},
+                {"user_id": 2, "user_name": "ed"},
+                {"user_id": 3, "user_name": "wendy"},
+            ],
+        )
+
+    def test_select(self, connection):
+        users = self.tables.users
+        stmt = select(users.c.user_name).where(
+            users.c.user_id == bindparam("id")
+        )
+        prepared = connection.prepare(stmt)
+        is_(prepared.connection, connection)
+        is_(prepared.statement, stmt)
+
+        with mock.patch.object(
+            stmt, "_generate_cache_key", wraps=stmt._generate_cache_key
+        ) as gen_cache_key:
+            for id_, name in [(1, "jack"), (3, "wendy"), (2, "ed")]:
+                eq_(prepared.execute({"id": id_}).scalar(), name)
+
+        eq_(len(gen_cache_key.mock_calls), 1)
+
+    def test_statement_params(self, connection):
+        users = self.tables.users
+        prepared = connection.prepare(
+            select(users.c.user_name).where(users.c.user_id == 2)
+        )
+        eq_(prepared.execute().scalar(), "ed")
+        eq_(prepared.execute().scalar(), "ed")
+
+    def test_insert_execute_executemany(self, connection):
+        users = self.tables.users
+        prepared = connection.prepare(users.insert())
+        prepared.execute({"user_id": 4, "user_name": "fred"})
+        prepared.execute(
+            [
+                {"user_id": 5, "user_name": "sally"},
+                {"user_id": 6, "user_name": "bob"},
+            ]
+        )
+        prepared.execute({"user_id": 7})
+        eq_(len(prepared._compiled), 3)
+
+        eq_(
+            connection.execute(
+                select(users).where(users.c.user_id > 3).order_by("user_id")
+            ).all(),
+            [(4, "fred"), (5, "sally"), (6, "bob"), (7, None)],
+        )
+
+    def test_function(self, connection):
+        users = self.tables.users
+        prepared = connection.prepare(func.count(users.c.user_id))
+        eq_(prepared.execute().scalar(), 3)
+
+    def test_execution_options(self, connection):
+        users = self.tables.users
+        stmt = select(users.c.user_name).execution_options(foo="bar")
+        connection.execution_options(bat="hoho")
+        prepared = connection.prepare(stmt, execution_options={"bar": "bat"})
+
+        result = prepared.execute()
+        eq_(
+            {
+                k: v
+                for k, v in result.context.execution_options.items()
+                if k in ("foo", "bar", "bat", "_sa_prepared_execution")
+            },
+            {
+                "foo": "bar",
+                "bar": "bat",
+                "bat": "hoho",
+                "_sa_prepared_execution": True,
+            },
+        )
+
+    def test_cache_stats(self, connection):
+        users = self.tables.users
+        prepared = connection.prepare(select(users.c.user_name))
+
+        stats = [
+            prepared.execute().context._get_cache_stats() for i in range(2)
+        ]
+        assert re.match(r"(generated|cached since) in", stats[0])
+        assert re.match(r"cached since", stats[1])
+
+    def test_events(self, connection):
+        users = self.tables.users
+        stmt = select(users.c.user_name).where(
+            users.c.user_id == bindparam("id")
+        )
+        prepared = connection.prepare(stmt)
+        eq_(prepared.execute({"id": 1}).scalar(), "jack")
+
+        canary = Mock()
+        event.listen(connection, "before_execute", canary.before_execute)
+        event.listen(connection, "after_execute", canary.after_execute)
+
+        eq_(prepared.execute({"id": 2}).scalar(), "ed")
+        eq_(
+            [c[1][1] for c in canary.mock_calls],
+            [stmt, stmt],
+        )
+
+    @testing.combinations(
+        (lambda: "select 1",),
+        (lambda: column("q"),),
+        (lambda: Sequence("some_seq"),),
+        argnames="stmt",
+    )
+    def test_not_executable(self, connection, stmt):
+        stmt = testing.resolve_lambda(stmt)
+        with expect_raises_message(
+            tsa.exc.ObjectNotExecutableError, "Not an executable object"
+        ):
+            connection.prepare(stmt)
+
+
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = ("ad_hoc_engines",)
     __backend__ = True
@@ -1,3 +1,4 @@
+import asyncio
 import collections
 import random
 import threading
@@ -16,16 +17,20 @@ from sqlalchemy import PoolResetState
 from sqlalchemy import select
 from sqlalchemy import testing
 from sqlalchemy.engine import default
+from sqlalchemy.pool import impl
 from sqlalchemy.pool.base import _AsyncConnDialect
 from sqlalchemy.pool.base import _ConnDialect
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_context_ok
 from sqlalchemy.testing import assert_warns_message
+from sqlalchemy.testing import async_test
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_none
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_not_none
@@ -34,6 +39,7 @@ from sqlalchemy.testing import mock
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.testing.util import lazy_gc
+from sqlalchemy.util import greenlet_spawn
 
 join_timeout = 10
 
@@ -233,7 +239,14 @@ class PoolTest(PoolTestBase):
     @testing.combinations(
         (
             pool.QueuePool,
-            dict(pool_size=8, max_overflow=10, timeout=25, use_lifo=True),
+            dict(
+                pool_size=8,
+                max_overflow=10,
+                timeout=25,
+                use_lifo=True,
+                min_idle=2,
+                replenish_interval=3,
+            ),
         ),
         (pool.QueuePool, {}),
         (pool.NullPool, {}),
@@ -244,11 +257,15 @@ class PoolTest(PoolTestBase):
     def test_recreate_state(self, pool_cls, pool_args):
         creator = object()
         pool_args["pre_ping"] = True
+        pool_args["pre_ping_idle_threshold"] = 10
         pool_args["reset_on_return"] = "commit"
         pool_args["recycle"] = 35
+        pool_args["recycle_jitter"] = 5
+        pool_args["max_concurrent_recycles"] = 2
         pool_args["logging_name"] = "somepool"
         pool_args["dialect"] = default.DefaultDialect()
         pool_args["echo"] = "debug"
+        pool_args["statistics"] = True
 
         p1 = pool_cls(creator=creator, **pool_args)
 
@@ -268,6 +285,8 @@ class PoolTest(PoolTestBase):
             "_invoke_creator",
             "_pool",
             "_overflow_lock",
+            "_replenisher_stop",
+            "_recycle_slots",
             "_fairy",
             "_conn",
             "logger",
@@ -279,6 +298,7 @@ class PoolTest(PoolTestBase):
 
         eq_(p1.echo, p2.echo)
         is_(p1._dialect, p2._dialect)
+        is_(p1.statistics, p2.statistics)
 
         if "use_lifo" in pool_args:
             eq_(p1._pool.use_lifo, p2._pool.use_lifo)
@@ -1126,6 +1146,91 @@ class QueuePoolTest(PoolTestBase):
             # but on a loaded down buildbot it can go up.
             assert t < 14, "Not all timeouts were < 14 seconds %r" % timeouts
 
+    @testing.requires.threading_with_mock
+    def test_waiters_fifo(self):
+        """test that threads waiting for a connection receive one in the
+        order in which they began waiting."""
+
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=30)
+        c1 = p.connect()
+
+        order = []
+
+        def waiter(i):
+            conn = p.connect()
+            order.append(i)
+            conn.close()
+
+        threads = []
+        for i in range(5):
+            t = threading.Thread(target=waiter, args=(i,))
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+            # wait for the thread to enter the line
+            for j in range(500):
+                if len(p._pool._waiters) == i + 1:
+                    break
+                time.sleep(0.01)
+            eq_(len(p._pool._waiters), i + 1)
+
+        c1.close()
+        for t in threads:
+            t.join(join_timeout)
+
+        eq_(order, [0, 1, 2, 3, 4])
+        eq_(p.checkedin(), 1)
+        eq_(len(p._pool._waiters), 0)
+
+    @testing.requires.timing_intensive
+    @testing.combinations(
+        (50, 5, 10),
+        (200, 10, 10),
+        (200, 10, 0),
+        argnames="thread_count,pool_size,max_overflow",
+    )
+    def test_contention(self, thread_count, pool_size, max_overflow):
+        """test checkout / checkin from many threads at once against a
+        small pool."""
+
+        p = self._queuepool_fixture(
+            pool_size=pool_size, max_overflow=max_overflow, timeout=60
+        )
+        checkouts = 200
+        start = threading.Barrier(thread_count + 1)
+        completed = []
+
+        def worker():
+            start.wait()
+            for i in range(checkouts):
+                conn = p.connect()
+                conn.close()
+            completed.append(True)
+
+        threads = [
+            threading.Thread(target=worker) for i in range(thread_count)
+        ]
+        for t in threads:
+            t.start()
+
+        start.wait()
+        for t in threads:
+            t.join(60)
+
+        eq_(len(completed), thread_count)
+        eq_(p.checkedout(), 0)
+        is_true(p.checkedin() <= pool_size)
+
+    def test_waiter_timeout_removed(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=0.05)
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(len(p._pool._waiters), 0)
+
+        c1.close()
+        eq_(p.checkedin(), 1)
+
     def _test_overflow(self, thread_count, max_overflow):
         reaper = testing.engines.ConnectionKiller()
 
@@ -1485,6 +1590,112 @@ class QueuePoolTest(PoolTestBase):
             c3 = p.connect()
             is_not(c3.dbapi_connection, c_ref())
 
+    def test_recycle_jitter(self):
+        with patch("sqlalchemy.pool.base.time.time") as mock:
+            mock.return_value = 10000
+
+            p = self._queuepool_fixture(
+                pool_size=10, max_overflow=0, recycle=30, recycle_jitter=10
+            )
+            conns = [p.connect() for i in range(10)]
+            offsets = [c._connection_record._recycle_offset for c in conns]
+            for c in conns:
+                c.close()
+
+            is_true(all(0 <= offset <= 10 for offset in offsets))
+            eq_(len(set(offsets)), 10)
+
+            c1 = p.connect()
+            rec = c1._connection_record
+            c_ref = weakref.ref(c1.dbapi_connection)
+            rec._recycle_offset = 8
+            c1.close()
+
+            mock.return_value = 10021
+            while True:
+                c2 = p.connect()
+                if c2._connection_record is rec:
+                    break
+            is_(c2.dbapi_connection, c_ref())
+            c2.close()
+
+            mock.return_value = 10023
+            while True:
+                c3 = p.connect()
+                if c3._connection_record is rec:
+                    break
+            is_not(c3.dbapi_connection, c_ref())
+
+    @testing.combinations(
+        (-1, 10), (30, 30), (30, 45), (30, -5), argnames="recycle, jitter"
+    )
+    def test_recycle_jitter_invalid(self, recycle, jitter):
+        with expect_raises_message(
+            tsa.exc.ArgumentError,
+            "recycle_jitter must be a positive number of seconds less than "
+            r"recycle; got recycle_jitter=%s with recycle=%s"
+            % (jitter, recycle),
+        ):
+            self._queuepool_fixture(recycle=recycle, recycle_jitter=jitter)
+
+    def test_no_recycle_check_without_recycle(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0)
+        c1 = p.connect()
+        c1.close()
+
+        with patch.object(
+            pool.base._ConnectionRecord, "_is_due_for_recycle"
+        ) as is_due:
+            c1 = p.connect()
+            c1.close()
+
+        eq_(is_due.mock_calls, [])
+
+    def test_max_concurrent_recycles(self):
+        with patch("sqlalchemy.pool.base.time.time") as mock:
+            mock.return_value = 10000
+
+            p = self._queuepool_fixture(
+                pool_size=1,
+                max_overflow=0,
+                recycle=30,
+                max_concurrent_recycles=1,
+            )
+            c1 = p.connect()
+            c_ref = weakref.ref(c1.dbapi_connection)
+            c1.close()
+
+            mock.return_value = 10035
+
+            # another recycle is in progress; connection is used as is
+            p._recycle_slots.acquire()
+            c2 = p.connect()
+            is_(c2.dbapi_connection, c_ref())
+            c2.close()
+
+            p._recycle_slots.release()
+            c3 = p.connect()
+            is_not(c3.dbapi_connection, c_ref())
+            c3.close()
+
+            # slot was released after the recycle
+            is_true(p._recycle_slots.acquire(False))
+            p._recycle_slots.release()
+
+    def test_max_concurrent_recycles_invalidated(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, max_concurrent_recycles=1
+        )
+        p._recycle_slots.acquire()
+
+        c1 = p.connect()
+        c_ref = weakref.ref(c1.dbapi_connection)
+        c1.invalidate()
+        c1.close()
+
+        c2 = p.connect()
+        is_not(c2.dbapi_connection, c_ref())
+
     @testing.requires.timing_intensive
     def test_recycle_on_invalidate(self):
         p = self._queuepool_fixture(pool_size=1, max_overflow=0)
@@ -1986,6 +2197,401 @@ class QueuePoolTest(PoolTestBase):
         pc1.close()
 
 
+class QueuePoolMinIdleTest(PoolTestBase):
+    def test_warm(self):
+        dbapi, p = self._queuepool_dbapi_fixture(pool_size=3, max_overflow=5)
+        eq_(p.warm(2), 2)
+        eq_(p.checkedin(), 2)
+        eq_(p.checkedout(), 0)
+        eq_(dbapi.connect.call_count, 2)
+
+        eq_(p.warm(2), 0)
+
+        # doesn't grow beyond pool_size
+        eq_(p.warm(10), 1)
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+
+        c1, c2, c3, c4 = [p.connect() for i in range(4)]
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.overflow(), 1)
+        for c in (c1, c2, c3, c4):
+            c.close()
+
+    def test_warm_default_min_idle(self):
+        p = self._queuepool_fixture(pool_size=5, min_idle=2)
+        eq_(p.warm(), 2)
+        eq_(p.checkedin(), 2)
+
+    def test_warm_not_implemented(self):
+        p = pool.NullPool(creator=MockDBAPI().connect)
+        assert_raises(NotImplementedError, p.warm)
+
+    @testing.combinations(False, True, argnames="use_lifo")
+    def test_replenish(self, use_lifo):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5,
+            min_idle=3,
+            recycle=100,
+            replenish_interval=10,
+            use_lifo=use_lifo,
+        )
+        p._replenisher = mock.Mock()
+
+        p._replenish()
+        eq_(p.checkedin(), 3)
+
+        # order of idle connections is maintained
+        recs = list(p._pool.queue)
+        p._replenish()
+        eq_(list(p._pool.queue), recs)
+
+        old, invalidated, expiring = [rec.dbapi_connection for rec in recs]
+
+        recs[1].invalidate()
+        recs[2].starttime -= 95
+
+        p._replenish()
+        eq_(p.checkedin(), 3)
+        eq_(dbapi.connect.call_count, 5)
+
+        is_(recs[0].dbapi_connection, old)
+        is_not_none(recs[1].dbapi_connection)
+        is_not(recs[2].dbapi_connection, expiring)
+        is_true(expiring.close.called)
+
+    def test_replenish_leaves_idle_connections(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=3, replenish_interval=10
+        )
+        p._replenisher = mock.Mock()
+        p._replenish()
+
+        recs = list(p._pool.queue)
+        recs[1].invalidate()
+
+        checkedin = []
+        refresh_idle = p._refresh_idle
+
+        def _refresh_idle(rec):
+            checkedin.append(p.checkedin())
+            refresh_idle(rec)
+
+        with mock.patch.object(p, "_refresh_idle", _refresh_idle):
+            p._replenish()
+
+        # connections that don't need to be re-established stay available
+        # for checkout
+        eq_(checkedin, [2])
+        eq_(list(p._pool.queue), [recs[0], recs[2], recs[1]])
+
+    def test_replenish_max_concurrent_recycles(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5,
+            min_idle=3,
+            recycle=100,
+            replenish_interval=10,
+            max_concurrent_recycles=1,
+        )
+        p._replenisher = mock.Mock()
+        p._replenish()
+
+        recs = list(p._pool.queue)
+        for rec in recs:
+            rec.starttime -= 95
+
+        p._replenish()
+        eq_(dbapi.connect.call_count, 6)
+        is_true(p._recycle_slots.acquire(False))
+        p._recycle_slots.release()
+
+        p._recycle_slots.acquire()
+        for rec in recs:
+            rec.starttime -= 95
+        p._replenish()
+        eq_(dbapi.connect.call_count, 6)
+        eq_(p.checkedin(), 3)
+
+    def test_replenisher_thread(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=2, replenish_interval=0.01
+        )
+        is_none(p._replenisher)
+
+        c1 = p.connect()
+        thread = p._replenisher
+        assert isinstance(thread, threading.Thread)
+
+        for i in range(500):
+            if p.checkedin() >= 2:
+                break
+            time.sleep(0.01)
+        eq_(p.checkedin(), 2)
+        c1.close()
+
+        p.dispose()
+        thread.join(join_timeout)
+        is_false(thread.is_alive())
+
+    def test_replenisher_restarted_after_dispose(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=5, min_idle=2, replenish_interval=0.01
+        )
+
+        p.connect().close()
+        thread = p._replenisher
+        p.dispose()
+        thread.join(join_timeout)
+        is_false(thread.is_alive())
+        is_none(p._replenisher)
+
+        # the pool continues to be used after dispose()
+        c1 = p.connect()
+        thread2 = p._replenisher
+        assert isinstance(thread2, threading.Thread)
+        is_not(thread2, thread)
+        is_true(thread2.is_alive())
+
+        for i in range(500):
+            if p.checkedin() >= 2:
+                break
+            time.sleep(0.01)
+        eq_(p.checkedin(), 2)
+        c1.close()
+
+        p.dispose()
+        thread2.join(join_timeout)
+        is_false(thread2.is_alive())
+
+    def test_recreate(self):
+        p = self._queuepool_fixture(min_idle=2, replenish_interval=3)
+        p2 = p.recreate()
+        eq_(p2._min_idle, 2)
+        eq_(p2._replenish_interval, 3)
+        is_none(p2._replenisher)
+
+    @testing.requires.greenlet
+    @async_test
+    async def test_async_replenisher_task(self):
+        dbapi = MockDBAPI()
+        p = pool.AsyncAdaptedQueuePool(
+            creator=lambda: dbapi.connect("foo.db"),
+            pool_size=5,
+            min_idle=2,
+            replenish_interval=0.01,
+        )
+
+        c1 = await greenlet_spawn(p.connect)
+        task = p._replenisher
+        assert isinstance(task, asyncio.Task)
+
+        for i in range(500):
+            if p.checkedin() >= 2:
+                break
+            await asyncio.sleep(0.01)
+        eq_(p.checkedin(), 2)
+        await greenlet_spawn(c1.close)
+
+        await greenlet_spawn(p.dispose)
+        await asyncio.sleep(0)
+        is_true(task.done())
+
+    def test_no_replenisher_without_event_loop(self):
+        dbapi = MockDBAPI()
+        p = pool.FallbackAsyncAdaptedQueuePool(
+            creator=lambda: dbapi.connect("foo.db"),
+            pool_size=5,
+            min_idle=2,
+        )
+
+        with mock.patch.object(
+            threading, "Thread"
+        ) as thread, mock.patch.object(
+            p, "_create_replenisher", wraps=p._create_replenisher
+        ) as create_replenisher:
+            for i in range(3):
+                c1 = p.connect()
+                c1.close()
+
+        # the attempt to start a replenisher is made only once
+        is_(p._replenisher, impl._NO_REPLENISHER)
+        eq_(create_replenisher.call_count, 1)
+        eq_(thread.mock_calls, [])
+        p.dispose()
+
+
+class PoolStatisticsTest(PoolTestBase):
+    def test_disabled_by_default(self):
+        p = self._queuepool_fixture()
+        is_none(p.statistics)
+
+        c1 = p.connect()
+        is_none(c1.checkout_duration)
+        eq_(c1._connection_record._checkout_time, 0.0)
+        c1.close()
+
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(
+            pool_size=2, max_overflow=0, statistics=True
+        )
+        stats = p.statistics
+        assert isinstance(stats, pool.PoolStatistics)
+
+        c1 = p.connect()
+        c2 = p.connect()
+        is_true(c1.checkout_duration >= 0)
+        c1.close()
+        c2.close()
+        c1 = p.connect()
+        c1.close()
+
+        eq_(stats.checkout_wait.count, 3)
+        eq_(stats.checkout_duration.count, 3)
+        eq_(stats.connect_time.count, 2)
+        eq_(stats.ping_time.count, 0)
+        eq_(sum(stats.checkout_duration.counts), 3)
+        is_true(stats.checkout_duration.max <= stats.checkout_duration.total)
+
+    def test_detach(self):
+        p = self._queuepool_fixture(statistics=True)
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.detach()
+        is_none(c1.checkout_duration)
+        eq_(rec._checkout_time, 0.0)
+        c1.close()
+        eq_(p.statistics.checkout_duration.count, 0)
+
+    def test_overflow(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=1, timeout=0, statistics=True
+        )
+        stats = p.statistics
+
+        c1 = p.connect()
+        c2 = p.connect()
+        eq_(stats.overflow_created, 1)
+
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(stats.timeouts, 1)
+
+        c1.close()
+        c2.close()
+        eq_(stats.overflow_discarded, 1)
+        eq_(stats.connect_time.count, 2)
+
+    def test_invalidate(self):
+        p = self._queuepool_fixture(statistics=True)
+        stats = p.statistics
+
+        c1 = p.connect()
+        c1.invalidate(soft=True)
+        c1.close()
+        c1 = p.connect()
+        c1.invalidate()
+        c1.close()
+
+        eq_(stats.soft_invalidations, 1)
+        eq_(stats.invalidations, 1)
+        eq_(stats.connect_time.count, 2)
+
+    def test_pre_ping(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, pre_ping=True, statistics=True
+        )
+        p._dialect = _ConnDialect()
+        p._dialect._do_ping_w_event = Mock(side_effect=[True, False])
+        stats = p.statistics
+
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+
+        eq_(stats.ping_time.count, 2)
+        eq_(stats.ping_failures, 1)
+        eq_(stats.invalidations, 1)
+        eq_(stats.connect_time.count, 2)
+
+    def test_histogram_buckets(self):
+        stats = pool.PoolStatistics(buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 2.0, 3.0):
+            stats._observe(stats.connect_time, value)
+
+        hist = stats.connect_time
+        eq_(hist.counts, [2, 1, 2])
+        eq_(hist.count, 5)
+        eq_(hist.max, 3.0)
+        eq_(round(hist.mean, 6), 1.13)
+
+        stats._incr("timeouts")
+        snapshot = stats.snapshot()
+        eq_(snapshot["timeouts"], 1)
+        eq_(snapshot["connect_time"]["counts"], [2, 1, 2])
+        eq_(snapshot["checkout_wait"]["count"], 0)
+
+        stats.reset()
+        eq_(stats.timeouts, 0)
+        eq_(stats.connect_time.counts, [0, 0, 0])
+        eq_(snapshot["connect_time"]["counts"], [2, 1, 2])
+
+    def test_unsorted_buckets(self):
+        assert_raises(
+            tsa.exc.ArgumentError, pool.PoolStatistics, buckets=[1.0, 0.1]
+        )
+
+    def test_shared_statistics(self):
+        stats = pool.PoolStatistics()
+        p1 = self._queuepool_fixture(statistics=stats)
+        p2 = self._queuepool_fixture(statistics=stats)
+        is_(p1.statistics, stats)
+
+        p1.connect().close()
+        p2.connect().close()
+        eq_(stats.checkout_wait.count, 2)
+
+    def test_create_engine(self):
+        e = create_engine(
+            "sqlite://", poolclass=pool.QueuePool, pool_statistics=True
+        )
+        with e.connect():
+            pass
+        eq_(e.pool.statistics.checkout_duration.count, 1)
+
+        e.dispose()
+        eq_(e.pool.statistics.checkout_duration.count, 1)
+
+    @testing.requires.greenlet
+    @async_test
+    async def test_async_adapted_queuepool(self):
+        dbapi = MockDBAPI()
+        p = pool.AsyncAdaptedQueuePool(
+            creator=lambda: dbapi.connect("foo.db"),
+            pool_size=1,
+            max_overflow=1,
+            timeout=0,
+            statistics=True,
+        )
+
+        def go():
+            c1 = p.connect()
+            c2 = p.connect()
+            assert_raises(tsa.exc.TimeoutError, p.connect)
+            c1.close()
+            c2.close()
+
+        await greenlet_spawn(go)
+
+        stats = p.statistics
+        eq_(stats.checkout_wait.count, 2)
+        eq_(stats.checkout_duration.count, 2)
+        eq_(stats.overflow_created, 1)
+        eq_(stats.overflow_discarded, 1)
+        eq_(stats.timeouts, 1)
+
+
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
         dbapi = Mock()
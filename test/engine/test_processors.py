@@ -1,13 +1,16 @@
 import datetime
+import decimal
 import re
 from types import MappingProxyType
 
 from sqlalchemy import exc
+from sqlalchemy import testing
 from sqlalchemy.engine import processors
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.util import immutabledict
 
 
@@ -72,6 +75,67 @@ class _DateProcessorTest(fixtures.TestBase):
 
         eq_(self.module.str_to_date("2022-04-03"), datetime.date(2022, 4, 3))
 
+    def test_iso_datetime_variants(self):
+        eq_(
+            self.module.str_to_datetime("2022-04-03T17:12:34.353123"),
+            datetime.datetime(2022, 4, 3, 17, 12, 34, 353123),
+        )
+
+        eq_(
+            self.module.str_to_datetime("2022-04-03 17:12:34.353123+02:00"),
+            datetime.datetime(
+                2022,
+                4,
+                3,
+                17,
+                12,
+                34,
+                353123,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=2)),
+            ),
+        )
+
+        eq_(
+            self.module.str_to_datetime("2022-04-03"),
+            datetime.datetime(2022, 4, 3),
+        )
+
+        eq_(
+            self.module.str_to_time("17:12"),
+            datetime.time(17, 12),
+        )
+
+    def test_iso_out_of_range(self):
+        assert_raises_message(
+            ValueError,
+            "month must be in 1..12",
+            self.module.str_to_datetime,
+            "2022-13-03 17:12:34.353123",
+        )
+
+        assert_raises_message(
+            ValueError,
+            "day is out of range for month",
+            self.module.str_to_date,
+            "2022-02-30",
+        )
+
+        assert_raises_message(
+            ValueError,
+            "hour must be in 0..23",
+            self.module.str_to_time,
+            "24:12:34",
+        )
+
+    def test_iso_str_subclass(self):
+        class MyStr(str):
+            pass
+
+        eq_(
+            self.module.str_to_datetime(MyStr("2022-04-03 17:12:34")),
+            datetime.datetime(2022, 4, 3, 17, 12, 34),
+        )
+
     def test_date_no_string(self):
         assert_raises_message(
             TypeError,
@@ -144,6 +208,55 @@ class CyDateProcessorTest(_DateProcessorTest):
         cls.module = processors
 
 
+class _DecimalProcessorTest(fixtures.TestBase):
+    def test_none(self):
+        eq_(self.decimal_processor(decimal.Decimal, 2)(None), None)
+
+    @testing.combinations(
+        (1.25, 2, "1.25"),
+        (1.255555, 3, "1.256"),
+        (-0.5, 0, "-0"),
+        (1e20, 2, "100000000000000000000.00"),
+        (7, 2, "7.00"),
+        (decimal.Decimal("3.5"), 1, "3.5"),
+        argnames="value, scale, expected",
+    )
+    def test_to_decimal(self, value, scale, expected):
+        result = self.decimal_processor(decimal.Decimal, scale)(value)
+        is_(type(result), decimal.Decimal)
+        eq_(str(result), expected)
+
+    def test_to_decimal_nonfinite(self):
+        proc = self.decimal_processor(decimal.Decimal, 2)
+        eq_(proc(float("inf")), decimal.Decimal("inf"))
+        assert proc(float("nan")).is_nan()
+
+
+class PyDecimalProcessorTest(_DecimalProcessorTest):
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.engine import _py_processors
+
+        cls.decimal_processor = staticmethod(
+            _py_processors.to_decimal_processor_factory
+        )
+
+
+class CyDecimalProcessorTest(_DecimalProcessorTest):
+    __requires__ = ("cextensions",)
+
+    @classmethod
+    def setup_test_class(cls):
+        from sqlalchemy.cyextension import processors
+
+        def decimal_processor(target_class, scale):
+            return processors.DecimalResultProcessor(
+                target_class, "%%.%df" % scale, scale
+            ).process
+
+        cls.decimal_processor = staticmethod(decimal_processor)
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_20_none(self):
         eq_(self.module._distill_params_20(None), ())
@@ -219,6 +219,46 @@ class PrePingMockTest(fixtures.TestBase):
 
         conn.close()
 
+    def test_ping_idle_threshold(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(
+                pool_size=1, max_overflow=0, pre_ping_idle_threshold=60
+            ),
+        )
+
+        conn = pool.connect()
+        dbapi_conn = conn.dbapi_connection
+        conn_rec = conn._connection_record
+        conn.close()
+
+        # checked in recently, no ping
+        conn = pool.connect()
+        is_(conn.dbapi_connection, dbapi_conn)
+        eq_(dbapi_conn.mock_calls, [call.rollback()])
+        conn.close()
+
+        # idle for longer than the threshold, ping
+        conn_rec._checkin_time -= 120
+        conn = pool.connect()
+        is_(conn.dbapi_connection, dbapi_conn)
+        eq_(
+            dbapi_conn.mock_calls,
+            [call.rollback(), call.rollback(), call.cursor()],
+        )
+        conn.close()
+
+    def test_no_checkin_time_without_idle_threshold(self):
+        pool = self._pool_fixture(
+            pre_ping=True, pool_kw=dict(pool_size=1, max_overflow=0)
+        )
+
+        conn = pool.connect()
+        conn_rec = conn._connection_record
+        conn.close()
+
+        eq_(conn_rec._checkin_time, 0.0)
+
     def test_ping_not_on_reconnect(self):
         pool = self._pool_fixture(
             pre_ping=True, pool_kw=dict(pool_size=1, max_overflow=0)
@@ -1,10 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import os
+import threading
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import delete
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
@@ -17,8 +20,11 @@ from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import update
 from sqlalchemy import util
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext import horizontal_shard
 from sqlalchemy.ext.horizontal_shard import set_shard_id
 from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.ext.horizontal_shard import ShardTimeoutError
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import defer
 from sqlalchemy.orm import deferred
@@ -32,8 +38,11 @@ from sqlalchemy.sql import operators
 from sqlalchemy.sql import Select
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_deprecated
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import provision
 from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.engines import testing_reaper
@@ -47,6 +56,8 @@ class ShardTest:
 
     schema = None
 
+    session_kw = {}
+
     @classmethod
     def define_tables(cls, metadata):
         global db1, db2, db3, db4, weather_locations, weather_reports
@@ -158,6 +169,7 @@ class ShardTest:
             shard_chooser=shard_chooser,
             identity_chooser=identity_chooser,
             execute_chooser=execute_chooser,
+            **cls.session_kw,
         )
 
     @classmethod
@@ -641,6 +653,119 @@ class ShardTest:
             {75.0},
         )
 
+    @testing.combinations(
+        ("legacy",), ("future",), ("yield_per",), argnames="style"
+    )
+    def test_order_by_merged_across_shards(self, style):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        def go():
+            if style == "legacy":
+                return (
+                    sess.query(WeatherLocation)
+                    .order_by(
+                        WeatherLocation.continent.desc(), WeatherLocation.id
+                    )
+                    .all()
+                )
+            stmt = select(WeatherLocation).order_by(
+                WeatherLocation.continent.desc(), WeatherLocation.id
+            )
+            if style == "yield_per":
+                stmt = stmt.execution_options(yield_per=2)
+            return sess.scalars(stmt).all()
+
+        # run twice, the second time against cached compiled statements
+        eq_(go(), go())
+        locations = go()
+
+        eq_(
+            [loc.city for loc in locations],
+            [
+                "Brasila",
+                "Quito",
+                "New York",
+                "Toronto",
+                "London",
+                "Dublin",
+                "Tokyo",
+            ],
+        )
+
+        # entities are still loaded with the identity token of their shard
+        eq_(
+            {(loc.city, inspect(loc).identity_token) for loc in locations},
+            {
+                ("Tokyo", "asia"),
+                ("Toronto", "north_america"),
+                ("Quito", "south_america"),
+                ("New York", "north_america"),
+                ("London", "europe"),
+                ("Dublin", "europe"),
+                ("Brasila", "south_america"),
+            },
+        )
+
+    def test_order_by_columns_merged_across_shards(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        eq_(
+            sess.execute(
+                select(WeatherLocation.continent, WeatherLocation.city)
+                .where(WeatherLocation.continent != "Asia")
+                .order_by(WeatherLocation.city)
+            ).all(),
+            [
+                ("South America", "Brasila"),
+                ("Europe", "Dublin"),
+                ("Europe", "London"),
+                ("North America", "New York"),
+                ("South America", "Quito"),
+                ("North America", "Toronto"),
+            ],
+        )
+
+    def test_order_by_not_merged_by_default(self):
+        sess = self._fixture_data()
+
+        # results are concatenated in the order of the execute_chooser
+        eq_(
+            [
+                loc.city
+                for loc in sess.scalars(
+                    select(WeatherLocation).order_by(
+                        WeatherLocation.continent.desc(), WeatherLocation.id
+                    )
+                )
+            ],
+            [
+                "New York",
+                "Toronto",
+                "Tokyo",
+                "London",
+                "Dublin",
+                "Brasila",
+                "Quito",
+            ],
+        )
+
+    def test_order_by_not_in_columns(self):
+        sess = self._fixture_data()
+        sess.ordered_merge = True
+
+        # the ORDER BY can't be evaluated from the rows, as "city" is
+        # deferred
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Could not locate column in row for column "
+            "'weather_locations.city'",
+        ):
+            sess.scalars(
+                select(WeatherLocation).order_by(WeatherLocation.city)
+            )
+
 
 class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
     def _init_dbs(self):
@@ -688,6 +813,181 @@ class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
         )
 
 
+class ConcurrentDistinctEngineShardTest(DistinctEngineShardTest):
+    session_kw = {"concurrent_shards": True}
+
+    def test_shards_invoked_in_worker_threads(self):
+        sess = self._fixture_data()
+
+        thread_names = set()
+
+        def before_execute(conn, cursor, statement, *arg):
+            if statement.startswith("SELECT"):
+                thread_names.add(threading.current_thread().name)
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", before_execute)
+
+        eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+        assert thread_names
+        assert threading.current_thread().name not in thread_names
+
+    def test_results_in_chooser_order(self):
+        sess = self._fixture_data()
+
+        # without ORDER BY, shard results are concatenated in
+        # execute_chooser order, no matter which shard finishes first
+        eq_(
+            [loc.continent for loc in sess.scalars(select(WeatherLocation))],
+            [
+                "North America",
+                "North America",
+                "Asia",
+                "Europe",
+                "Europe",
+                "South America",
+                "South America",
+            ],
+        )
+
+    def test_identity_map_populated(self):
+        sess = self._fixture_data()
+
+        locations = sess.scalars(select(WeatherLocation)).all()
+        for loc in locations:
+            is_(sess.get(WeatherLocation, loc.id), loc)
+        eq_(
+            {inspect(loc).key[2] for loc in locations},
+            {"north_america", "asia", "europe", "south_america"},
+        )
+
+    def test_shard_timeout(self):
+        sess = self._fixture_data()
+        sess.shard_timeout = 0.1
+
+        release = threading.Event()
+
+        def before_execute(conn, cursor, statement, *arg):
+            if statement.startswith("SELECT"):
+                release.wait(5)
+
+        event.listen(self.dbs[2], "before_cursor_execute", before_execute)
+
+        invalidated = []
+        event.listen(
+            self.dbs[2],
+            "invalidate",
+            lambda dbapi_con, rec, exc: invalidated.append(
+                threading.current_thread().name
+            ),
+        )
+
+        try:
+            with expect_raises_message(
+                ShardTimeoutError,
+                "Shard 'europe' did not complete within 0.1 seconds",
+            ):
+                sess.scalars(select(WeatherLocation)).all()
+            eq_(invalidated, [])
+        finally:
+            release.set()
+            sess.close()
+
+        # the worker discards the abandoned connection once its statement
+        # returns, and close() waits for that to happen
+        eq_(len(invalidated), 1)
+        assert invalidated[0] != threading.current_thread().name
+
+    def test_shard_timeout_results_closed_once(self):
+        sess = self._fixture_data()
+        sess.shard_timeout = 0.1
+
+        release = threading.Event()
+        discarded = threading.Event()
+
+        def before_execute(conn, cursor, statement, *arg):
+            if statement.startswith("SELECT"):
+                release.wait(5)
+
+        event.listen(self.dbs[2], "before_cursor_execute", before_execute)
+        event.listen(
+            self.dbs[2],
+            "invalidate",
+            lambda dbapi_con, rec, exc: discarded.set(),
+        )
+
+        class WaitForDiscard(ShardTimeoutError):
+            # the worker completes the abandoned shard and discards it
+            # before the calling thread cleans up after the timeout
+            def __init__(self, *arg):
+                super().__init__(*arg)
+                release.set()
+                discarded.wait(5)
+
+        closed = []
+        close = CursorResult.close
+
+        def close_result(result):
+            if result.context.root_connection.engine is self.dbs[2]:
+                closed.append(result)
+            close(result)
+
+        try:
+            with mock.patch.object(
+                horizontal_shard, "ShardTimeoutError", WaitForDiscard
+            ), mock.patch.object(
+                CursorResult, "close", close_result
+            ), expect_raises_message(
+                ShardTimeoutError,
+                "Shard 'europe' did not complete within 0.1 seconds",
+            ):
+                sess.scalars(select(WeatherLocation)).all()
+        finally:
+            release.set()
+            sess.close()
+
+        is_true(discarded.is_set())
+        eq_(len(closed), 1)
+
+    def test_orm_loading_in_calling_thread(self):
+        sess = self._fixture_data()
+
+        thread_names = set()
+
+        @event.listens_for(sess, "loaded_as_persistent")
+        def loaded(session, instance):
+            thread_names.add(threading.current_thread().name)
+
+        eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+        eq_(thread_names, {threading.current_thread().name})
+
+    def test_shard_error_propagates(self):
+        sess = self._fixture_data()
+
+        def before_execute(conn, cursor, statement, *arg):
+            if statement.startswith("SELECT"):
+                raise ValueError("shard failure")
+
+        event.listen(self.dbs[1], "before_cursor_execute", before_execute)
+
+        with expect_raises_message(ValueError, "shard failure"):
+            sess.scalars(select(WeatherLocation)).all()
+        sess.close()
+
+    def test_shared_executor(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            sess = self._fixture_data()
+            sess = sharded_session(shard_executor=executor)
+            eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+            sess.close()
+
+            # the executor is not owned by the session
+            eq_(executor.submit(lambda: 5).result(), 5)
+        finally:
+            executor.shutdown()
+
+
 class LegacyAPIShardTest(DistinctEngineShardTest):
     @classmethod
     def setup_session(cls):
@@ -778,6 +1078,13 @@ class AttachedFileShardTest(ShardTest, fixtures.MappedTest):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
 
+class ConcurrentAttachedFileShardTest(AttachedFileShardTest):
+    """all shards share a single connection; they are grouped and
+    invoked serially in the same worker."""
+
+    session_kw = {"concurrent_shards": True}
+
+
 class TableNameConventionShardTest(ShardTest, fixtures.MappedTest):
     """This fixture uses a single SQLite database along with a table naming
     convention to achieve sharding.   Event hooks are used to rewrite SQL
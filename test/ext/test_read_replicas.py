@@ -0,0 +1,334 @@
+import time
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy import exc
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy import text
+from sqlalchemy import update
+from sqlalchemy.ext.read_replicas import ReplicaGroup
+from sqlalchemy.ext.read_replicas import ReplicaSession
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import expect_warnings
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_true
+
+
+class ReplicaGroupTest(fixtures.DeclarativeMappedTest):
+    run_create_tables = None
+    run_inserts = None
+    run_deletes = None
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class User(Base):
+            __tablename__ = "users"
+
+            id: Mapped[int] = mapped_column(Integer, primary_key=True)
+            name: Mapped[str] = mapped_column(String(50))
+
+    def setup_test(self):
+        User = self.classes.User
+
+        self.engines = {}
+        for name in ("primary", "replica1", "replica2"):
+            engine = create_engine("sqlite://", poolclass=StaticPool)
+            User.__table__.create(engine)
+            with engine.begin() as conn:
+                conn.execute(User.__table__.insert(), {"id": 1, "name": name})
+            self.engines[name] = engine
+        self.sessions = []
+
+    def teardown_test(self):
+        for session in self.sessions:
+            session.close()
+        for engine in self.engines.values():
+            engine.dispose()
+
+    def _group(self, **kw):
+        return ReplicaGroup(
+            self.engines["primary"],
+            [self.engines["replica1"], self.engines["replica2"]],
+            **kw,
+        )
+
+    def _session(self, **kw):
+        return self._track(ReplicaSession(self._group(**kw)))
+
+    def _track(self, session):
+        self.sessions.append(session)
+        return session
+
+    def _read(self, session, stmt=None):
+        if stmt is None:
+            User = self.classes.User
+            stmt = select(User.name).where(User.id == 1)
+        return session.scalar(stmt)
+
+    def test_reads_to_replica(self):
+        s = self._session()
+        is_(s.get_bind(), self.engines["primary"])
+        eq_(self._read(s), "replica1")
+
+    def test_least_outstanding(self):
+        group = self._group()
+
+        with group.connect(readonly=True) as c1:
+            eq_(c1.scalar(text("select name from users")), "replica1")
+            eq_(group.stats[0].outstanding, 1)
+
+            with group.connect(readonly=True) as c2:
+                eq_(c2.scalar(text("select name from users")), "replica2")
+
+        eq_(group.stats[0].outstanding, 0)
+        eq_(group.stats[1].outstanding, 0)
+
+        # ties are broken by number of times routed
+        is_(group.choose_replica(), self.engines["replica1"])
+        is_(group.choose_replica(), self.engines["replica2"])
+
+    def test_connect_not_readonly(self):
+        group = self._group()
+        with group.connect() as conn:
+            eq_(conn.scalar(text("select name from users")), "primary")
+
+    def test_flush_uses_primary_in_transaction(self):
+        User = self.classes.User
+
+        s = self._session()
+        eq_(self._read(s), "replica1")
+
+        s.add(User(id=2, name="new"))
+        s.flush()
+        eq_(self._read(s), "primary")
+        eq_(self._read(s, select(User.name).where(User.id == 2)), "new")
+        s.commit()
+
+        # replica1 has been routed to once already
+        eq_(self._read(s), "replica2")
+
+    def test_dml_uses_primary_in_transaction(self):
+        User = self.classes.User
+
+        s = self._session()
+        s.execute(update(User).values(name="updated"))
+        eq_(self._read(s), "updated")
+        s.rollback()
+
+        eq_(self._read(s), "replica1")
+
+    def test_sticky_duration(self):
+        User = self.classes.User
+
+        s = self._session(sticky_duration=100)
+        s.add(User(id=2, name="new"))
+        s.commit()
+
+        eq_(self._read(s), "primary")
+
+        s._sticky_until = time.time() - 1
+        eq_(self._read(s), "replica1")
+
+    @testing.combinations(
+        lambda User: select(User.name).with_for_update(),
+        lambda User: select(User.name).execution_options(use_primary=True),
+        lambda: text("select name from users"),
+        argnames="stmt",
+    )
+    def test_primary_statements(self, stmt):
+        s = self._session()
+        eq_(
+            self._read(
+                s, testing.resolve_lambda(stmt, User=self.classes.User)
+            ),
+            "primary",
+        )
+
+    def test_bind_argument(self):
+        User = self.classes.User
+
+        s = self._session()
+        eq_(
+            s.scalar(select(User.name), bind_arguments={"use_primary": True}),
+            "primary",
+        )
+
+    @testing.combinations("execute", "scalars", "query", argnames="method")
+    def test_execution_option(self, method):
+        User = self.classes.User
+
+        s = self._session()
+        stmt = select(User.name)
+        opts = {"use_primary": True}
+
+        if method == "execute":
+            result = s.execute(stmt, execution_options=opts).scalar()
+        elif method == "scalars":
+            result = s.scalars(stmt, execution_options=opts).first()
+        else:
+            result = s.query(User.name).execution_options(**opts).scalar()
+        eq_(result, "primary")
+
+        eq_(self._read(s), "replica1")
+
+    def test_orm_entities(self):
+        User = self.classes.User
+
+        s = self._session()
+        u1 = s.get(User, 1)
+        eq_(u1.name, "replica1")
+
+        u1.name = "changed"
+        s.commit()
+
+        with self.engines["primary"].connect() as conn:
+            eq_(conn.scalar(text("select name from users")), "changed")
+
+    def test_lag(self):
+        lags = {
+            self.engines["replica1"]: 10,
+            self.engines["replica2"]: 1,
+        }
+        s = self._session(
+            replica_lag=lags.__getitem__, max_lag=5, lag_check_interval=0
+        )
+        eq_(self._read(s), "replica2")
+        s.close()
+
+        group = s.replica_group
+        eq_([stats.lag for stats in group.stats], [10, 1])
+        eq_([stats.available for stats in group.stats], [False, True])
+
+        lags[self.engines["replica2"]] = 20
+        eq_(self._read(s), "primary")
+
+    def test_lag_check_interval(self):
+        calls = []
+
+        def replica_lag(engine):
+            calls.append(engine)
+            return 0
+
+        group = self._group(
+            replica_lag=replica_lag, max_lag=5, lag_check_interval=100
+        )
+        group.choose_replica()
+        group.choose_replica()
+        eq_(len(calls), 2)
+
+    def test_lag_check_claimed(self):
+        calls = []
+
+        def replica_lag(engine):
+            calls.append(engine)
+            # a concurrent selection while the lag is being checked uses
+            # the last known state, rather than checking again
+            stats = group.stats[len(calls) - 1]
+            is_true(stats in group._available())
+            return 10
+
+        group = self._group(
+            replica_lag=replica_lag, max_lag=5, lag_check_interval=100
+        )
+        is_(group.choose_replica(), self.engines["primary"])
+        eq_(calls, [self.engines["replica1"], self.engines["replica2"]])
+
+    def test_lag_error(self):
+        def replica_lag(engine):
+            if engine is self.engines["replica1"]:
+                raise Exception("can't connect")
+            return 0
+
+        group = self._group(replica_lag=replica_lag, max_lag=5)
+        with expect_warnings("Could not determine replication lag"):
+            is_(group.choose_replica(), self.engines["replica2"])
+
+    def test_latency_strategy(self):
+        group = self._group(strategy="latency")
+
+        # replicas without measurements are tried first
+        is_(group.choose_replica(), self.engines["replica1"])
+        group.stats[0].latency = 0.5
+        is_(group.choose_replica(), self.engines["replica2"])
+        group.stats[1].latency = 0.25
+
+        with patch(
+            "sqlalchemy.ext.read_replicas.random.choices",
+            side_effect=lambda population, weights: [population[1]],
+        ) as choices:
+            is_(group.choose_replica(), self.engines["replica2"])
+        eq_(choices.mock_calls[0][2], {"weights": [2.0, 4.0]})
+
+    def test_latency_measured(self):
+        group = self._group(strategy="latency")
+        with group.connect(readonly=True) as conn:
+            conn.execute(text("select name from users"))
+            conn.execute(text("select name from users"))
+
+        eq_(group.stats[0].statements, 2)
+        assert group.stats[0].latency > 0
+        eq_(group.stats[1].statements, 0)
+
+    def test_latency_statement_error(self):
+        group = self._group(strategy="latency")
+        with group.connect(readonly=True) as conn:
+            with expect_raises_message(exc.OperationalError, "no such table"):
+                conn.execute(text("select name from nonexistent"))
+            eq_(conn.info, {})
+
+            conn.execute(text("select name from users"))
+
+        eq_(group.stats[0].statements, 1)
+        assert group.stats[0].latency > 0
+
+    def test_custom_strategy(self):
+        group = self._group(strategy=lambda candidates: candidates[-1])
+        is_(group.choose_replica(), self.engines["replica2"])
+
+    def test_unknown_strategy(self):
+        with expect_raises_message(
+            exc.ArgumentError, "Unknown replica selection strategy"
+        ):
+            self._group(strategy="fastest")
+
+    def test_no_replicas(self):
+        group = ReplicaGroup(self.engines["primary"], [])
+        s = self._track(ReplicaSession(group))
+        eq_(self._read(s), "primary")
+
+    def test_stats(self):
+        group = self._group()
+        s = self._track(ReplicaSession(group))
+        self._read(s)
+        s.close()
+
+        stats = group.stats[0].as_dict()
+        eq_(stats["url"], "sqlite://")
+        eq_(stats["routed"], 1)
+        eq_(stats["checkouts"], 1)
+        eq_(stats["outstanding"], 0)
+        eq_(stats["statements"], 1)
+
+    def test_sessionmaker(self):
+        group = self._group()
+        maker = sessionmaker(class_=ReplicaSession, replica_group=group)
+        s = self._track(maker())
+        is_(s.replica_group, group)
+        eq_(self._read(s), "replica1")
+
+    def test_bind_not_accepted(self):
+        with expect_raises_message(
+            exc.ArgumentError, "ReplicaSession is bound to the engines"
+        ):
+            ReplicaSession(self._group(), bind=self.engines["primary"])
@@ -1,16 +1,26 @@
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import inspect
 from sqlalchemy import literal
 from sqlalchemy import literal_column
 from sqlalchemy import select
 from sqlalchemy import testing
 from sqlalchemy import text
+from sqlalchemy.orm import defer
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
 from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.assertions import expect_raises
 from sqlalchemy.testing.assertions import expect_raises_message
 from sqlalchemy.testing.fixtures import fixture_session
 from . import _fixtures
@@ -199,6 +209,321 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class BulkInstancesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def setup_test(self):
+        # the fixture tables have only a handful of rows
+        self._min_rows = mock.patch.object(
+            loading, "_BULK_INSTANCES_MIN_ROWS", 1
+        )
+        self._min_rows.start()
+
+    def teardown_test(self):
+        self._min_rows.stop()
+
+    def _processors(self):
+        """patch _instance_processor() so that the processors it produces
+        are collected, and the chunks returned by their bulk routines, if
+        any, are recorded on each processor as ``bulk_chunks``."""
+
+        procs = []
+        instance_processor = loading._instance_processor
+
+        def go(*arg, **kw):
+            proc = instance_processor(*arg, **kw)
+            bulk_instances = getattr(proc, "_bulk_instances", None)
+            if bulk_instances is not None:
+                proc.bulk_chunks = bulk_chunks = []
+
+                def record(rows):
+                    chunk = bulk_instances(rows)
+                    bulk_chunks.append(chunk)
+                    return chunk
+
+                proc._bulk_instances = record
+            procs.append(proc)
+            return proc
+
+        return procs, mock.patch.object(loading, "_instance_processor", go)
+
+    @testing.combinations(
+        ("plain", True),
+        ("yield_per", True),
+        ("populate_existing", False),
+        ("load_event", False),
+        ("joinedload", False),
+        argnames="case, expected",
+    )
+    def test_bulk_processor_selected(self, case, expected):
+        User = self.classes.User
+        s = fixture_session()
+
+        canary = mock.Mock()
+
+        stmt = select(User).order_by(User.id)
+        if case == "yield_per":
+            stmt = stmt.execution_options(yield_per=2)
+        elif case == "populate_existing":
+            stmt = stmt.execution_options(populate_existing=True)
+        elif case == "load_event":
+            event.listen(User, "load", canary)
+        elif case == "joinedload":
+            stmt = stmt.options(joinedload(User.addresses))
+
+        procs, patch = self._processors()
+        try:
+            with patch:
+                result = s.scalars(stmt)
+                if case == "joinedload":
+                    result = result.unique()
+                users = result.all()
+        finally:
+            if case == "load_event":
+                event.remove(User, "load", canary)
+
+        eq_([u.id for u in users], [7, 8, 9, 10])
+        # the lead entity's processor is produced last, after those of
+        # any eager loaders
+        eq_(hasattr(procs[-1], "_bulk_instances"), expected)
+
+    def test_bulk_new_objects(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        procs, patch = self._processors()
+        with patch:
+            users = s.scalars(select(User).order_by(User.id)).all()
+        eq_(procs[-1].bulk_chunks, [users])
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        for user in users:
+            state = inspect(user)
+            is_true(state.persistent)
+            eq_(state.key, (User, (user.id,), None))
+            is_(s.identity_map[state.key], user)
+            eq_(state.committed_state, {})
+        is_false(s.dirty)
+
+        # relationships are still lazy loaded
+        eq_(len(users[1].addresses), 3)
+
+    def test_bulk_too_few_rows(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        procs, patch = self._processors()
+        with patch, mock.patch.object(loading, "_BULK_INSTANCES_MIN_ROWS", 5):
+            users = s.scalars(select(User).order_by(User.id)).all()
+        # the routine isn't invoked for a chunk of fewer rows
+        eq_(procs[-1].bulk_chunks, [])
+        eq_([u.id for u in users], [7, 8, 9, 10])
+
+    def test_bulk_existing_objects(self):
+        User = self.classes.User
+        s = fixture_session(autoflush=False)
+
+        ed = s.get(User, 8)
+        ed.name = "edward"
+
+        procs, patch = self._processors()
+        with patch:
+            users = s.scalars(select(User).order_by(User.id)).all()
+        eq_(procs[-1].bulk_chunks, [None])
+
+        is_(users[1], ed)
+        eq_(
+            [u.name for u in users],
+            ["jack", "edward", "fred", "chuck"],
+        )
+        eq_(list(s.dirty), [ed])
+
+    def test_bulk_duplicate_identities(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        procs, patch = self._processors()
+        with patch:
+            users = s.scalars(
+                select(User).join(User.addresses).order_by(Address.id)
+            ).all()
+        eq_(procs[-1].bulk_chunks, [None])
+
+        eq_([u.id for u in users], [7, 8, 8, 8, 9])
+        is_(users[1], users[2])
+        is_(users[2], users[3])
+
+    def test_bulk_yield_per(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        procs, patch = self._processors()
+        with patch:
+            result = s.scalars(
+                select(User).order_by(User.id).execution_options(yield_per=3)
+            )
+            partitions = list(result.partitions())
+        eq_(procs[-1].bulk_chunks, partitions)
+
+        eq_(
+            [[u.id for u in part] for part in partitions],
+            [[7, 8, 9], [10]],
+        )
+
+    def test_bulk_null_primary_key(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = text(
+            "SELECT users.id, users.name FROM users "
+            "UNION ALL SELECT NULL, NULL ORDER BY 1"
+        )
+        procs, patch = self._processors()
+        with patch:
+            users = s.scalars(select(User).from_statement(stmt)).all()
+        eq_(procs[-1].bulk_chunks, [None])
+
+        eq_(users[0], None)
+        eq_([u.id for u in users[1:]], [7, 8, 9, 10])
+
+
+class ReadonlyObjectsTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_readonly_objects(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        users = s.scalars(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_objects=True)
+        ).all()
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        for user in users:
+            is_true(isinstance(user, User))
+            is_(inspect(user, raiseerr=False), None)
+        eq_(len(s.identity_map), 0)
+
+    def test_not_identity_mapped(self):
+        User = self.classes.User
+        s = fixture_session(autoflush=False)
+
+        ed = s.get(User, 8)
+        ed.name = "edward"
+
+        readonly_ed = s.scalars(
+            select(User)
+            .filter_by(id=8)
+            .execution_options(readonly_objects=True)
+        ).one()
+        is_not(readonly_ed, ed)
+        eq_(readonly_ed.name, "ed")
+        eq_(ed.name, "edward")
+
+    def test_duplicate_rows(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        users = s.scalars(
+            select(User)
+            .join(User.addresses)
+            .filter(User.id == 8)
+            .execution_options(readonly_objects=True)
+        ).all()
+        eq_([u.id for u in users], [8, 8, 8])
+        is_not(users[0], users[1])
+
+    def test_entities_and_columns(self):
+        User, Address = self.classes("User", "Address")
+        s = fixture_session()
+
+        rows = s.execute(
+            select(User, Address.email_address, Address)
+            .join(User.addresses)
+            .order_by(Address.id)
+            .execution_options(readonly_objects=True)
+        ).all()
+        eq_(
+            [(u.id, email, a.id) for u, email, a in rows],
+            [
+                (7, "jack@bean.com", 1),
+                (8, "ed@wood.com", 2),
+                (8, "ed@bettyboop.com", 3),
+                (8, "ed@lala.com", 4),
+                (9, "fred@fred.com", 5),
+            ],
+        )
+        eq_(len(s.identity_map), 0)
+
+    def test_yield_per(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        result = s.scalars(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_objects=True, yield_per=3)
+        )
+        eq_(
+            [[u.id for u in part] for part in result.partitions()],
+            [[7, 8, 9], [10]],
+        )
+
+    def test_unloaded_attributes_raise(self):
+        User = self.classes.User
+        s = fixture_session()
+
+        user = s.scalars(
+            select(User)
+            .filter_by(id=7)
+            .options(defer(User.name))
+            .execution_options(readonly_objects=True)
+        ).one()
+        eq_(user.id, 7)
+
+        with expect_raises(orm_exc.UnmappedInstanceError):
+            user.name
+        with expect_raises(orm_exc.UnmappedInstanceError):
+            user.addresses
+
+    @testing.combinations(joinedload, selectinload, argnames="loader")
+    def test_no_eager_loaders(self, loader):
+        User = self.classes.User
+        s = fixture_session()
+
+        stmt = (
+            select(User)
+            .options(loader(User.addresses))
+            .execution_options(readonly_objects=True)
+        )
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "The readonly_objects execution option can't be used with "
+            "eager loaders",
+        ):
+            s.scalars(stmt).unique().all()
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import inspect as _py_inspect
 import pickle
 from typing import TYPE_CHECKING
@@ -125,6 +126,77 @@ class ExecutionTest(_fixtures.FixtureTest):
                 sess.scalar("select id from users where id=:id", {"id": 7})
 
 
+class PipelineFlushTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    @testing.fixture
+    def pipeline_session(self, connection):
+        canary = mock.Mock()
+        statements = []
+
+        @contextlib.contextmanager
+        def do_pipeline(dbapi_connection):
+            canary.enter()
+            yield canary.pipeline
+            canary.exit()
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, stmt, *arg):
+            statements.append((stmt, conn._pipeline is not None))
+
+        def go(**kw):
+            return Session(connection, **kw), canary, statements
+
+        with mock.patch.multiple(
+            connection.dialect,
+            supports_pipeline=True,
+            do_pipeline=do_pipeline,
+            create=True,
+        ):
+            yield go
+
+    @testing.combinations(True, False, argnames="pipeline_flush")
+    def test_flush(self, pipeline_session, pipeline_flush):
+        User, Address, users, addresses = (
+            self.classes.User,
+            self.classes.Address,
+            self.tables.users,
+            self.tables.addresses,
+        )
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={"addresses": relationship(Address)},
+        )
+        self.mapper_registry.map_imperatively(Address, addresses)
+
+        sess, canary, statements = pipeline_session(
+            pipeline_flush=pipeline_flush
+        )
+        sess.add(
+            User(
+                id=7,
+                name="u7",
+                addresses=[Address(id=1, email_address="a1")],
+            )
+        )
+        sess.flush()
+
+        eq_(
+            [stmt.split(" ")[2] for stmt, _ in statements],
+            ["users", "addresses"],
+        )
+        if pipeline_flush:
+            eq_(canary.mock_calls, [mock.call.enter(), mock.call.exit()])
+            is_true(all(in_pipeline for _, in_pipeline in statements))
+        else:
+            eq_(canary.mock_calls, [])
+            is_false(any(in_pipeline for _, in_pipeline in statements))
+
+        eq_(sess.connection()._pipeline, None)
+        eq_(sess.scalars(select(Address.id)).all(), [1])
+
+
 class TransScopingTest(_fixtures.FixtureTest):
     run_inserts = None
     __prefer_requires__ = ("independent_connections",)
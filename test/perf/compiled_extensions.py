@@ -285,7 +285,7 @@ class Processor(Case):
         from sqlalchemy.cyextension import processors as mod
 
         mod.to_decimal_processor_factory = (
-            lambda t, s: mod.DecimalResultProcessor(t, "%%.%df" % s).process
+            lambda t, s: mod.DecimalResultProcessor(t, "%%.%df" % s, s).process
         )
 
         return mod
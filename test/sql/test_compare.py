@@ -76,6 +76,7 @@ from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_not
 from sqlalchemy.testing import is_true
+from sqlalchemy.testing import mock
 from sqlalchemy.testing import ne_
 from sqlalchemy.testing.assertions import expect_warnings
 from sqlalchemy.testing.util import random_choices
@@ -1199,6 +1200,33 @@ class CacheKeyTest(fixtures.CacheKeyFixture, CoreFixtures, fixtures.TestBase):
             for fixture in fixtures_:
                 self._run_cache_key_fixture(fixture, compare_values)
 
+    @testing.requires.cextensions
+    def test_cache_key_cython_traversal(self):
+        from sqlalchemy.cyextension import util as cy_util
+        from sqlalchemy.sql import cache_key
+
+        is_(HasCacheKey._gen_cache_key, cy_util._gen_cache_key)
+
+        for fixtures_ in [
+            self.fixtures,
+            self.dont_compare_values_fixtures,
+            self.type_cache_key_fixtures,
+        ]:
+            for fixture in fixtures_:
+                for elem in fixture():
+                    cy_key = HasCacheKey._generate_cache_key_for_object(elem)
+                    with mock.patch.object(
+                        HasCacheKey,
+                        "_gen_cache_key",
+                        cache_key._py_gen_cache_key,
+                    ):
+                        py_key = HasCacheKey._generate_cache_key_for_object(
+                            elem
+                        )
+                    eq_(cy_key, py_key)
+                    if cy_key is not None:
+                        eq_(cy_key.bindparams, py_key.bindparams)
+
     def test_cache_key_equal(self):
         for fixture in self.equal_fixtures:
             self._run_cache_key_equal_fixture(fixture, True)
@@ -1340,6 +1368,152 @@ class CacheKeyTest(fixtures.CacheKeyFixture, CoreFixtures, fixtures.TestBase):
         is_not(ck1, None)
         is_not(ck3, None)
 
+    def test_table_column_key_memoized(self):
+        m = MetaData()
+        t1 = Table("t1", m, Column("a", Integer), Column("b", Integer))
+        t2 = Table("t2", m, Column("a", Integer))
+
+        s1 = select(t1.c.a).where(t1.c.b == 5)
+        s2 = select(t1.c.a).where(t1.c.b == 5)
+        eq_(s1._generate_cache_key(), s2._generate_cache_key())
+        is_not(t1.c.a.__dict__.get("_static_cache_key_memo"), None)
+
+        # the type of the column is replaced after the fact
+        ck1 = select(t2.c.a)._generate_cache_key()
+        t2.c.a.type = String()
+        ne_(select(t2.c.a)._generate_cache_key(), ck1)
+
+    def test_table_column_key_memo_annotated(self):
+        m = MetaData()
+        t1 = Table("t1", m, Column("a", Integer))
+
+        a1 = t1.c.a._annotate({"foo": "bar"})
+        ck1 = select(a1)._generate_cache_key()
+
+        # the memo is made on the column and shared with annotated copies,
+        # including those made beforehand
+        memo = t1.c.a.__dict__["_static_cache_key_memo"]
+        is_(a1.__dict__["_static_cache_key_memo"], memo)
+        a2 = t1.c.a._annotate({"foo": "bar"})
+        is_(a2.__dict__["_static_cache_key_memo"], memo)
+
+        eq_(select(a2)._generate_cache_key(), ck1)
+        ne_(select(t1.c.a)._generate_cache_key(), ck1)
+        ne_(
+            select(t1.c.a._annotate({"foo": "bat"}))._generate_cache_key(),
+            ck1,
+        )
+
+        # same key as the traversal that doesn't make use of the memo
+        eq_(
+            a2._gen_cache_key(visitors.anon_map(), []),
+            HasCacheKey._gen_cache_key(a2, visitors.anon_map(), []),
+        )
+
+    def test_table_column_key_nocache_type(self):
+        class NotCacheable(TypeDecorator):
+            impl = Integer
+
+        m = MetaData()
+        t1 = Table("t1", m, Column("a", NotCacheable()))
+        with expect_warnings("TypeDecorator NotCacheable.* will not produce"):
+            is_(select(t1.c.a)._generate_cache_key(), None)
+        is_(select(t1.c.a)._generate_cache_key(), None)
+
+    def test_join_key_memoized(self):
+        m = MetaData()
+        t1 = Table("t1", m, Column("id", Integer))
+        t2 = Table("t2", m, Column("id", Integer), Column("t1id", Integer))
+
+        j = t1.join(t2, t1.c.id == t2.c.t1id)
+        ck1 = select(t1.c.id).select_from(j)._generate_cache_key()
+        assert isinstance(j._static_cache_key_memo[1], tuple)
+
+        j2 = t1.join(t2, t1.c.id == t2.c.t1id)
+        eq_(ck1, select(t1.c.id).select_from(j2)._generate_cache_key())
+
+        j3 = t1.join(t2, t1.c.id == t2.c.id)
+        ne_(ck1, select(t1.c.id).select_from(j3)._generate_cache_key())
+
+    def test_join_key_w_params_not_memoized(self):
+        m = MetaData()
+        t1 = Table("t1", m, Column("id", Integer))
+        t2 = Table("t2", m, Column("id", Integer), Column("x", Integer))
+
+        j = t1.join(t2, and_(t1.c.id == t2.c.id, t2.c.x == 5))
+        ck = select(t1.c.id).select_from(j)._generate_cache_key()
+        is_(j._static_cache_key_columns, None)
+        assert "_static_cache_key_memo" not in j.__dict__
+        eq_([b.value for b in ck.bindparams], [5])
+
+    def test_join_key_w_anon_alias_not_memoized(self):
+        m = MetaData()
+        t1 = Table("t1", m, Column("id", Integer), Column("x", Integer))
+        a1 = t1.alias()
+        a2 = t1.alias()
+
+        j = a1.join(a2, a1.c.id == a2.c.id)
+
+        # the statements differ only in which anonymous alias is
+        # referred to outside of the join
+        ck1 = select(a1.c.x).select_from(j)._generate_cache_key()
+        ck2 = select(a2.c.x).select_from(j)._generate_cache_key()
+        is_(j._static_cache_key_columns, None)
+        assert "_static_cache_key_memo" not in j.__dict__
+        ne_(ck1, ck2)
+
+    def test_join_key_w_named_alias_not_memoized(self):
+        m = MetaData()
+        t1 = Table("t1", m, Column("id", Integer))
+        t2 = Table("t2", m, Column("id", Integer), Column("x", Integer))
+        a = t2.alias("a")
+        a2 = t2.alias("a")
+
+        j = t1.join(a, t1.c.id == a.c.id)
+
+        # the second statement renders an additional "t2 AS a" in the
+        # FROM clause, as a2 is a separate alias from the one in the join
+        ck1 = select(a.c.x).select_from(j)._generate_cache_key()
+        ck2 = select(a2.c.x).select_from(j)._generate_cache_key()
+        is_(j._static_cache_key_columns, None)
+        assert "_static_cache_key_memo" not in j.__dict__
+        ne_(ck1.key, ck2.key)
+
+    def test_join_key_column_appended(self):
+        t1 = table("t1", column("id", Integer))
+        t2 = table("t2", column("id", Integer))
+
+        j = t1.join(t2, t1.c.id == t2.c.id)
+        ck1 = select(t1.c.id).select_from(j)._generate_cache_key()
+
+        t2.append_column(column("x", Integer))
+        ck2 = select(t1.c.id).select_from(j)._generate_cache_key()
+        ne_(ck1, ck2)
+        eq_(
+            ck2,
+            select(t1.c.id)
+            .select_from(t1.join(t2, t1.c.id == t2.c.id))
+            ._generate_cache_key(),
+        )
+
+    @testing.combinations(True, False, argnames="use_alias")
+    def test_join_key_column_type_replaced(self, use_alias):
+        m = MetaData()
+        t1 = Table("t1", m, Column("id", Integer))
+        t2 = Table("t2", m, Column("id", Integer), Column("t1id", Integer))
+
+        right = t2.alias("t2a") if use_alias else t2
+        j = t1.join(right, t1.c.id == right.c.t1id)
+        select(t1.c.id).select_from(j)._generate_cache_key()
+
+        t2.c.t1id.type = String()
+        eq_(
+            select(t1.c.id).select_from(j)._generate_cache_key(),
+            select(t1.c.id)
+            .select_from(t1.join(right, t1.c.id == right.c.t1id))
+            ._generate_cache_key(),
+        )
+
 
 class CompareAndCopyTest(CoreFixtures, fixtures.TestBase):
     @classmethod
@@ -5767,6 +5767,115 @@ class CompileUXTest(fixtures.TestBase):
             ],
         )
 
+    @testing.variation("paramstyle", ["named", "qmark", "numeric"])
+    def test_in_clause_padding(self, paramstyle):
+        stmt = select(column("q")).where(
+            column("x").in_(bindparam("x", expanding=True)),
+            column("y").not_in(bindparam("y", expanding=True)),
+            column("z") == bindparam("z"),
+        )
+        dialect = default.DefaultDialect(
+            paramstyle=paramstyle.name, in_clause_padding=True
+        )
+        compiled = stmt.compile(dialect=dialect)
+
+        es = compiled.construct_expanded_state(
+            {"x": [1, 2, 3], "y": [5, 6], "z": 7}
+        )
+        if paramstyle.named:
+            eq_ignore_whitespace(
+                es.statement,
+                "SELECT q WHERE x IN (:x_1, :x_2, :x_3, :x_4) "
+                "AND (y NOT IN (:y_1, :y_2)) AND z = :z",
+            )
+        elif paramstyle.qmark:
+            eq_ignore_whitespace(
+                es.statement,
+                "SELECT q WHERE x IN (?, ?, ?, ?) "
+                "AND (y NOT IN (?, ?)) AND z = ?",
+            )
+            eq_(es.positional_parameters, (1, 2, 3, 3, 5, 6, 7))
+        elif paramstyle.numeric:
+            eq_ignore_whitespace(
+                es.statement,
+                "SELECT q WHERE x IN (:2, :3, :4, :5) "
+                "AND (y NOT IN (:6, :7)) AND z = :1",
+            )
+        else:
+            paramstyle.fail()
+
+        eq_(
+            es.parameters,
+            {
+                "x_1": 1,
+                "x_2": 2,
+                "x_3": 3,
+                "x_4": 3,
+                "y_1": 5,
+                "y_2": 6,
+                "z": 7,
+            },
+        )
+
+        # the same sizes reuse the same string
+        es2 = compiled.construct_expanded_state(
+            {"x": [4, 5, 6, 7], "y": [8, 9], "z": 10}
+        )
+        is_(es2.statement, es.statement)
+        eq_(es2.parameters["x_4"], 7)
+
+        es3 = compiled.construct_expanded_state(
+            {"x": [1, 2, 3, 4, 5], "y": [1], "z": 10}
+        )
+        eq_(len(es3.parameter_expansion["x"]), 8)
+        eq_(len(es3.parameter_expansion["y"]), 1)
+        eq_(len(compiled._padded_statements), 2)
+
+    def test_in_clause_padding_tuples(self):
+        stmt = select(column("q")).where(
+            tuple_(column("a"), column("b")).in_(
+                [(1, "a"), (2, "b"), (3, "c")]
+            )
+        )
+        dialect = default.DefaultDialect(in_clause_padding=True)
+        es = stmt.compile(dialect=dialect).construct_expanded_state()
+        eq_ignore_whitespace(
+            es.statement,
+            "SELECT q WHERE (a, b) IN ((:param_1_1_1, :param_1_1_2), "
+            "(:param_1_2_1, :param_1_2_2), (:param_1_3_1, :param_1_3_2), "
+            "(:param_1_4_1, :param_1_4_2))",
+        )
+        eq_(es.parameters["param_1_4_1"], 3)
+        eq_(es.parameters["param_1_4_2"], "c")
+
+    def test_in_clause_padding_not_used(self):
+        stmt = select(column("q")).where(
+            column("x").in_([1, 2, 3]),
+            column("y", Integer).in_(
+                bindparam("y", expanding=True, literal_execute=True)
+            ),
+        )
+        compiled = stmt.compile(dialect=default.DefaultDialect())
+        es = compiled.construct_expanded_state({"y": [4, 5, 6]})
+        eq_ignore_whitespace(
+            es.statement,
+            "SELECT q WHERE x IN (:x_1_1, :x_1_2, :x_1_3) "
+            "AND y IN (4, 5, 6)",
+        )
+
+        # literal execute values are not padded; the statement isn't
+        # memoized as it has values rendered in it
+        compiled = stmt.compile(
+            dialect=default.DefaultDialect(in_clause_padding=True)
+        )
+        es = compiled.construct_expanded_state({"y": [4, 5, 6]})
+        eq_ignore_whitespace(
+            es.statement,
+            "SELECT q WHERE x IN (:x_1_1, :x_1_2, :x_1_3, :x_1_4) "
+            "AND y IN (4, 5, 6)",
+        )
+        is_none(compiled._padded_statements)
+
 
 class UnsupportedTest(fixtures.TestBase):
     def test_unsupported_element_str_visit_name(self):
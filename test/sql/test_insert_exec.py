@@ -1,3 +1,4 @@
+import array
 import contextlib
 import functools
 import itertools
@@ -1181,6 +1182,147 @@ class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
                 conn.execute(stmt.returning(t.c.id), data)
 
 
+class ColumnarInsertTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class Upper(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", Integer),
+            Column("y", Upper),
+            Column("z", String(50), default="zdefault"),
+        )
+
+    @testing.combinations("string", "column", argnames="keytype")
+    def test_insert(self, connection, keytype):
+        t = self.tables.data
+
+        if keytype == "string":
+            id_, x, y = "id", "x", "y"
+        else:
+            id_, x, y = t.c.id, t.c.x, t.c.y
+
+        result = connection.execute_columnar(
+            t.insert().values(z="zvalue"),
+            {id_: [1, 2, 3], x: (10, 20, 30), y: ["a", "b", None]},
+        )
+        eq_(result.rowcount, 3)
+        eq_(
+            result.context.compiled_parameters[1],
+            {"id": 2, "x": 20, "y": "b", "z": "zvalue"},
+        )
+
+        eq_(
+            connection.execute(t.select().order_by(t.c.id)).all(),
+            [
+                (1, 10, "A", "zvalue"),
+                (2, 20, "B", "zvalue"),
+                (3, 30, None, "zvalue"),
+            ],
+        )
+
+    def test_insert_single_row(self, connection):
+        t = self.tables.data
+
+        connection.execute_columnar(
+            t.insert(), {"id": [1], "x": [10], "z": ["z1"]}
+        )
+        eq_(connection.execute(t.select()).all(), [(1, 10, None, "z1")])
+
+    def test_insert_buffer_protocol(self, connection):
+        t = self.tables.data
+
+        connection.execute_columnar(
+            t.insert(),
+            {
+                "id": array.array("i", [1, 2, 3]),
+                "x": memoryview(array.array("q", [10, 20, 30])),
+                "z": ["z1", "z2", "z3"],
+            },
+        )
+        eq_(
+            connection.execute(select(t.c.id, t.c.x).order_by(t.c.id)).all(),
+            [(1, 10), (2, 20), (3, 30)],
+        )
+
+    def test_insert_python_default(self, connection):
+        """a python-side default for each row uses per-row parameters"""
+
+        t = self.tables.data
+
+        connection.execute_columnar(
+            t.insert(), {"id": [1, 2], "y": ["a", "b"]}
+        )
+        eq_(
+            connection.execute(t.select().order_by(t.c.id)).all(),
+            [(1, None, "A", "zdefault"), (2, None, "B", "zdefault")],
+        )
+
+    @testing.requires.insert_executemany_returning
+    def test_insert_returning(self, connection):
+        t = self.tables.data
+
+        result = connection.execute_columnar(
+            t.insert().returning(t.c.id, t.c.y, sort_by_parameter_order=True),
+            {"id": [5, 6, 7], "y": ["a", "b", "c"], "z": ["z", "z", "z"]},
+        )
+        eq_(result.all(), [(5, "A"), (6, "B"), (7, "C")])
+
+    def test_before_execute_sees_rows(self, connection):
+        t = self.tables.data
+        canary = mock.Mock()
+
+        event.listen(connection, "before_execute", canary)
+
+        connection.execute_columnar(
+            t.insert(), {"id": [1, 2], "x": [10, 20], "z": ["z1", "z2"]}
+        )
+        eq_(
+            list(canary.mock_calls[0][1][2]),
+            [
+                {"id": 1, "x": 10, "z": "z1"},
+                {"id": 2, "x": 20, "z": "z2"},
+            ],
+        )
+
+    @testing.combinations(
+        ({"x": [1, 2], "z": [1]}, "All columns must have the same number"),
+        ({"x": [], "z": []}, "Columnar parameters have no rows"),
+        ({}, "At least one column is required"),
+        ({"x": "12"}, "Column 'x' must be given a sequence of values, not a"),
+        ({"x": 5}, "Column 'x' must be given a sequence of values"),
+        ({5: [1, 2]}, "Columnar parameters must be keyed on string names"),
+        (
+            {"x": memoryview(b"abcd").cast("B", (2, 2))},
+            "Column 'x' must be given a one-dimensional sequence",
+        ),
+        argnames="columns, message",
+    )
+    def test_invalid_columns(self, connection, columns, message):
+        t = self.tables.data
+
+        with expect_raises_message(exc.ArgumentError, message):
+            connection.execute_columnar(t.insert(), columns)
+
+    def test_not_an_insert(self, connection):
+        t = self.tables.data
+
+        with expect_raises_message(
+            exc.ArgumentError, r"execute_columnar\(\) requires an INSERT"
+        ):
+            connection.execute_columnar(t.update(), {"x": [1, 2]})
+
+
 class IMVSentinelTest(fixtures.TestBase):
     __backend__ = True
 
@@ -1,3 +1,4 @@
+import array
 import collections
 import collections.abc as collections_abc
 from contextlib import contextmanager
@@ -12,12 +13,15 @@ from tempfile import mkstemp
 from unittest.mock import Mock
 from unittest.mock import patch
 
+from sqlalchemy import cast
 from sqlalchemy import CHAR
 from sqlalchemy import column
 from sqlalchemy import exc
 from sqlalchemy import exc as sa_exc
+from sqlalchemy import Float
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
+from sqlalchemy import insert_sentinel
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import literal
@@ -2725,6 +2729,57 @@ class KeyTargetingTest(fixtures.TablesTest):
             else:
                 assert col in row._mapping
 
+    def test_adapt_same_columns_reuses_metadata(self, connection):
+        keyed2 = self.tables.keyed2
+
+        cache = {}
+        result = connection.execute(
+            select(keyed2).where(keyed2.c.a == "a2"),
+            execution_options={"compiled_cache": cache},
+        )
+        metadata = result._metadata
+        result.close()
+
+        stmt = select(keyed2).where(keyed2.c.a == "a2")
+        result = connection.execute(
+            stmt, execution_options={"compiled_cache": cache}
+        )
+        is_(result._metadata, metadata)
+        row = result.first()
+        eq_(row._mapping[keyed2.c.b], "b2")
+
+    def test_textual_metadata_cached_by_description(self, connection):
+        stmt = text("select * from keyed2")
+
+        cache = {}
+        results = [
+            connection.execute(
+                stmt, execution_options={"compiled_cache": cache}
+            )
+            for i in range(2)
+        ]
+        for result in results:
+            result.close()
+
+        compiled = results[0].context.compiled
+        is_(results[1].context.compiled, compiled)
+        is_(compiled._cached_metadata, None)
+        is_(results[0]._metadata, results[1]._metadata)
+
+        # a different cursor.description is given its own metadata
+        description = [("a", None, None, None, None, None, None)]
+        metadata = result._metadata_for_description(
+            result.context, compiled, description
+        )
+        eq_(list(metadata.keys), ["a"])
+        is_(
+            result._metadata_for_description(
+                result.context, compiled, description
+            ),
+            metadata,
+        )
+        eq_(len(compiled._cached_metadata_by_description), 2)
+
 
 class PositionalTextTest(fixtures.TablesTest):
     run_inserts = "once"
@@ -3182,6 +3237,67 @@ class AlternateCursorResultTest(fixtures.TablesTest):
                 assertion[idx] = result.cursor_strategy._bufsize
             le_(len(result.cursor_strategy._rowbuffer), max_size)
 
+    def test_buffered_row_byte_budget_narrow(self, row_growth_fixture):
+        """with max_buffer_bytes, narrow rows grow the buffer past the
+        default limit of 1000 rows"""
+
+        result = row_growth_fixture.execution_options(
+            max_buffer_bytes=10000000
+        ).execute(self.table.select())
+
+        sizes = []
+        for row in result:
+            bufsize = result.cursor_strategy._bufsize
+            if not sizes or sizes[-1] != bufsize:
+                sizes.append(bufsize)
+
+        eq_(sizes, [5, 25, 125, 625, 3125, 15625])
+
+    def test_buffered_row_byte_budget_wide(self, row_growth_fixture):
+        """with max_buffer_bytes, wide rows limit the size of the buffer"""
+
+        budget = 100000
+        result = row_growth_fixture.execution_options(
+            max_buffer_bytes=budget
+        ).execute(
+            select(
+                self.table.c.x,
+                (self.table.c.y + literal("x" * 10000)).label("wide"),
+            )
+        )
+
+        sizes = set()
+        for row in result:
+            sizes.add(result.cursor_strategy._bufsize)
+            le_(len(result.cursor_strategy._rowbuffer), budget // 10000)
+
+        # buffer starts at 5 rows, then is limited to however many
+        # rows of approximately 10K each fit into the budget
+        eq_(min(sizes), 5)
+        le_(max(sizes), budget // 10000)
+
+    def test_buffered_row_byte_budget_max_row_buffer(self, row_growth_fixture):
+        result = row_growth_fixture.execution_options(
+            max_buffer_bytes=10000000, max_row_buffer=200
+        ).execute(self.table.select())
+
+        for row in result:
+            le_(len(result.cursor_strategy._rowbuffer), 200)
+            bufsize = result.cursor_strategy._bufsize
+        eq_(bufsize, 200)
+
+    def test_buffered_row_byte_budget_yield_per(self, row_growth_fixture):
+        result = (
+            row_growth_fixture.execution_options(max_buffer_bytes=100)
+            .execute(self.table.select())
+            .yield_per(50)
+        )
+        eq_(len(result.cursor_strategy._rowbuffer), 1)
+        result.fetchone()
+        result.fetchone()
+        eq_(len(result.cursor_strategy._rowbuffer), 49)
+        eq_(result.cursor_strategy._bufsize, 50)
+
     def test_buffered_fetchmany_fixed(self, row_growth_fixture):
         """The BufferedRow cursor strategy will defer to the fetchmany
         size passed when given rather than using the buffer growth
@@ -3573,6 +3689,26 @@ class MergeCursorResultTest(fixtures.TablesTest):
         )
         result.close()
 
+    def test_ordered_merge(self, connection):
+        users = self.tables.users
+
+        r1, r2 = (
+            connection.execute(
+                users.select()
+                .where(users.c.user_id.in_(ids))
+                .order_by(users.c.user_id.desc())
+            )
+            for ids in ([7, 10, 11], [8, 9, 12])
+        )
+
+        result = r1.merge(r2, order_by=[users.c.user_id.desc()], limit=4)
+        eq_(
+            result.fetchall(),
+            [(12, "u6"), (11, "u5"), (10, "u4"), (9, "u3")],
+        )
+        for r in [r1, r2]:
+            assert r._soft_closed
+
 
 class GenerativeResultTest(fixtures.TablesTest):
     __backend__ = True
@@ -3697,3 +3833,215 @@ class GenerativeResultTest(fixtures.TablesTest):
             start += 20
 
         assert result._soft_closed
+
+    def _insert_users(self, connection, count):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                {
+                    "user_id": i,
+                    "user_name": "user %s" % i,
+                    "x": i * 5,
+                    "y": None if i % 2 else i * 20,
+                }
+                for i in range(count)
+            ],
+        )
+
+    def test_columns_batch(self, connection):
+        users = self.tables.users
+        self._insert_users(connection, 50)
+
+        result = connection.execute(select(users).order_by(users.c.user_id))
+
+        start = 0
+        for batch in result.columns_batch(20):
+            rng = range(start, min(start + 20, 50))
+            eq_(
+                batch,
+                {
+                    "user_id": list(rng),
+                    "user_name": ["user %s" % i for i in rng],
+                    "x": [i * 5 for i in rng],
+                    "y": [None if i % 2 else i * 20 for i in rng],
+                },
+            )
+            start += 20
+
+        eq_(start, 60)
+        assert result._soft_closed
+
+    def test_columns_batch_yield_per(self, connection):
+        users = self.tables.users
+        self._insert_users(connection, 50)
+
+        result = connection.execute(
+            select(users.c.user_id).order_by(users.c.user_id)
+        ).yield_per(15)
+
+        eq_(
+            [batch["user_id"] for batch in result.columns_batch()],
+            [
+                list(range(0, 15)),
+                list(range(15, 30)),
+                list(range(30, 45)),
+                list(range(45, 50)),
+            ],
+        )
+
+    def test_columns_batch_default_size(self, connection):
+        users = self.tables.users
+        self._insert_users(connection, 50)
+
+        result = connection.execute(
+            select(users.c.user_id).order_by(users.c.user_id)
+        )
+        result.cursor.arraysize = 1
+
+        with mock.patch.object(_cursor, "_DEFAULT_COLUMNS_BATCH_SIZE", 20):
+            eq_(
+                [batch["user_id"] for batch in result.columns_batch()],
+                [
+                    list(range(0, 20)),
+                    list(range(20, 40)),
+                    list(range(40, 50)),
+                ],
+            )
+
+    @testing.requires.insertmanyvalues
+    def test_columns_batch_sentinel_cols(self, connection, metadata):
+        t = Table(
+            "t",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            insert_sentinel("sentinel"),
+        )
+        metadata.create_all(connection)
+
+        result = connection.execute(
+            t.insert().returning(
+                t.c.id, t.c.data, sort_by_parameter_order=True
+            ),
+            [{"id": i, "data": "d%d" % i} for i in range(1, 6)],
+        )
+        is_true(result.context._num_sentinel_cols)
+
+        eq_(
+            result.to_columnar(),
+            {
+                "id": [1, 2, 3, 4, 5],
+                "data": ["d1", "d2", "d3", "d4", "d5"],
+            },
+        )
+
+    def test_columns_batch_columns(self, connection):
+        users = self.tables.users
+        self._insert_users(connection, 5)
+
+        result = connection.execute(select(users).order_by(users.c.user_id))
+
+        eq_(
+            result.columns("x", "user_id").to_columnar(),
+            {"x": [0, 5, 10, 15, 20], "user_id": [0, 1, 2, 3, 4]},
+        )
+
+    def test_columns_batch_processors(self, connection):
+        users = self.tables.users
+        self._insert_users(connection, 5)
+
+        class Doubled(TypeDecorator):
+            impl = Integer
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return value * 2 if value is not None else None
+
+        processed = mock.Mock(side_effect=lambda value: value)
+
+        class Tracked(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return processed(value)
+
+        result = connection.execute(
+            select(
+                type_coerce(users.c.x, Doubled).label("x"),
+                type_coerce(users.c.user_name, Tracked).label("name"),
+            ).order_by(users.c.user_id)
+        )
+
+        eq_(
+            result.to_columnar(),
+            {
+                "x": [0, 10, 20, 30, 40],
+                "name": ["user %s" % i for i in range(5)],
+            },
+        )
+        eq_(processed.call_count, 5)
+
+    def test_columns_batch_arrays(self, connection):
+        users = self.tables.users
+        self._insert_users(connection, 4)
+
+        result = connection.execute(
+            select(
+                users.c.user_id,
+                users.c.user_name,
+                users.c.y,
+                (cast(users.c.x, Float) / 2).label("half"),
+            ).order_by(users.c.user_id)
+        )
+
+        batch = result.to_columnar(arrays=True)
+        is_(type(batch["user_id"]), array.array)
+        eq_(batch["user_id"].typecode, "q")
+        eq_(batch["user_id"].tolist(), [0, 1, 2, 3])
+        is_(type(batch["half"]), array.array)
+        eq_(batch["half"].typecode, "d")
+        eq_(batch["half"].tolist(), [0.0, 2.5, 5.0, 7.5])
+
+        # NULL values and non-numeric values stay as lists
+        eq_(batch["y"], [0, None, 40, None])
+        eq_(batch["user_name"], ["user 0", "user 1", "user 2", "user 3"])
+
+    @testing.combinations(
+        ("ints", [1, 2], "q"),
+        ("floats", [1.5, 2.5], "d"),
+        ("float_then_int", [1.5, 2], None),
+        ("int_then_float", [1, 2.5], None),
+        ("int_then_null", [1, None], None),
+        ("null_then_int", [None, 1], None),
+        ("bools", [True, False], None),
+        ("int_out_of_range", [1, 2**64], None),
+        id_="iaa",
+        argnames="values, typecode",
+    )
+    def test_column_vector_arrays(self, values, typecode):
+        vector = _cursor._column_vector(list(values), True)
+        if typecode is None:
+            is_(type(vector), list)
+        else:
+            is_(type(vector), array.array)
+            eq_(vector.typecode, typecode)
+        eq_(list(vector), values)
+
+    def test_to_columnar_empty(self, connection):
+        users = self.tables.users
+
+        result = connection.execute(select(users.c.user_id, users.c.x))
+        eq_(result.to_columnar(), {"user_id": [], "x": []})
+        assert result._soft_closed
+
+    def test_columns_batch_unique(self, connection):
+        users = self.tables.users
+
+        result = connection.execute(select(users)).unique()
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Can't deliver column-oriented results when the unique",
+        ):
+            result.to_columnar()
@@ -61,6 +61,7 @@ from sqlalchemy import VARCHAR
 import sqlalchemy.dialects.mysql as mysql
 import sqlalchemy.dialects.oracle as oracle
 import sqlalchemy.dialects.postgresql as pg
+from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import default
 from sqlalchemy.schema import AddConstraint
 from sqlalchemy.schema import CheckConstraint
@@ -1013,6 +1014,214 @@ class BindProcessorInsertValuesTest(UserDefinedRoundTripTest):
         )
 
 
+class BatchProcessingTest(fixtures.TablesTest):
+    """test the process_bind_batch() and process_result_batch() hooks
+    of TypeDecorator."""
+
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class Reversed(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            calls = []
+
+            def process_bind_batch(self, values, dialect):
+                self.calls.append(("bind", list(values)))
+                return [v[::-1] if v is not None else None for v in values]
+
+            def process_result_batch(self, values, dialect):
+                self.calls.append(("result", list(values)))
+                return [v[::-1] if v is not None else None for v in values]
+
+        class RowAndBatch(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            calls = []
+
+            def process_bind_param(self, value, dialect):
+                self.calls.append(("bind_param", value))
+                return value.upper()
+
+            def process_bind_batch(self, values, dialect):
+                self.calls.append(("bind_batch", list(values)))
+                return [v.upper() for v in values]
+
+        cls.Reversed = Reversed
+        cls.RowAndBatch = RowAndBatch
+
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("reversed", Reversed),
+            Column("row_and_batch", RowAndBatch),
+        )
+
+    @testing.fixture
+    def calls(self):
+        del self.Reversed.calls[:]
+        del self.RowAndBatch.calls[:]
+        yield self.Reversed.calls
+
+    @testing.fixture
+    def data(self, connection):
+        data = self.tables.data
+        connection.execute(
+            data.insert(),
+            [
+                {"id": 1, "reversed": "one"},
+                {"id": 2, "reversed": "two"},
+                {"id": 3, "reversed": None},
+                {"id": 4, "reversed": "four"},
+                {"id": 5, "reversed": "five"},
+            ],
+        )
+        return data
+
+    def test_executemany_bind_batch(self, connection, calls):
+        data = self.tables.data
+
+        connection.execute(
+            data.insert(),
+            [
+                {"id": 1, "reversed": "one"},
+                {"id": 2, "reversed": None},
+                {"id": 3, "reversed": "three"},
+            ],
+        )
+        eq_(calls, [("bind", ["one", None, "three"])])
+
+        eq_(
+            connection.execute(
+                select(data.c.id, cast(data.c.reversed, String)).order_by(
+                    data.c.id
+                )
+            ).all(),
+            [(1, "eno"), (2, None), (3, "eerht")],
+        )
+
+    def test_execute_columnar_bind_batch(self, connection, calls):
+        data = self.tables.data
+
+        connection.execute_columnar(
+            data.insert(), {"id": [1, 2], "reversed": ["one", "two"]}
+        )
+        eq_(calls, [("bind", ["one", "two"])])
+
+        eq_(
+            connection.execute(
+                select(cast(data.c.reversed, String)).order_by(data.c.id)
+            )
+            .scalars()
+            .all(),
+            ["eno", "owt"],
+        )
+
+    def test_single_execute_bind_batch(self, connection, calls):
+        data = self.tables.data
+
+        connection.execute(data.insert(), {"id": 1, "reversed": "one"})
+        eq_(calls, [("bind", ["one"])])
+
+        eq_(
+            connection.scalar(
+                select(data.c.id).where(data.c.reversed == "one")
+            ),
+            1,
+        )
+
+    def test_bind_param_and_batch(self, connection, calls):
+        data = self.tables.data
+        row_and_batch_calls = self.RowAndBatch.calls
+
+        connection.execute(
+            data.insert(),
+            [{"id": 1, "row_and_batch": "a"}, {"id": 2, "row_and_batch": "b"}],
+        )
+        connection.execute(data.insert(), {"id": 3, "row_and_batch": "c"})
+
+        eq_(
+            row_and_batch_calls,
+            [("bind_batch", ["a", "b"]), ("bind_param", "c")],
+        )
+
+    def test_result_batch_all(self, connection, data, calls):
+        result = connection.execute(
+            select(data.c.reversed).order_by(data.c.id)
+        )
+        del calls[:]
+
+        eq_(result.scalars().all(), ["one", "two", None, "four", "five"])
+        eq_(calls, [("result", ["eno", "owt", None, "ruof", "evif"])])
+
+    def test_result_batch_yield_per(self, connection, data, calls):
+        result = connection.execution_options(yield_per=2).execute(
+            select(data.c.id, data.c.reversed).order_by(data.c.id)
+        )
+
+        # the row buffered up front is processed when the result is set up,
+        # the rest as each chunk is fetched
+        eq_(calls, [("result", ["eno"])])
+        del calls[:]
+
+        eq_(
+            [list(partition) for partition in result.partitions()],
+            [
+                [(1, "one"), (2, "two")],
+                [(3, None), (4, "four")],
+                [(5, "five")],
+            ],
+        )
+        eq_(
+            calls,
+            [
+                ("result", ["owt"]),
+                ("result", [None, "ruof"]),
+                ("result", ["evif"]),
+            ],
+        )
+
+    def test_result_batch_one_row(self, connection, data, calls):
+        result = connection.execute(
+            select(data.c.reversed, data.c.id).order_by(data.c.id)
+        )
+        del calls[:]
+
+        eq_(result.fetchone(), ("one", 1))
+        eq_(calls, [("result", ["eno"])])
+
+        eq_(next(result), ("two", 2))
+        eq_(result.fetchmany(2), [(None, 3), ("four", 4)])
+        result.close()
+
+    def test_result_batch_strategy(self, connection, data, calls):
+        result = connection.execute(select(data.c.id))
+        is_(result.cursor_strategy, _cursor._DEFAULT_FETCH)
+        result.close()
+
+        result = connection.execute(select(data.c.id, data.c.reversed))
+        is_true(
+            isinstance(
+                result.cursor_strategy,
+                _cursor._BatchProcessingCursorFetchStrategy,
+            )
+        )
+        result.close()
+
+    def test_result_batch_subset_of_columns(self, connection, data, calls):
+        result = connection.execute(
+            select(data.c.id, data.c.reversed).order_by(data.c.id)
+        )
+        eq_(
+            result.columns(data.c.reversed).scalars().all(),
+            ["one", "two", None, "four", "five"],
+        )
+
+
 class UserDefinedTest(
     _UserDefinedTypeFixture, fixtures.TablesTest, AssertsCompiledSQL
 ):
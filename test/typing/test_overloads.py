@@ -23,12 +23,14 @@ core_execution_options = {
     "no_parameters": "bool",
     "stream_results": "bool",
     "max_row_buffer": "int",
+    "max_buffer_bytes": "int",
     "yield_per": "int",
 }
 
 orm_dql_execution_options = {
     **core_execution_options,
     "populate_existing": "bool",
+    "readonly_objects": "bool",
     "autoflush": "bool",
 }
 